@@ -0,0 +1,76 @@
+"""
+Measures the audio latency of each mixer buffer size. A silent probe is played repeatedly
+and the time until the mixer reports its end is the wait for the next mixer buffer; the
+buffer queued in the audio device comes on top of it. The game polls the input once per
+frame, so a key press waits half a frame on average before the shot is played. The run
+fails if the input-to-sound latency with the default buffer exceeds MAX_INPUT_TO_SOUND_MS.
+A probe which waits longer than two buffers means the mixer didn't keep up (an underrun),
+and a probe whose end isn't reported within PROBE_TIMEOUT_MS is lost and counts as one.
+
+Run from the repository root:
+python benchmarks/bench_audio_latency.py [--trials 50]
+"""
+
+import sys
+import argparse
+
+import pygame as pg
+
+from bench_utils import use_game_code
+
+use_game_code()
+
+from audio import AudioManager  # noqa: E402
+from settings import Settings  # noqa: E402
+
+BUFFER_SIZES: tuple[int, ...] = (256, 512, 1024, 2048, 4096)
+MAX_INPUT_TO_SOUND_MS: float = 40.0
+PROBE_TIMEOUT_MS: float = 1000.0
+
+
+def measure(buffer_size: int, trials: int) -> tuple[dict[str, float], float]:
+    """Returns the latency of the given buffer size and the expected input-to-sound latency."""
+    settings = Settings()
+    settings.audio_buffer_size = buffer_size
+    audio: AudioManager = AudioManager(settings)
+    audio.load()
+    latency: dict[str, float] = audio.measure_latency(trials, PROBE_TIMEOUT_MS)
+    pg.mixer.quit()
+    return latency, 500 / settings.render_fps_limit + latency["output_ms"]
+
+
+def parse_args() -> argparse.Namespace:
+    """Parses the command line options."""
+    parser = argparse.ArgumentParser(description="Alien Invasion audio latency benchmark")
+    parser.add_argument("--trials", type=int, default=50, help="probes played with each buffer size")
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Prints the latency of each buffer size and returns the exit code."""
+    args: argparse.Namespace = parse_args()
+    pg.display.init()
+    pg.display.set_mode((1, 1))  # The mixer's end events need the display.
+    default_buffer: int = Settings().audio_buffer_size
+    failed: bool = False
+    print(f"{'buffer':>7} {'buffer ms':>10} {'mixer ms':>9} {'mixer max':>10} {'input-to-sound ms':>18}  status")
+    for buffer_size in BUFFER_SIZES:
+        latency, input_to_sound = measure(buffer_size, args.trials)
+        if not latency:
+            print("There is no audio device.")
+            return 1
+        status: str = "ok" if latency["mixer_max_ms"] <= 2*latency["buffer_ms"] else "underrun"
+        if buffer_size == default_buffer and status == "ok" and input_to_sound > MAX_INPUT_TO_SOUND_MS:
+            status = f"over {MAX_INPUT_TO_SOUND_MS:.0f} ms"
+        if latency["lost_probes"]:
+            status = f"underrun, {latency['lost_probes']:.0f} probes lost"
+        if buffer_size == default_buffer:
+            failed = status != "ok"
+            status += " (default)"
+        print(f"{buffer_size:>7} {latency['buffer_ms']:>10.1f} {latency['mixer_ms']:>9.1f} "
+              f"{latency['mixer_max_ms']:>10.1f} {input_to_sound:>18.1f}  {status}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+"""
+Compares `pygame.sprite.groupcollide()` with the SpatialHash broadphase and with the cell
+lookup of AlienFleet for fleets and bullet counts far beyond the default settings. Sprites are placed like in the game:
+aliens in a regular grid, bullets at random positions over the whole fleet area.
+
+Run from the repository root:
+python benchmarks/bench_collisions.py
+"""
+
+import random
+
+from bench_utils import use_game_code, best_time
+
+use_game_code()
+
+import pygame as pg  # noqa: E402
+from pygame.sprite import Sprite  # noqa: E402
+
+from spatial_hash import SpatialHash  # noqa: E402
+from fleet import AlienFleet  # noqa: E402
+
+FLEET_SIZES: tuple[int, ...] = (40, 160, 640, 2560)
+BULLET_COUNTS: tuple[int, ...] = (4, 32, 256)
+ALIEN_SIZE: tuple[int, int] = (65, 68)
+BULLET_SIZE: tuple[int, int] = (15, 28)
+SPACE_BETWEEN_ALIENS: int = 50
+CELL_SIZE: int = 100
+
+
+def make_sprite(x: int, y: int, size: tuple[int, int]) -> Sprite:
+    """Returns a sprite with only a rect, images are not needed for collisions."""
+    sprite = Sprite()
+    sprite.rect = pg.Rect((x, y), size)
+    return sprite
+
+
+def make_fleet(number: int) -> pg.sprite.Group:
+    """Returns a fleet with aliens placed in the rows of 40 like `_create_alien_soldier()` does."""
+    fleet = pg.sprite.Group()
+    step: int = 2*SPACE_BETWEEN_ALIENS
+    for index in range(number):
+        fleet.add(make_sprite(20 + step*(index % 40), 4*SPACE_BETWEEN_ALIENS + step*(index // 40), ALIEN_SIZE))
+    return fleet
+
+
+def make_grid_fleet(number: int) -> AlienFleet:
+    """Returns the same fleet as `make_fleet()` kept in an AlienFleet grid."""
+    fleet = AlienFleet()
+    fleet.create(lambda: make_sprite(0, 0, ALIEN_SIZE), (20.0, 4*SPACE_BETWEEN_ALIENS),
+                 number // 40, min(number, 40), 2*SPACE_BETWEEN_ALIENS, 0.0)
+    return fleet
+
+
+def make_bullets(number: int, area: pg.Rect, rng: random.Random) -> pg.sprite.Group:
+    """Returns bullets placed randomly over the given area."""
+    return pg.sprite.Group(make_sprite(rng.randint(area.left, area.right), rng.randint(area.top, area.bottom),
+                                       BULLET_SIZE) for _ in range(number))
+
+
+def main() -> None:
+    """Prints the time of one collision check between bullets and the fleet."""
+    rng = random.Random(0)
+    spatial_hash = SpatialHash(CELL_SIZE)
+    print(f"{'aliens':>7} {'bullets':>8} {'groupcollide':>14} {'spatial hash':>14} {'speedup':>8} "
+          f"{'tests/bullet':>13} {'fleet grid':>12} {'speedup':>8}")
+    for fleet_size in FLEET_SIZES:
+        fleet = make_fleet(fleet_size)
+        grid_fleet: AlienFleet = make_grid_fleet(fleet_size)
+        area: pg.Rect = pg.Rect.unionall(fleet.sprites()[0].rect, [alien.rect for alien in fleet])
+        for bullet_count in BULLET_COUNTS:
+            bullets = make_bullets(bullet_count, area, rng)
+            # Nothing is killed, so every repeat checks the same sprites.
+            expected = pg.sprite.groupcollide(bullets, fleet, False, False)
+            assert {k: set(v) for k, v in expected.items()} == \
+                {k: set(v) for k, v in spatial_hash.groupcollide(bullets, fleet, False, False).items()}
+            assert {k: len(v) for k, v in expected.items()} == \
+                {k: len(v) for k, v in grid_fleet.collide_bullets(bullets, False, False).items()}
+
+            brute: float = best_time(lambda: pg.sprite.groupcollide(bullets, fleet, False, False), number=20)
+            spatial_hash.tests = 0
+            hashed: float = best_time(lambda: spatial_hash.groupcollide(bullets, fleet, False, False), number=20)
+            tests: float = spatial_hash.tests / (5*20*bullet_count)
+            grid: float = best_time(lambda: grid_fleet.collide_bullets(bullets, False, False), number=20)
+            print(f"{fleet_size:>7} {bullet_count:>8} {brute*1e6:>11.1f} us {hashed*1e6:>11.1f} us "
+                  f"{brute / hashed:>7.2f}x {tests:>13.1f} {grid*1e6:>9.1f} us {brute / grid:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+Measures the cost of the pixel-perfect collisions. Collider's narrow test is timed directly
+on a fixed set of sprite pairs whose rects overlap, so every pair reaches the mask test:
+each bullet the scenario allows on the screen over its target (player bullets over an
+alien, the soldiers' and the generalship's bullets over the spaceship) and the spaceship
+over an alien, placed at seeded random offsets. That is the worst case of a step, in the game most bullets don't
+overlap anything. The set is tested with the masks of Settings and with the rects only, and
+the extra time is compared with the time of one simulation step (1/FPS s, the real time
+the game has for it). The run fails if the masks cost more than MAX_STEP_FRACTION of it in
+any scenario, e.g. if the masks were built on every test. The fraction of the scenario's
+measured mean step (headless) is printed as well.
+
+Run from the repository root:
+python benchmarks/bench_mask_collisions.py [--frames 2000]
+"""
+
+import sys
+import random
+import argparse
+from time import perf_counter
+
+from bench_utils import use_game_code, best_time
+from scenarios import SCENARIOS, Scenario
+
+use_game_code()
+
+from pygame.sprite import Sprite  # noqa: E402
+
+from alien_invasion import AlienInvasion  # noqa: E402
+from asset_cache import assets  # noqa: E402
+from alien import AlienSoldier  # noqa: E402
+from bullet import PlayerBullet, AlienSoldierBullet, AlienGeneralBullet  # noqa: E402
+from collision import Collider  # noqa: E402
+from settings import Settings  # noqa: E402
+from spaceship import Spaceship  # noqa: E402
+
+SEED: int = 2022
+MAX_STEP_FRACTION: float = 0.05
+MEASURED_SCENARIOS: tuple[str, ...] = ("level1_hard", "bullet_storm", "large_fleet", "final_fight")
+
+
+def create_game(scenario: Scenario) -> AlienInvasion:
+    """Returns a headless game of the scenario with the default collision settings."""
+    settings = Settings()
+    settings.headless = True
+    settings.seed = SEED
+    scenario.prepare(settings)
+    return AlienInvasion(settings)
+
+
+def measure_step(ai_game: AlienInvasion, scenario: Scenario, frames: int) -> float:
+    """Returns the mean simulation step of the scenario in milliseconds."""
+    start: float = perf_counter()
+    ai_game.run_headless(frames, scenario.drive)
+    return (perf_counter() - start)*1000 / frames
+
+
+def make_sprite(image_path: str, collision_type: str) -> Sprite:
+    """Returns a sprite with the entity type's image and collision type."""
+    sprite = Sprite()
+    sprite.image = assets.get_image(image_path)
+    sprite.rect = sprite.image.get_rect()
+    sprite.collision_type = collision_type  # type: ignore
+    return sprite
+
+
+def overlap(sprite: Sprite, target: Sprite, rng: random.Random) -> tuple[Sprite, Sprite]:
+    """Moves the sprite to a random position where its rect overlaps the target's rect."""
+    sprite.rect.x = target.rect.x + rng.randint(1 - sprite.rect.width, target.rect.width - 1)  # type: ignore
+    sprite.rect.y = target.rect.y + rng.randint(1 - sprite.rect.height, target.rect.height - 1)  # type: ignore
+    return sprite, target
+
+
+def make_pairs(settings: Settings) -> list[tuple[Sprite, Sprite]]:
+    """
+    Returns the overlapping pairs of a step with all bullets allowed by the settings over
+    their targets, the generalship's bullets included.
+    """
+    rng: random.Random = random.Random(SEED)
+    alien_path: str = f"../assets/aliens_ships/{AlienSoldier._IMGS[settings.alien_ship_model - 1]}"
+
+    def alien() -> Sprite:
+        return make_sprite(alien_path, AlienSoldier.collision_type)
+
+    ship: Sprite = make_sprite(Spaceship._NORMAL_SHIP, Spaceship.collision_type)
+    pairs: list[tuple[Sprite, Sprite]] = [overlap(alien(), ship, rng)]
+    pairs += [overlap(make_sprite(PlayerBullet._IMG, PlayerBullet.collision_type), alien(), rng)
+              for _ in range(settings.player_allowed_bullets)]
+    pairs += [overlap(make_sprite(AlienSoldierBullet._IMG, AlienSoldierBullet.collision_type), ship, rng)
+              for _ in range(settings.alien_allowed_bullets)]
+    pairs += [overlap(make_sprite(AlienGeneralBullet._IMG, AlienGeneralBullet.collision_type), ship, rng)
+              for _ in range(settings.alien_general_allowed_bullets)]
+    return pairs
+
+
+def measure_pairs(collider: Collider, pairs: list[tuple[Sprite, Sprite]]) -> tuple[float, int]:
+    """Returns the time of testing all pairs once in milliseconds and the number of hits."""
+    def test_all() -> int:
+        return sum(collider.collide(sprite_a, sprite_b) for sprite_a, sprite_b in pairs)
+    return best_time(test_all, number=2000)*1000, test_all()
+
+
+def parse_args() -> argparse.Namespace:
+    """Parses the command line options."""
+    parser = argparse.ArgumentParser(description="Alien Invasion mask collisions benchmark")
+    parser.add_argument("--frames", type=int, default=2000, help="frames measuring the simulation step")
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Prints the cost of the masks on the overlapping pairs and returns the exit code."""
+    args: argparse.Namespace = parse_args()
+    failed: bool = False
+    print(f"{'scenario':<16} {'pairs':>6} {'mask hits':>10} {'rects ms':>9} {'masks ms':>9} "
+          f"{'step ms':>8} {'of step':>8} {'of 1/FPS':>9}  status")
+    for scenario in SCENARIOS:
+        if scenario.name not in MEASURED_SCENARIOS:
+            continue
+        ai_game: AlienInvasion = create_game(scenario)
+        step_ms: float = measure_step(ai_game, scenario, args.frames)
+        rects_settings = Settings()
+        rects_settings.ship_mask_collisions = rects_settings.alien_mask_collisions = False
+        rects_settings.bullet_mask_collisions = False
+        rects_collider: Collider = Collider(rects_settings, ai_game.collider.masks)
+        pairs: list[tuple[Sprite, Sprite]] = make_pairs(ai_game.settings)
+        rects_ms, _ = measure_pairs(rects_collider, pairs)
+        masks_ms, hits = measure_pairs(ai_game.collider, pairs)
+        extra_ms: float = max(masks_ms - rects_ms, 0.0)
+        fraction: float = extra_ms*ai_game.settings.FPS / 1000
+        status: str = "ok" if fraction <= MAX_STEP_FRACTION else f"over {MAX_STEP_FRACTION:.0%}"
+        failed = failed or status != "ok"
+        print(f"{scenario.name:<16} {len(pairs):>6} {hits:>10} {rects_ms:>9.4f} {masks_ms:>9.4f} "
+              f"{step_ms:>8.4f} {extra_ms / step_ms:>8.1%} {fraction:>9.2%}  {status}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+"""
+Measures the memory of the game entities with tracemalloc: the bytes per instance
+of each sprite class and the heap used by a maxed-out fleet with a full bullet load
+(the fleet of the `large_fleet` scenario and 200 bullets of each kind). The baseline
+is a plain `pygame.sprite.Sprite` subclass with the same attributes in its `__dict__`,
+the bullets' direction included, as each entity kept them before CompactSprite.
+
+Run from the repository root:
+python benchmarks/bench_memory.py
+"""
+
+import tracemalloc
+
+import pygame as pg
+
+from bench_utils import use_game_code
+
+use_game_code()
+
+from alien_invasion import AlienInvasion  # noqa: E402
+from alien import AlienSoldier, AlienGeneral  # noqa: E402
+from bullet import PlayerBullet, AlienSoldierBullet, AlienGeneralBullet  # noqa: E402
+from spaceship import Spaceship  # noqa: E402
+from star import Star  # noqa: E402
+from settings import Settings  # noqa: E402
+
+INSTANCES: int = 2000
+BULLETS_PER_KIND: int = 200
+# The attributes kept at the class level by the entity classes.
+SHARED_ATTRIBUTES: tuple[str, ...] = ("direction",)
+
+
+class PlainSprite(pg.sprite.Sprite):
+    """PlainSprite object holds an entity's attributes in its `__dict__`, the baseline of the measurements."""
+
+
+# A PlainSprite subclass for each entity class, so the instances of each share their dict keys like the classes did.
+_plain_classes: dict[type, type] = {}
+
+
+def plain_copy(entity) -> PlainSprite:
+    """Returns a PlainSprite with the entity's attributes, the set slots and the class-level ones."""
+    plain_class: type = _plain_classes.setdefault(type(entity), type(f"Plain{type(entity).__name__}", (PlainSprite,), {}))
+    sprite: PlainSprite = plain_class()
+    names: list[str] = [name for cls in type(entity).__mro__ for name in cls.__dict__.get("__slots__", ())]
+    # `sprite.__dict__` isn't read, it would turn the instance's inline attribute values into a separate dict.
+    for name in dict.fromkeys(names + list(SHARED_ATTRIBUTES)):
+        if name != "_groups" and hasattr(entity, name):
+            setattr(sprite, name, getattr(entity, name))
+    return sprite
+
+
+def create_game() -> AlienInvasion:
+    """Returns a headless game with a dense fleet, room for many bullets and an alien general."""
+    settings = Settings()
+    settings.headless = True
+    settings.seed = 0
+    settings.space_between_aliens = 30
+    settings.additional_alien_in_row = 12
+    settings.player_allowed_bullets = BULLETS_PER_KIND
+    settings.alien_allowed_bullets = BULLETS_PER_KIND
+    settings.alien_general_allowed_bullets = BULLETS_PER_KIND
+    ai_game = AlienInvasion(settings)
+    ai_game.start_game()
+    ai_game.alien_general_ship = AlienGeneral(ai_game)
+    return ai_game
+
+
+def bytes_per_instance(factory) -> float:
+    """Returns the average number of bytes allocated for one object created by `factory()`."""
+    tracemalloc.start()
+    before: int = tracemalloc.get_traced_memory()[0]
+    objects: list = [factory() for _ in range(INSTANCES)]
+    after: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    # The list itself holds one pointer per object.
+    return (after - before) / INSTANCES - 8
+
+
+def load_heap(ai_game: AlienInvasion) -> tuple[int, int]:
+    """Returns the number of entities and the bytes used by the fleet and full bullet groups."""
+    ai_game.alien_soldier_ships.empty()
+    tracemalloc.start()
+    before: int = tracemalloc.get_traced_memory()[0]
+    ai_game._create_alien_soldiers_fleet()
+    for _ in range(BULLETS_PER_KIND):
+        ai_game.player_bullets.add(PlayerBullet(ai_game))
+        ai_game.alien_soldier_bullets.add(AlienSoldierBullet(ai_game))
+        ai_game.alien_general_bullets.add(AlienGeneralBullet(ai_game))
+    after: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    entities: int = len(ai_game.alien_soldier_ships) + 3*BULLETS_PER_KIND
+    return entities, after - before
+
+
+def load_plain_heap(ai_game: AlienInvasion, aliens: int) -> int:
+    """Returns the bytes used by the same entities as PlainSprite objects in pygame's groups."""
+    tracemalloc.start()
+    before: int = tracemalloc.get_traced_memory()[0]
+    groups: list[pg.sprite.Group] = [
+        pg.sprite.Group(plain_copy(AlienSoldier(ai_game)) for _ in range(aliens)),
+        pg.sprite.Group(plain_copy(PlayerBullet(ai_game)) for _ in range(BULLETS_PER_KIND)),
+        pg.sprite.Group(plain_copy(AlienSoldierBullet(ai_game)) for _ in range(BULLETS_PER_KIND)),
+        pg.sprite.Group(plain_copy(AlienGeneralBullet(ai_game)) for _ in range(BULLETS_PER_KIND)),
+    ]
+    after: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del groups
+    return after - before
+
+
+def main() -> None:
+    """Prints the bytes per entity of each sprite class and the heap of the full load, with the baseline."""
+    ai_game: AlienInvasion = create_game()
+    factories: dict[str, object] = {
+        "AlienSoldier": lambda: AlienSoldier(ai_game),
+        "PlayerBullet": lambda: PlayerBullet(ai_game),
+        "AlienSoldierBullet": lambda: AlienSoldierBullet(ai_game),
+        "AlienGeneralBullet": lambda: AlienGeneralBullet(ai_game),
+        "Star": lambda: Star(ai_game),
+        "Spaceship": lambda: Spaceship(ai_game),
+    }
+    print(f"{'entity':<20} {'plain B':>8} {'compact B':>10} {'saved':>6}")
+    for name, factory in factories.items():
+        plain: float = bytes_per_instance(lambda: plain_copy(factory()))  # type: ignore
+        compact: float = bytes_per_instance(factory)
+        print(f"{name:<20} {plain:>8.0f} {compact:>10.0f} {1 - compact / plain:>6.0%}")
+
+    entities, heap = load_heap(ai_game)
+    plain_heap: int = load_plain_heap(ai_game, entities - 3*BULLETS_PER_KIND)
+    print(f"\nFull load: {entities} entities")
+    print(f"  plain:   {plain_heap / 1024:>6.1f} KiB ({plain_heap / entities:.0f} B/entity)")
+    print(f"  compact: {heap / 1024:>6.1f} KiB ({heap / entities:.0f} B/entity), {1 - heap / plain_heap:.0%} saved")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Measures the launch time of the game: each run starts `main.py --headless --startup-report`
+in a new interpreter, which imports the game, initialises it, renders the first frame and
+exits. Cold launches start with an empty bytecode cache, so every module is compiled like
+on the first launch after an installation; warm launches reuse the cache filled before.
+The run fails if the median warm launch takes longer than STARTUP_BUDGET_MS.
+
+Run from the repository root:
+python benchmarks/bench_startup.py [--runs 5]
+"""
+
+import os
+import re
+import sys
+import argparse
+import subprocess
+import tempfile
+from statistics import median
+from time import perf_counter
+
+from bench_utils import CODE_DIR
+
+STARTUP_BUDGET_MS: float = 1000.0
+
+
+def launch(pycache_prefix: str) -> dict:
+    """Launches the game once and returns the process time, the imports' time and the time to the first frame."""
+    env: dict[str, str] = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy",
+                               PYGAME_HIDE_SUPPORT_PROMPT="1", PYTHONPYCACHEPREFIX=pycache_prefix)
+    # The launches must fill and reuse the bytecode cache.
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    start: float = perf_counter()
+    result = subprocess.run([sys.executable, "main.py", "--headless", "--startup-report"], cwd=CODE_DIR, env=env,
+                            capture_output=True, text=True, check=True)
+    elapsed: float = perf_counter() - start
+    imports_ms: float = float(re.search(r"Imports: ([\d.]+) ms", result.stdout).group(1))  # type: ignore
+    first_frame_ms: float = float(re.search(r"first_frame\s+([\d.]+)", result.stdout).group(1))  # type: ignore
+    return {"process_ms": elapsed*1000, "imports_ms": imports_ms, "first_frame_ms": imports_ms + first_frame_ms}
+
+
+def measure(runs: int, cold: bool) -> dict:
+    """Returns the median times of the given number of cold or warm launches."""
+    results: list[dict] = []
+    with tempfile.TemporaryDirectory() as cache_dir:
+        if not cold:
+            launch(cache_dir)  # Fills the bytecode cache.
+        for run in range(runs):
+            if cold:
+                results.append(launch(os.path.join(cache_dir, str(run))))
+            else:
+                results.append(launch(cache_dir))
+    return {key: median(result[key] for result in results) for key in results[0]}
+
+
+def parse_args() -> argparse.Namespace:
+    """Parses the command line options."""
+    parser = argparse.ArgumentParser(description="Alien Invasion startup benchmark")
+    parser.add_argument("--runs", type=int, default=5, help="launches of each kind")
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Prints the median cold and warm launch times and returns the exit code."""
+    args: argparse.Namespace = parse_args()
+    print(f"{'launch':<8} {'process ms':>11} {'imports ms':>11} {'first frame ms':>15}  status")
+    failed: bool = False
+    for kind in ("cold", "warm"):
+        times: dict = measure(args.runs, cold=kind == "cold")
+        status: str = "-"
+        if kind == "warm":
+            status = "ok" if times["first_frame_ms"] <= STARTUP_BUDGET_MS else f"over {STARTUP_BUDGET_MS:.0f} ms"
+            failed = status != "ok"
+        print(f"{kind:<8} {times['process_ms']:>11.1f} {times['imports_ms']:>11.1f} "
+              f"{times['first_frame_ms']:>15.1f}  {status}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
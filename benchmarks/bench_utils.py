@@ -0,0 +1,32 @@
+"""
+Helpers shared by the benchmarks. The game modules live in the `code` directory
+and load assets with paths relative to it, so each benchmark imports and runs
+the game from there. Benchmarks never open a window or initialise the audio.
+"""
+
+import os
+import sys
+from pathlib import Path
+from time import perf_counter
+
+CODE_DIR: Path = Path(__file__).resolve().parent.parent / "code"
+
+
+def use_game_code() -> None:
+    """Makes the game modules importable and switches to the `code` directory."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    if str(CODE_DIR) not in sys.path:
+        sys.path.insert(0, str(CODE_DIR))
+    os.chdir(CODE_DIR)
+
+
+def best_time(function, repeats: int = 5, number: int = 1) -> float:
+    """Returns the best time in seconds of a single `function()` call out of `repeats` runs."""
+    best: float = float("inf")
+    for _ in range(repeats):
+        start: float = perf_counter()
+        for _ in range(number):
+            function()
+        best = min(best, (perf_counter() - start) / number)
+    return best
@@ -0,0 +1,82 @@
+"""
+Checks that the leaderboard saves a game lost by the player. A headless game with a
+leaderboard in a temporary file is started, and the spaceship only fires from the centre,
+so it scores some points before the fleet reaches it and the last life is lost. The player
+then leaves the game with `r` during the respawn delay, which mustn't save it again. Then
+the database is opened again and the run must be read back once with the final score and level.
+
+Run from the repository root:
+python benchmarks/check_score_store.py [--frames 60000]
+"""
+
+import os
+import sys
+import argparse
+import tempfile
+
+import pygame as pg
+
+from bench_utils import use_game_code
+
+use_game_code()
+
+from alien_invasion import AlienInvasion  # noqa: E402
+from game_state import GameState  # noqa: E402
+from score_store import ScoreStore  # noqa: E402
+from settings import Settings  # noqa: E402
+
+SEED: int = 2022
+
+
+def play_to_game_over(path: str, frames: int) -> AlienInvasion | None:
+    """Plays a headless game saved to the given database until it's over. Returns None if it doesn't end."""
+    settings = Settings()
+    settings.headless = True
+    settings.seed = SEED
+    ai_game: AlienInvasion = AlienInvasion(settings)
+    ai_game.attach_score_store(ScoreStore(path))
+    ai_game.start_game()
+    for frame in range(frames):
+        if frame % 20 == 0:
+            pg.event.post(pg.event.Event(pg.KEYDOWN, key=pg.K_SPACE))
+        ai_game.run_headless(1)
+        if ai_game.game_state.game_over:
+            pg.event.post(pg.event.Event(pg.KEYDOWN, key=pg.K_r))
+        if ai_game.game_state.state is GameState.MENU:
+            ai_game.scores.close()  # type: ignore
+            return ai_game
+    return None
+
+
+def parse_args() -> argparse.Namespace:
+    """Parses the command line options."""
+    parser = argparse.ArgumentParser(description="Alien Invasion leaderboard check")
+    parser.add_argument("--frames", type=int, default=60_000, help="the longest game played")
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Prints the saved run and returns the exit code."""
+    args: argparse.Namespace = parse_args()
+    with tempfile.TemporaryDirectory() as directory:
+        path: str = os.path.join(directory, "scores.sqlite3")
+        ai_game: AlienInvasion | None = play_to_game_over(path, args.frames)
+        if ai_game is None:
+            print(f"The game didn't end in {args.frames} frames.")
+            return 1
+        scores: ScoreStore = ScoreStore(path)
+        scores.close()
+        difficulty: int = ai_game.settings.difficulty
+        top: list[tuple[int, int, float]] = scores.top_scores(difficulty)
+        summary: dict[str, float] = scores.summary(difficulty)
+    print(f"Saved runs: {summary['runs']:.0f}, best (score, level, duration): {top[0] if top else None}")
+    expected: tuple[int, int] = (ai_game.stats.current_score, ai_game.stats.current_level)
+    if scores.error is not None or summary["runs"] != 1 or not top or top[0][:2] != expected:
+        print(f"failed, expected one run with (score, level) {expected}")
+        return 1
+    print("ok")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,158 @@
+"""
+Runs the game headlessly through the scenarios from `scenarios.py` and reports frames
+per second, per-phase timings and bytes allocated per frame. The results are compared
+with the stored baselines (`baselines.json`), and the run fails if any scenario is slower
+or allocates more than the baseline allows. Baselines depend on the machine, so they
+should be refreshed with `--update-baselines` when the benchmark machine changes.
+
+Run from the repository root:
+python benchmarks/run_benchmarks.py [--frames 3000] [--render] [--update-baselines]
+"""
+
+import sys
+import json
+import argparse
+import tracemalloc
+from pathlib import Path
+from time import perf_counter
+
+from bench_utils import use_game_code
+from scenarios import SCENARIOS, Scenario
+
+use_game_code()
+
+from alien_invasion import AlienInvasion  # noqa: E402
+from settings import Settings  # noqa: E402
+
+BASELINES_PATH: Path = Path(__file__).resolve().parent / "baselines.json"
+SEED: int = 2022
+# Allocations of a few hundred bytes per frame are noise (e.g. event objects), not a regression.
+ALLOCATION_SLACK: int = 512
+
+
+def create_game(scenario: Scenario) -> AlienInvasion:
+    """Returns a headless game with the profiler enabled and the scenario's settings."""
+    settings = Settings()
+    settings.headless = True
+    settings.profiling = True
+    settings.profiler_overlay = False
+    settings.profile_output = ""  # Don't dump the profile on exit.
+    settings.seed = SEED
+    scenario.prepare(settings)
+    return AlienInvasion(settings)
+
+
+def measure_speed(scenario: Scenario, frames: int, render: bool) -> dict:
+    """Returns frames per second, p50/p99 frame time, the average time of each phase and the fraction of fighting."""
+    ai_game: AlienInvasion = create_game(scenario)
+    fighting_frames: int = 0
+
+    def on_frame(game: AlienInvasion, frame: int) -> None:
+        nonlocal fighting_frames
+        fighting_frames += game.game_state.fighting
+        scenario.drive(game, frame)
+
+    start: float = perf_counter()
+    ai_game.run_headless(frames, on_frame, render)
+    elapsed: float = perf_counter() - start
+
+    summary: dict = ai_game.profiler.summary()
+    return {
+        "fps": frames / elapsed,
+        "p50_ms": summary["p50_ms"],
+        "p99_ms": summary["p99_ms"],
+        "phases_ms": summary["phases_ms"],
+        "fighting": fighting_frames / frames,
+    }
+
+
+def measure_allocations(scenario: Scenario, frames: int, render: bool) -> float:
+    """
+    Returns the average number of bytes allocated during a frame. It's the peak of traced
+    memory in the frame above the memory in use at its start, so short-lived objects count too.
+    """
+    ai_game: AlienInvasion = create_game(scenario)
+    ai_game.profiler.enabled = False
+    allocated: list[int] = []
+    frame_start_memory: int = 0
+
+    def on_frame(game: AlienInvasion, frame: int) -> None:
+        nonlocal frame_start_memory
+        current, peak = tracemalloc.get_traced_memory()
+        if frame > 0:
+            allocated.append(peak - frame_start_memory)
+        scenario.drive(game, frame)
+        tracemalloc.reset_peak()
+        frame_start_memory = tracemalloc.get_traced_memory()[0]
+
+    tracemalloc.start()
+    ai_game.run_headless(frames, on_frame, render)
+    tracemalloc.stop()
+    return sum(allocated) / max(len(allocated), 1)
+
+
+def check_regression(scenario: Scenario, result: dict, baseline: dict | None, tolerance: float) -> str:
+    """Returns 'ok', 'new' (no baseline) or the description of the regression or of the broken scenario."""
+    problems: list[str] = []
+    if result["fighting"] < scenario.min_fighting:
+        problems.append(f"fighting {result['fighting']:.0%} < {scenario.min_fighting:.0%}")
+    if baseline is None:
+        return "; ".join(problems) if problems else "new"
+    if result["fps"] < baseline["fps"]*(1 - tolerance):
+        problems.append(f"fps {result['fps']:.0f} < {baseline['fps']:.0f}")
+    if result["alloc_bytes_per_frame"] > baseline["alloc_bytes_per_frame"]*(1 + tolerance) + ALLOCATION_SLACK:
+        problems.append(f"alloc {result['alloc_bytes_per_frame']:.0f} B > {baseline['alloc_bytes_per_frame']:.0f} B")
+    return "; ".join(problems) if problems else "ok"
+
+
+def parse_args() -> argparse.Namespace:
+    """Parses the command line options."""
+    parser = argparse.ArgumentParser(description="Alien Invasion benchmarks")
+    parser.add_argument("--frames", type=int, default=3000, help="frames per scenario")
+    parser.add_argument("--render", action="store_true", help="draw each frame on the offscreen display")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative regression")
+    parser.add_argument("--update-baselines", action="store_true", help="store the results as new baselines")
+    parser.add_argument("--only", nargs="*", default=None, help="names of scenarios to run")
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Runs the scenarios, prints the report and returns the exit code."""
+    args: argparse.Namespace = parse_args()
+    baselines: dict = json.loads(BASELINES_PATH.read_text()) if BASELINES_PATH.exists() else {}
+    results: dict[str, dict] = {}
+    failed: bool = False
+
+    print(f"{'scenario':<22} {'fps':>8} {'p50 ms':>7} {'p99 ms':>7} {'stars':>6} {'bullets':>7} "
+          f"{'collis.':>7} {'aliens':>6} {'draw':>6} {'B/frame':>8} {'fight':>6}  status")
+    for scenario in SCENARIOS:
+        if args.only and scenario.name not in args.only:
+            continue
+        key: str = f"{scenario.name}+render" if args.render else scenario.name
+        result: dict = measure_speed(scenario, args.frames, args.render)
+        result["alloc_bytes_per_frame"] = measure_allocations(scenario, args.frames // 4, args.render)
+        results[key] = result
+
+        status: str = check_regression(scenario, result, baselines.get(key), args.tolerance)
+        failed = failed or status not in ("ok", "new")
+        phases: dict[str, float] = result["phases_ms"]
+        print(f"{key:<22} {result['fps']:>8.0f} {result['p50_ms']:>7.2f} {result['p99_ms']:>7.2f} "
+              f"{phases['stars']:>6.3f} {phases['bullets']:>7.3f} {phases['collisions']:>7.3f} "
+              f"{phases['aliens']:>6.3f} {phases['draw']:>6.3f} {result['alloc_bytes_per_frame']:>8.0f} {result['fighting']:>6.0%}  {status}")
+
+    if args.update_baselines:
+        for key, result in results.items():
+            baselines[key] = {"fps": round(result["fps"]),
+                              "alloc_bytes_per_frame": round(result["alloc_bytes_per_frame"])}
+        BASELINES_PATH.write_text(json.dumps(baselines, indent=4, sort_keys=True) + "\n")
+        print(f"Baselines written to {BASELINES_PATH}.")
+        return 0
+
+    if failed:
+        print("Performance regression detected.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+"""
+Reproducible scenarios for the benchmark suite. Each scenario adjusts the settings,
+optionally starts the game, and drives the player with a scripted input posted as
+pygame events, so the event handling is measured too.
+"""
+
+import pygame as pg
+
+from bench_utils import use_game_code
+
+use_game_code()
+
+from game_state import GameState  # noqa: E402
+
+
+class Scenario():
+    """Scenario object describes one benchmark workload."""
+
+    def __init__(self, name: str, configure=None, start: bool = True, fire_every: int = 8,
+                 min_fighting: float = 0.0) -> None:
+        """
+        Initialise Scenario object.
+
+        Parameters
+        ----------
+        name : `str`
+            The name used in the report and in the baselines' file.
+        configure : `Callable[[Settings], None]`, optional
+            Adjusts the settings before the game is created.
+        start : `bool`, default=True
+            Starts the game; otherwise, the game stays in the menu.
+        fire_every : `int`, default=8
+            The scripted player fires every `fire_every` frames (0 means never).
+        min_fighting : `float`, default=0.0
+            The smallest fraction of frames in a fight (not in the respawn delay or the menu),
+            so the scenario measures the workload it describes.
+        """
+        self.name: str = name
+        self.configure = configure
+        self.start: bool = start
+        self.fire_every: int = fire_every
+        self.min_fighting: float = min_fighting
+
+    def prepare(self, settings) -> None:
+        """Adjusts the settings for this scenario."""
+        if self.configure is not None:
+            self.configure(settings)
+
+    def drive(self, ai_game, frame: int) -> None:
+        """Posts the scripted input for the given frame and restarts the game after it ends."""
+        if not self.start:
+            return
+        if ai_game.game_state.state is GameState.COMPLETE:
+            pg.event.post(pg.event.Event(pg.KEYDOWN, key=pg.K_ESCAPE))
+        elif ai_game.game_state.state is GameState.MENU:
+            ai_game.start_game()
+        # The player sweeps the screen from side to side.
+        if frame % 240 == 0:
+            pg.event.post(pg.event.Event(pg.KEYUP, key=pg.K_LEFT))
+            pg.event.post(pg.event.Event(pg.KEYDOWN, key=pg.K_RIGHT))
+        elif frame % 240 == 120:
+            pg.event.post(pg.event.Event(pg.KEYUP, key=pg.K_RIGHT))
+            pg.event.post(pg.event.Event(pg.KEYDOWN, key=pg.K_LEFT))
+        if self.fire_every and frame % self.fire_every == 0:
+            pg.event.post(pg.event.Event(pg.KEYDOWN, key=pg.K_SPACE))
+
+
+def _difficulty(mode: int):
+    """Returns a function switching the settings to the given difficulty mode."""
+    def configure(settings) -> None:
+        settings.switch_difficulty(mode)
+    return configure
+
+
+def _bullet_storm(settings) -> None:
+    """Lets both sides keep many bullets on the screen at once."""
+    settings.player_allowed_bullets = 40
+    settings.alien_allowed_bullets = 40
+
+
+def _large_fleet(settings) -> None:
+    """
+    Packs the fleet densely on a larger screen, several times more aliens than in the hard mode.
+    The rows grow with the screen's height, and the fleet leaves room to move sideways, so it
+    doesn't drop on each step.
+    """
+    settings.screen_width = 1920
+    settings.screen_height = 1080
+    settings.space_between_aliens = 30
+    settings.additional_alien_in_row = 8
+
+
+def _final_fight(settings) -> None:
+    """Starts directly with the AlienGeneral fight."""
+    settings.final_level = 1
+
+
+SCENARIOS: tuple[Scenario, ...] = (
+    Scenario("idle_menu", start=False),
+    Scenario("level1_easy", _difficulty(1)),
+    Scenario("level1_medium", _difficulty(2)),
+    Scenario("level1_hard", _difficulty(3)),
+    Scenario("bullet_storm", _bullet_storm, fire_every=1),
+    Scenario("large_fleet", _large_fleet, min_fighting=0.8),
+    Scenario("final_fight", _final_fight, fire_every=4),
+)
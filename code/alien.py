@@ -2,32 +2,36 @@
 This module provides AlienSoldier and AlienGeneral objects. AlienSoldier objects 
 are usual enemies in the game. AlienGeneral is the final enemy. Both objects 
 inherit from the Alien class, which is the abstract base class. The Alien inherits 
-from Sprite.
+from CompactSprite, which keeps the aliens' state in slots.
 """
 
 from abc import ABCMeta, abstractmethod
 
 import pygame as pg
-from pygame.sprite import Sprite
 from pygame.surface import Surface
 from pygame.rect import Rect
 
+from asset_cache import assets
+from compact_sprite import CompactSprite
+from game_loop import interpolate
+from render_batch import RenderBatch
 
-class Alien(Sprite, metaclass=ABCMeta):
+
+class Alien(CompactSprite, metaclass=ABCMeta):
     """The Alien class provide an abstract base class for AlienSoldier and AlienGeneral."""
 
+    # The game's settings and screen rect are referenced by each alien, so two games in one process don't mix them.
+    __slots__ = ("settings", "screen_rect", "image", "rect")
+    collision_type: str = "alien"  # Chooses the collision test in Settings.
+
     @abstractmethod
-    def __init__(self, ai_game, img, speed) -> None:
+    def __init__(self, ai_game, img) -> None:
         """Initialise the Alien base."""
         super().__init__()
-        self.screen = ai_game.screen
+        self.settings = ai_game.settings
         self.screen_rect: Rect = ai_game.screen_rect
-        self.image: Surface = pg.image.load(img).convert_alpha()
+        self.image: Surface = assets.get_image(img)
         self.rect: Rect = self.image.get_rect()
-        # The alien's speed is constant on each next gameplay level, so one can pass it in the `__init__()` method.
-        self.speed: float = speed
-        # Float type for the horizontal position due to more accurate tracking.
-        self.x: float
 
     def check_left_right_screen_edge(self) -> bool:
         """
@@ -40,23 +44,22 @@ class Alien(Sprite, metaclass=ABCMeta):
 
 
 class AlienSoldier(Alien):
-    """AlienSoldier provides an ordinary alien ship object, which depends on the game's difficulty mode."""
+    """
+    AlienSoldier provides an ordinary alien ship object, which depends on the game's difficulty mode.
+    The soldiers are moved by their AlienFleet, which also sets their rects.
+    """
 
+    __slots__ = ()
     _IMGS: tuple[str, ...] = ("perseus_arm_alien.png", "outer_arm_alien.png", "norma_arm_alien.png")
 
     def __init__(self, ai_game) -> None:
         """Initialise AlienSoldier object."""
-        self.settings = ai_game.settings
-        ship_model: int = self.settings.alien_ship_model
-        img: str = f"../assets/aliens_ships/{self._IMGS[ship_model-1]}"
-        speed: float = self.settings.alien_ship_speed
-        super().__init__(ai_game, img, speed)
-        self.x: float = float(self.rect.x)
+        ship_model: int = ai_game.settings.alien_ship_model
+        super().__init__(ai_game, f"../assets/aliens_ships/{self._IMGS[ship_model-1]}")
 
-    def update(self, *args, **kwargs) -> None:  # Override the Sprite.update()
-        """Updates the alien ship's x-position by speed defined in settings."""
-        self.x += self.settings.alien_moving_direction*self.speed
-        self.rect.x = int(self.x)
+    def last_shift(self) -> tuple[float, float]:
+        """Returns the alien ship's shift in the last simulation step (the fleet moves at the level's speed)."""
+        return self.settings.alien_moving_direction*self.settings.alien_ship_speed, 0.0
 
 
 class AlienGeneral(Alien):
@@ -65,18 +68,18 @@ class AlienGeneral(Alien):
     This alien ship has a dedicated life bar.
     """
 
+    __slots__ = ("screen", "x", "life_points", "life_bar_color", "life_bar_outline_color", "life_bar_rect")
     _IMGS: tuple[str, ...] = ("perseus_arm_general.png", "outer_arm_general.png", "norma_arm_general.png")
 
     def __init__(self, ai_game) -> None:
         """Initialise AlienGeneral object."""
-        self.settings = ai_game.settings
-        ship_model: int = self.settings.alien_general_ship_model
-        img: str = f"../assets/aliens_ships/{self._IMGS[ship_model-1]}"
-        speed: float = self.settings.alien_general_ship_speed
-        super().__init__(ai_game, img, speed)
+        ship_model: int = ai_game.settings.alien_general_ship_model
+        super().__init__(ai_game, f"../assets/aliens_ships/{self._IMGS[ship_model-1]}")
+        self.screen: Surface = ai_game.screen
 
         self.rect.centerx = self.screen_rect.centerx
         self.rect.centery = self.settings.screen_height // 3
+        # Float type for the horizontal position due to more accurate tracking.
         self.x: float = float(self.rect.x)
 
         self.life_points: int = self.settings.alien_general_life_points
@@ -107,8 +110,21 @@ class AlienGeneral(Alien):
         self.life_bar_rect.centerx = self.rect.centerx
         self.life_bar_rect.y = self.rect.top - 20
 
-    def draw(self) -> None:
-        """Displays aliens' generalship and its life bar on the screen."""
-        self.screen.blit(self.image, self.rect)
-        pg.draw.rect(self.screen, self.life_bar_color, self.life_bar_rect)
-        pg.draw.rect(self.screen, self.life_bar_outline_color, self.life_bar_rect, 2)  # 2 means width of the outline.
+    def last_shift(self) -> tuple[float, float]:
+        """Returns the generalship's shift in the last simulation step."""
+        return self.settings.alien_moving_direction*self.settings.alien_general_ship_speed, 0.0
+
+    def draw(self, batch: RenderBatch, alpha: float = 1.0) -> None:
+        """
+        Adds aliens' generalship to the render batch. The position is interpolated between
+        the last two simulation steps by `alpha` (1.0 means the current position).
+        """
+        batch.add(self.image, interpolate(self.rect, self.last_shift(), alpha), RenderBatch.ALIENS)
+
+    def draw_life_bar(self, alpha: float = 1.0) -> Rect:
+        """Displays the life bar above the generalship (drawn from the batch) and returns its area."""
+        x_shift: int = interpolate(self.rect, self.last_shift(), alpha)[0] - self.rect.x
+        life_bar_rect: Rect = self.life_bar_rect.move(x_shift, 0)
+        pg.draw.rect(self.screen, self.life_bar_color, life_bar_rect)
+        pg.draw.rect(self.screen, self.life_bar_outline_color, life_bar_rect, 2)  # 2 means width of the outline.
+        return life_bar_rect
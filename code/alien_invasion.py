@@ -1,11 +1,19 @@
 """
 This module provides an AlienInvasion class. The AlienInvasion object 
 is responsible for the gameplay implementation and uses all other modules. 
+The optional features (replay recording, dirty-rect rendering, spatial hash and NumPy
+kinematics) are imported only when Settings enable them, and the leaderboard, which is
+on by default, is imported after the first frame, so they don't slow the startup down.
 """
 
+from __future__ import annotations
+
+import os
 import sys
-from time import sleep
-from random import randint
+import atexit
+import random
+from time import perf_counter
+from typing import TYPE_CHECKING
 
 import pygame as pg
 from pygame.surface import Surface
@@ -19,74 +27,237 @@ from game_stats import GameStats
 from spaceship import Spaceship
 from settings import Settings
 from star import Star
+from starfield import Starfield
 from menu import Menu
+from asset_cache import assets
+from asset_loader import AssetLoader, LoadingScreen
+from text_renderer import text_renderer
+from audio import AudioManager
+from sprite_pool import SpritePool, PooledGroup
+from game_loop import FixedStepScheduler
+from fleet import AlienFleet
+from event_bus import EventBus, GameEvent
+from collision import MaskCache, Collider
+from render_batch import TextureAtlas, RenderBatch
+from profiler import FrameProfiler
+from game_state import GameState, GameStateMachine
+
+if TYPE_CHECKING:
+    from entity_store import EntityStore
+    from spatial_hash import SpatialHash
+    from renderer import DirtyRenderer
+    from replay import ReplayRecorder
+    from score_store import ScoreStore
 
 
 class AlienInvasion():
     """The AlienInvasion class provides a general game management."""
 
-    _MUSIC_PATH: str = '../sounds/infected_vibes.mp3'
-
-    def __init__(self) -> None:
-        """Game initialisation."""
-        pg.mixer.pre_init(44100, -16, 2, 4096)
-        pg.init()
+    def __init__(self, settings: Settings | None = None) -> None:
+        """Game initialisation. The default settings are used if none are given."""
+        self._startup_started: float = perf_counter()
+        # Seconds from the start of the initialisation to the first displayed frame.
+        self.time_to_first_frame: float | None = None
+        self.settings: Settings = settings or Settings()
+        if self.settings.headless:
+            # SDL's dummy driver provides an offscreen display, so images can still be converted.
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            self.settings.audio_enabled = False
+        self.profiler: FrameProfiler = FrameProfiler(self.settings.profiling)
+        if self.settings.profiling and self.settings.profile_output:
+            atexit.register(self.profiler.dump, self.settings.profile_output)
+        # Only the subsystems the game uses are initialised, `pg.init()` would start all of them
+        # (joysticks etc.). The AudioManager initialises the mixer unless in the silent mode.
+        pg.display.init()
+        pg.font.init()
+        self.audio: AudioManager = AudioManager(self.settings)
+        self._mark_startup("subsystems")
         pg.display.set_caption('Aliens Invasion')
         pg.event.set_allowed([pg.QUIT, pg.KEYDOWN, pg.KEYUP, pg.MOUSEBUTTONDOWN])
+        # The files are decoded on a thread pool while the rest of the game is set up.
+        self._loader: AssetLoader = AssetLoader(self.settings.asset_loader_threads)
+        self._loader.start(assets.image_paths(),
+                           self.audio.effect_paths() if self.audio.enabled else [])
+        # The leaderboard is opened after the first frame and read on a background thread,
+        # the saved best score is shown when it's loaded.
+        self.scores: ScoreStore | None = None
+        self._scores_loaded: bool = True
         self.clock = pg.time.Clock()
-
-        pg.mixer.music.load(self._MUSIC_PATH)
-        pg.mixer.music.set_volume(0.2)
-        pg.mixer.music.play(-1)
+        # The number of simulation steps performed since the start.
+        self.ticks: int = 0
+        # The tick at which the current game started, for the leaderboard.
+        self._game_started_tick: int = 0
+        # Set when the current game has been added to the leaderboard, so it's recorded once.
+        self._game_saved: bool = False
+        # All randomness of the game comes from this generator, so a seed reproduces the whole run.
+        self.seed: int = self.settings.seed if self.settings.seed is not None else random.getrandbits(32)
+        self.rng: random.Random = random.Random(self.seed)
 
         # Primary states of the game.
-        self.game_active: bool = False
-        self.game_paused: bool = False
-        self.game_complete: bool = False
-        self.final_level_achieved: bool = False
+        self.game_state: GameStateMachine = GameStateMachine()
+        # Gameplay events, the game reacts to the level's end and the general's defeat through them.
+        self.events: EventBus = EventBus()
+        self.events.subscribe(GameEvent.FLEET_CLEARED, self._next_level)
+        self.events.subscribe(GameEvent.LEVEL_UP, self._prepare_level)
+        self.events.subscribe(GameEvent.GENERAL_DEFEATED, lambda: self._reset_game(GameState.COMPLETE))
 
-        self.settings: Settings = Settings()
         # self.screen: Surface = pg.display.set_mode(
         #     (self.settings.screen_width, self.settings.screen_height))
         # self.screen_rect: Rect = self.screen.get_rect()
         # Full screen.
-        self.screen: Surface = pg.display.set_mode((0, 0), (pg.FULLSCREEN | pg.DOUBLEBUF), 16)
+        if self.settings.headless:
+            self.screen: Surface = pg.display.set_mode((self.settings.screen_width, self.settings.screen_height))
+        else:
+            self.screen = pg.display.set_mode((0, 0), (pg.FULLSCREEN | pg.DOUBLEBUF), 16)
         self.screen_rect: Rect = self.screen.get_rect()
         self.settings.screen_width = self.screen_rect.width
         self.settings.screen_height = self.screen_rect.height
+        self._mark_startup("display")
+        # Optional recording of the player's input, the replay needs the seed and the screen size too.
+        self.recorder: ReplayRecorder | None = None
+        if self.settings.record_replay:
+            from replay import ReplayRecorder
+            self.recorder = ReplayRecorder(self.settings.record_replay, self.seed, self.screen_rect.size)
+            atexit.register(self._stop_recording)
+        # All images are converted once, so creating sprites doesn't touch the disk. Surfaces and fonts
+        # cached for a previous display mode (e.g. an earlier game instance) are dropped.
+        assets.invalidate()
+        text_renderer.invalidate()
+        loading_screen: LoadingScreen | None = None
+        if self.settings.loading_screen and not self.settings.headless:
+            loading_screen = LoadingScreen(self.screen, self.settings)
+            loading_screen.draw(0, self._loader.total())
+        self._loader.finish(loading_screen.draw if loading_screen is not None else None)
+        self.audio.load(self._loader.sounds)
+        self._mark_startup("assets")
 
         self.menu: Menu = Menu(self)
         self.stats: GameStats = GameStats(self)
         self.scoreboard: Scoreboard = Scoreboard(self)
 
-        self.player_ship: Spaceship = Spaceship(self)
-        self.player_bullets = pg.sprite.Group()
-
-        self.alien_soldier_ships = pg.sprite.Group()
-        self.alien_soldier_bullets = pg.sprite.Group()
-        self.alien_general_bullets = pg.sprite.Group()
+        # Bullets and stars are reused, removing them from the group releases them to the pool.
+        self.player_bullet_pool: SpritePool = SpritePool(PlayerBullet, self.settings.player_allowed_bullets)
+        self.alien_soldier_bullet_pool: SpritePool = SpritePool(AlienSoldierBullet, self.settings.alien_allowed_bullets)
+        self.alien_general_bullet_pool: SpritePool = SpritePool(
+            AlienGeneralBullet, self.settings.alien_general_allowed_bullets)
+        self.star_pool: SpritePool = SpritePool(Star, self.settings.stars_per_row*self.settings.stars_rows)
 
-        self.stars = pg.sprite.Group()
-        self._create_stars()
+        # Groups moved by the optional NumPy backend get an EntityStore. Velocities are scaled
+        # in `_move_group()` by the values shared by the whole group (direction, stars' speed).
+        self.player_ship: Spaceship = Spaceship(self)
+        self.player_bullets = PooledGroup(
+            self.player_bullet_pool, store=self._create_entity_store(lambda bullet: bullet.last_shift()))
+
+        # The soldiers move as one block, the fleet keeps their positions itself.
+        self.alien_soldier_ships: AlienFleet = AlienFleet()
+        self.alien_soldier_bullets = PooledGroup(
+            self.alien_soldier_bullet_pool, store=self._create_entity_store(lambda bullet: bullet.last_shift()))
+        self.alien_general_bullets = PooledGroup(
+            self.alien_general_bullet_pool, store=self._create_entity_store(lambda bullet: bullet.last_shift()))
+
+        self.stars = PooledGroup(self.star_pool, store=self._create_entity_store(lambda star: (0.0, 1.0)))
+        # The pre-rendered starfield replaces the star sprites, except with the dirty-rect renderer.
+        self.starfield: Starfield | None = None
+        if self.settings.prerendered_starfield and not self.settings.dirty_rect_rendering:
+            self.starfield = Starfield(self)
+        else:
+            self._create_stars()
+
+        # All images are packed into one atlas, and each frame's sprites are drawn with batched blits.
+        self.atlas: TextureAtlas = TextureAtlas(assets.cached_images())
+        self.batch: RenderBatch = RenderBatch(self.screen, self.atlas)
+
+        # Optional renderer which updates only the changed regions of the screen.
+        self.renderer: DirtyRenderer | None = None
+        if self.settings.dirty_rect_rendering:
+            from renderer import DirtyRenderer
+            self.renderer = DirtyRenderer(self.screen, self.settings.background_color)
+
+        # Optional uniform-grid broadphase for collisions between groups.
+        self.spatial_hash: SpatialHash | None = None
+        if self.settings.spatial_hash_collisions:
+            from spatial_hash import SpatialHash
+            self.spatial_hash = SpatialHash(self.settings.spatial_hash_cell_size)
+        # The masks of all images are built once, the pixel-perfect test follows a rect overlap.
+        self.collider: Collider = Collider(self.settings, MaskCache(assets.cached_images()), self.spatial_hash)
+        self._mark_startup("game_objects")
 
     def run_game(self) -> None:
-        """Main loop of the game."""
+        """
+        Main loop of the game. The simulation advances in fixed steps accumulated from 
+        the frame time, so the gameplay speed doesn't depend on the rendering rate.
+        """
+        scheduler = FixedStepScheduler(self.settings.FPS, self.settings.max_catch_up_steps)
         while True:
-            self.clock.tick(self.settings.FPS)
+            frame_ms: int = self.clock.tick(self.settings.render_fps_limit)
+            self.profiler.begin_frame()
+            self._check_events()
+            self.profiler.mark("events")
+            for _ in range(scheduler.advance(frame_ms)):
+                self._update_game()
+            self._update_screen(scheduler.alpha)
+            self.profiler.end_frame(self._count_entities())
+
+    def run_headless(self, frames: int, on_frame=None, render: bool = False) -> None:
+        """
+        Steps the simulation for the given number of frames as fast as possible. 
+        The loop doesn't wait for the clock, each frame is a fixed simulation step.
+
+        Parameters
+        ----------
+        frames : `int`
+            The number of frames (simulation steps) to run.
+        on_frame : `Callable[[AlienInvasion, int], None]`, optional
+            Called before each frame with the game and the frame number, e.g. to post scripted input.
+        render : `bool`, default=False
+            Draws each frame on the offscreen display as well.
+        """
+        for frame in range(frames):
+            if on_frame is not None:
+                on_frame(self, frame)
+            self.profiler.begin_frame()
             self._check_events()
-            self._update_screen()
+            self.profiler.mark("events")
+            self._update_game()
+            if render:
+                self._update_screen()
+            self.profiler.end_frame(self._count_entities())
+
+    def attach_score_store(self, scores: ScoreStore) -> None:
+        """
+        Saves the finished games to the given leaderboard, which is closed on exit. The game
+        opens the one from Settings itself after the first frame, except in the headless mode.
+        """
+        self.scores = scores
+        self._scores_loaded = False
+        atexit.register(scores.close)
+
+    def _stop_recording(self) -> None:
+        """Finishes the replay file at the current tick."""
+        if self.recorder is not None:
+            self.recorder.close(self.ticks)
+
+    def _count_entities(self) -> int:
+        """Returns the number of stars, bullets and aliens."""
+        return len(self.stars) + len(self.player_bullets) + len(self.alien_soldier_bullets) + \
+            len(self.alien_general_bullets) + len(self.alien_soldier_ships)
 
     def _check_events(self) -> None:
         """Check reaction to button press/release and mouse interaction."""
+        if not self._scores_loaded and self.scores.loaded.is_set():  # type: ignore
+            self._scores_loaded = True
+            self.events.publish(GameEvent.SCORES_LOADED)
         for event in pg.event.get():
+            if self.recorder is not None:
+                self.recorder.record(self.ticks, event)
             if event.type == pg.QUIT:
-                sys.exit()
+                self._quit()
             elif event.type == pg.KEYDOWN:
                 self._check_keydown_events(event)
             elif event.type == pg.KEYUP:
                 self._check_keyup_events(event)
             elif event.type == pg.MOUSEBUTTONDOWN:
-                self._check_mouse_events()
+                self._check_mouse_events(event)
 
     def _check_keydown_events(self, event) -> None:
         """Reactions on key press."""
@@ -95,7 +266,7 @@ class AlienInvasion():
         elif event.key == pg.K_LEFT:
             self.player_ship.moving_left = True
         elif event.key == pg.K_g:
-            self._start_game()
+            self.start_game()
         elif event.key == pg.K_SPACE:
             self._fire_bullet("Player")
         elif event.key == pg.K_r:
@@ -112,9 +283,10 @@ class AlienInvasion():
             self.menu.show_help()
         elif event.key == pg.K_ESCAPE:
             self.menu.return_to_menu()
-            self.game_complete = False
+            if self.game_state.state is GameState.COMPLETE:
+                self.game_state.enter(GameState.MENU)
         elif event.key == pg.K_q:
-            sys.exit()
+            self._quit()
         elif event.key == pg.K_p:
             self._pause_game()
 
@@ -125,14 +297,15 @@ class AlienInvasion():
         elif event.key == pg.K_LEFT:
             self.player_ship.moving_left = False
 
-    def _check_mouse_events(self) -> None:
+    def _check_mouse_events(self, event) -> None:
         """Reactions to mouse click."""
-        if not self.game_active:
-            mouse_pos: tuple[int, int] = pg.mouse.get_pos()
+        if not self.game_state.in_game:
+            # The event's position rather than the current one, so the click can be replayed.
+            mouse_pos: tuple[int, int] = event.pos
             if self.menu.check_button_press(mouse_pos, "Play"):
-                self._start_game()
+                self.start_game()
             elif self.menu.check_button_press(mouse_pos, "Exit Game"):
-                sys.exit()
+                self._quit()
             elif self.menu.check_button_press(mouse_pos, "Help"):
                 self.menu.show_help()
             elif self.menu.check_button_press(mouse_pos, "Easy Mode"):
@@ -146,25 +319,45 @@ class AlienInvasion():
             elif self.menu.check_button_press(mouse_pos, "Back"):
                 self.menu.return_to_menu()
 
-    def _start_game(self) -> None:
+    def start_game(self) -> None:
         """Resets current game statistics, prepares scoreboard, alien fleet and starts the game."""
-        if not self.game_active and not self.game_complete:
+        if self.game_state.state is GameState.MENU:
             self.stats.reset_stats()
-            self.scoreboard.prepare_current_score()
-            self.scoreboard.prepare_current_level()
-            self.scoreboard.prepare_remaining_player_ships()
+            self._game_started_tick = self.ticks
+            self._game_saved = False
+            self.events.publish(GameEvent.GAME_STARTED)
             self.player_ship.set_center()
-            self._create_alien_soldiers_fleet()
-            self.game_active = True
+            self._resize_sprite_pools()
+            self.game_state.enter(GameState.SOLDIERS_FIGHT)
+            # The first level can be the final one too.
+            self._prepare_level(self.stats.current_level)
             pg.mouse.set_visible(False)
 
-    def _reset_game(self) -> None:
+    def restart(self, seed: int | None = None) -> None:
+        """
+        Abandons the current game (also a paused or a completed one) and starts a new one,
+        e.g. for the next episode of an agent. The random number generator is reseeded
+        with `seed` if it's given.
+        """
+        if self.game_state.state is GameState.PAUSED:
+            self.game_state.toggle_pause()
+        self._reset_game()
+        if self.game_state.state is GameState.COMPLETE:
+            self.game_state.enter(GameState.MENU)
+        if seed is not None:
+            self.seed = seed
+            self.rng.seed(seed)
+        self.player_ship.moving_left = self.player_ship.moving_right = False
+        self.start_game()
+
+    def _reset_game(self, next_state: GameState = GameState.MENU) -> None:
         """
         Resets the current game, removes the remaining bullets and aliens,
         set the player's ship to the screen centre, set the star's speed
-        to default, and return to the menu.
+        to default, and return to the menu (or switch to `next_state`).
         """
-        if self.game_active and not self.game_paused:
+        if self.game_state.in_game and self.game_state.state is not GameState.PAUSED:
+            self._save_game()
             self.player_bullets.empty()
             self.alien_soldier_bullets.empty()
             self.alien_general_bullets.empty()
@@ -172,21 +365,85 @@ class AlienInvasion():
             self.player_ship.set_center()
             self.settings.reset_gameplay_speedup()
             self.menu.return_to_menu()
-            self.game_active = False
-            self.final_level_achieved = False
+            self.game_state.enter(next_state)
             pg.mouse.set_visible(True)
 
+    def _save_game(self) -> None:
+        """
+        Adds the current game to the leaderboard, which saves it in the background. A game
+        lost in the last life is saved before the respawn delay, so leaving during the delay
+        doesn't record it again.
+        """
+        if self.scores is None or self._game_saved:
+            return
+        self._game_saved = True
+        duration: float = (self.ticks - self._game_started_tick) / self.settings.FPS
+        self.scores.record_run(self.settings.difficulty, self.stats.current_score, self.stats.current_level, duration)
+        self.scores.commit()
+
+    def _quit(self) -> None:
+        """Saves the current game (the leaderboard is closed on exit) and quits."""
+        if self.game_state.in_game:
+            self._save_game()
+        sys.exit()
+
     def _pause_game(self) -> None:
         """Pause the game if the gameplay is active."""
-        if self.game_active:
-            self.game_paused = not self.game_paused
+        self.game_state.toggle_pause()
+
+    def _create_entity_store(self, velocity) -> EntityStore | None:
+        """Returns an EntityStore if the vectorized kinematics is enabled and NumPy is available."""
+        if not self.settings.vectorized_kinematics:
+            return None
+        from entity_store import EntityStore, vectorization_available
+        if vectorization_available():
+            return EntityStore(velocity)
+        return None
+
+    def _move_group(self, group, scale_x: float = 1.0, scale_y: float = 1.0, sync_rects: bool = True) -> None:
+        """
+        Moves the group's sprites. A group with an EntityStore is moved in one vectorized step 
+        (velocities multiplied by the scale) and its rects are synced only if `sync_rects` is True. 
+        Otherwise, each sprite is updated separately.
+        """
+        if group.store is None:
+            group.update()
+        else:
+            group.store.step(scale_x, scale_y)
+            if sync_rects:
+                group.store.sync_rects()
+
+    def _remove_outside(self, group, top: int | None = None, bottom: int | None = None) -> None:
+        """Removes sprites entirely above `top` (rect's bottom <= top) or below `bottom` (rect's top >= bottom)."""
+        if group.store is not None:
+            group.remove(*group.store.outside(top, bottom))
+            return
+
+        for sprite in group.sprites():
+            if (top is not None and sprite.rect.bottom <= top) or (bottom is not None and sprite.rect.top >= bottom):
+                group.remove(sprite)
+
+    def _resize_sprite_pools(self) -> None:
+        """Adjusts the capacity of the bullets' pools to the current difficulty mode."""
+        self.player_bullet_pool.capacity = self.settings.player_allowed_bullets
+        self.alien_soldier_bullet_pool.capacity = self.settings.alien_allowed_bullets
+        self.alien_general_bullet_pool.capacity = self.settings.alien_general_allowed_bullets
+
+    def sprite_pools_stats(self) -> dict[str, dict[str, int]]:
+        """Returns the statistics of all sprites' pools."""
+        return {
+            "PlayerBullet": self.player_bullet_pool.stats(),
+            "AlienSoldierBullet": self.alien_soldier_bullet_pool.stats(),
+            "AlienGeneralBullet": self.alien_general_bullet_pool.stats(),
+            "Star": self.star_pool.stats(),
+        }
 
     def _create_stars(self) -> None:
         """Creates outer space with a constant number of stars."""
         row_space: int = self.settings.screen_height // self.settings.stars_rows
         for row in range(self.settings.stars_rows):
             for _ in range(self.settings.stars_per_row):
-                star: Star = Star(self)
+                star: Star = self.star_pool.acquire(self)  # type: ignore
                 star.y += row_space*row
                 star.rect.y = int(star.y)
                 self.stars.add(star)
@@ -195,18 +452,21 @@ class AlienInvasion():
         """
         Updates all stars' positions, which causes the feeling of
         traversing space. If any stars arrive beyond the screen's bottom
-        edge, they are removed, and new stars are created.
+        edge, they are removed, and new stars are created. With the
+        pre-rendered starfield, only its layers are scrolled.
         """
-        self.stars.update()
+        if self.starfield is not None:
+            self.starfield.update()
+            return
 
-        for star in self.stars.copy():
-            if star.rect.top > self.screen_rect.bottom:  # type: ignore
-                self.stars.remove(star)
+        # Stars' rects are needed only for drawing, so the vectorized backend syncs them just before.
+        self._move_group(self.stars, scale_y=self.settings.star_speed, sync_rects=False)
+        self._remove_outside(self.stars, bottom=self.screen_rect.bottom + 1)
 
         row_space: int = self.settings.screen_height // self.settings.stars_rows
         # Provide constant number of stars.
         if len(self.stars) < self.settings.stars_per_row*self.settings.stars_rows:
-            new_star: Star = Star(self)
+            new_star: Star = self.star_pool.acquire(self)  # type: ignore
             new_star.y -= row_space  # Provides effect that stars coming on the screen naturally.
             new_star.rect.y = int(new_star.y)
             self.stars.add(new_star)
@@ -214,37 +474,31 @@ class AlienInvasion():
     def _fire_bullet(self, owner: str) -> None:
         """Adds a new Bullet object to the appropriate group."""
         if owner == "Player":
-            if self.game_active and not self.game_paused and len(
+            if self.game_state.fighting and len(
                     self.player_bullets) < self.settings.player_allowed_bullets:
-                player_bullet: PlayerBullet = PlayerBullet(self)
-                player_bullet.play_sound()
-                self.player_bullets.add(player_bullet)
+                self.player_bullets.add(self.player_bullet_pool.acquire(self))
+                self.audio.play("fire")
         elif owner == "AlienSoldier":
             if self.alien_soldier_ships and len(self.alien_soldier_bullets) < self.settings.alien_allowed_bullets:
-                self.alien_soldier_bullets.add(AlienSoldierBullet(self))
+                self.alien_soldier_bullets.add(self.alien_soldier_bullet_pool.acquire(self))
         elif owner == "AlienGeneral":
-            if randint(1, 1000) <= 10 and len(self.alien_general_bullets) < self.settings.alien_general_allowed_bullets:
-                self.alien_general_bullets.add(AlienGeneralBullet(self))
+            if self.rng.randint(1, 1000) <= 10 and \
+                    len(self.alien_general_bullets) < self.settings.alien_general_allowed_bullets:
+                self.alien_general_bullets.add(self.alien_general_bullet_pool.acquire(self))
 
     def _update_bullets(self) -> None:
         """Updates bullets positions and remove them if any bullets are out of the screen."""
-        self.player_bullets.update()
-        self.alien_soldier_bullets.update()
-        self.alien_general_bullets.update()
+        self._move_group(self.player_bullets)
+        self._move_group(self.alien_soldier_bullets)
+        self._move_group(self.alien_general_bullets)
 
-        for player_bullet in self.player_bullets.copy():
-            if player_bullet.rect.bottom <= 0:  # type: ignore
-                self.player_bullets.remove(player_bullet)
-
-        for alien_bullet in self.alien_soldier_bullets.copy():
-            if alien_bullet.rect.top >= self.screen_rect.bottom:  # type: ignore
-                self.alien_soldier_bullets.remove(alien_bullet)
-
-        for general_bullet in self.alien_general_bullets.copy():
-            if general_bullet.rect.top >= self.screen_rect.bottom:  # type: ignore
-                self.alien_general_bullets.remove(general_bullet)
+        self._remove_outside(self.player_bullets, top=0)
+        self._remove_outside(self.alien_soldier_bullets, bottom=self.screen_rect.bottom)
+        self._remove_outside(self.alien_general_bullets, bottom=self.screen_rect.bottom)
+        self.profiler.mark("bullets")
 
         self._check_collisions()
+        self.profiler.mark("collisions")
 
     def _check_collisions(self) -> None:
         """
@@ -252,57 +506,57 @@ class AlienInvasion():
         aliens' ships. It is responsible for the game score calculation after shooting the 
         alien ship and for game speedup if each alien is killed. If the player reaches the 
         final level, the alien general is created. The game ends when the player kills the 
-        generalship.
+        generalship. The next level is prepared by the handlers of the published events.
         """
-        # Prepare the usual level - create a new soldiers fleet with a gameplay speedup.
-        if not self.alien_soldier_ships and not self.final_level_achieved:
-            self.player_bullets.empty()
-            self.alien_soldier_bullets.empty()
-            self.settings.increase_gameplay_speed()
-            self._create_alien_soldiers_fleet()
-            self.stats.current_level += 1
-            self.scoreboard.prepare_current_level()
-
         # Check the collision between the player's bullets and the alien's bullets.
         # True means to remove object.
-        pg.sprite.groupcollide(self.player_bullets, self.alien_soldier_bullets, True, True)
+        self.collider.groupcollide(self.player_bullets, self.alien_soldier_bullets, True, True)
 
         # Check the collision between the player's spaceship and the alien's bullets.
-        if pg.sprite.spritecollideany(self.player_ship, self.alien_soldier_bullets):
+        if self.collider.spritecollideany(self.player_ship, self.alien_soldier_bullets):
             self._ship_hit()
 
         # Check the collision between the player's bullets and the alien's ships.
-        player_bullet_and_alien_ship: dict[Sprite, Sprite] = pg.sprite.groupcollide(
-            self.player_bullets, self.alien_soldier_ships, True, True)
+        player_bullet_and_alien_ship: dict[Sprite, list[Sprite]] = self.alien_soldier_ships.collide_bullets(
+            self.player_bullets, collide=self.collider.collide)
 
         if player_bullet_and_alien_ship:
             # Count points for every alien if the player's bullet hits several aliens at once.
-            for aliens in player_bullet_and_alien_ship.values():
-                self.stats.current_score += self.settings.points_for_alien*len(aliens)  # type: ignore
-            self.scoreboard.prepare_current_score()
-            self.scoreboard.check_the_highest_score()
-
-        # Prepare the final level - create the alien general.
-        if not self.final_level_achieved and self.stats.current_level == self.settings.final_level:
-            self.alien_soldier_ships.empty()
-            self.alien_general_ship: AlienGeneral = AlienGeneral(self)
-            self.final_level_achieved = True
-
-        if self.final_level_achieved:
+            killed: int = sum(len(aliens) for aliens in player_bullet_and_alien_ship.values())
+            self.stats.current_score += self.settings.points_for_alien*killed  # type: ignore
+            self.events.publish(GameEvent.ALIEN_KILLED, killed)
+            # Only a kill can clear the fleet, so the fleet isn't checked in other frames.
+            if not self.alien_soldier_ships:
+                self.events.publish(GameEvent.FLEET_CLEARED)
+
+        if self.game_state.final_level_achieved:
             # Check the collision between the player's bullets and the alien general ship.
-            for player_bullet in self.player_bullets.copy():
-                if pg.sprite.collide_rect(self.alien_general_ship, player_bullet):
-                    self.player_bullets.remove(player_bullet)
-                    self.alien_general_ship.life_points -= self.settings.player_bullet_points
-                if self.alien_general_ship.life_points <= 0:
-                    self.game_complete = True
-                    self._reset_game()
+            hits: list[Sprite] = self.collider.spritecollide(self.alien_general_ship, self.player_bullets, True)
+            self.alien_general_ship.life_points -= self.settings.player_bullet_points*len(hits)
+            if hits and self.alien_general_ship.life_points <= 0:
+                self.events.publish(GameEvent.GENERAL_DEFEATED)
             # Check the collision between the player's bullets and the alien general bullets.
-            pg.sprite.groupcollide(self.player_bullets, self.alien_general_bullets, True, True)
+            self.collider.groupcollide(self.player_bullets, self.alien_general_bullets, True, True)
             # Check the collision between the player's spaceship and the alien general bullets.
-            if pg.sprite.spritecollideany(self.player_ship, self.alien_general_bullets):
+            if self.collider.spritecollideany(self.player_ship, self.alien_general_bullets):
                 self._ship_hit()
 
+    def _next_level(self) -> None:
+        """Reacts to the cleared fleet: removes the bullets, speeds the gameplay up and advances the level."""
+        self.player_bullets.empty()
+        self.alien_soldier_bullets.empty()
+        self.settings.increase_gameplay_speed()
+        self.stats.current_level += 1
+        self.events.publish(GameEvent.LEVEL_UP, self.stats.current_level)
+
+    def _prepare_level(self, level: int) -> None:
+        """Creates a new soldiers fleet, or the alien general on the final level."""
+        if level == self.settings.final_level:
+            self.alien_general_ship: AlienGeneral = AlienGeneral(self)
+            self.game_state.enter(GameState.GENERAL_FIGHT)
+        else:
+            self._create_alien_soldiers_fleet()
+
     def _create_alien_soldiers_fleet(self) -> None:
         """
         Creates new aliens' fleet considering available screen width,
@@ -316,19 +570,10 @@ class AlienInvasion():
         number_aliens_x: int = available_space_x // (2*space_between_aliens) + additional_alien_in_row
         number_rows: int = available_space_y // (2*space_between_aliens)
 
-        # Create the fleet.
-        for row_number in range(number_rows):
-            for alien_number in range(number_aliens_x):
-                self._create_alien_soldier(alien_number, row_number)
-
-    def _create_alien_soldier(self, alien_number: int, row_number: int) -> None:
-        """Create a new alien ship in the specified (x,y) position and add it to the appropriate group."""
-        alien: AlienSoldier = AlienSoldier(self)
-        space_between_aliens: int = self.settings.space_between_aliens
-        alien.x = 20 + 2*space_between_aliens*alien_number
-        alien.rect.x = alien.x
-        alien.rect.y = 4*space_between_aliens + (2*space_between_aliens*row_number)
-        self.alien_soldier_ships.add(alien)
+        # Create the fleet, the first alien is placed in the top-left corner of the formation.
+        self.alien_soldier_ships.create(lambda: AlienSoldier(self), (20.0, 4*space_between_aliens),
+                                        number_rows, number_aliens_x, 2*space_between_aliens,
+                                        self.settings.alien_ship_speed)
 
     def _update_alien_soldiers(self) -> None:
         """
@@ -337,9 +582,9 @@ class AlienInvasion():
         arrive at the screen's bottom edge.
         """
         self._check_screen_edge_for_soldiers()
-        self.alien_soldier_ships.update()
+        self.alien_soldier_ships.move(self.settings.alien_moving_direction)
 
-        if pg.sprite.spritecollideany(self.player_ship, self.alien_soldier_ships):
+        if self.alien_soldier_ships.collide_any(self.player_ship, self.collider.collide):
             self._ship_hit()
 
         self._check_any_soldier_reaches_screen_bottom()
@@ -352,29 +597,27 @@ class AlienInvasion():
 
     def _check_screen_edge_for_soldiers(self) -> None:
         """Change the soldiers fleet movement's direction if any aliens come to the screen edge."""
-        for alien in self.alien_soldier_ships:
-            if alien.check_left_right_screen_edge():  # type: ignore
+        if self.alien_soldier_ships:
+            left, _, right, _ = self.alien_soldier_ships.bounds()
+            if right >= self.screen_rect.right or left <= 0:
                 self._change_soldiers_fleet_direction()
-                break
 
     def _change_soldiers_fleet_direction(self) -> None:
         """Shifts the whole alien soldiers fleet and changes the direction of its movement. """
-        for alien in self.alien_soldier_ships:
-            alien.rect.y += self.settings.alien_drop_shift_speed  # type: ignore
+        self.alien_soldier_ships.drop(self.settings.alien_drop_shift_speed)
         self.settings.alien_moving_direction *= -1
 
     def _check_any_soldier_reaches_screen_bottom(self) -> None:
         """We lose the current game round if any aliens arrive at the bottom edge of the screen."""
-        for alien in self.alien_soldier_ships:
-            if alien.rect.bottom >= self.screen_rect.bottom:  # type: ignore
-                self._ship_hit()
-                break
+        if self.alien_soldier_ships and self.alien_soldier_ships.bounds()[3] >= self.screen_rect.bottom:
+            self._ship_hit()
 
     def _ship_hit(self) -> None:
         """
         If the player's spaceship has been hit, remove the remaining bullets
         and aliens, set the spaceship to the screen centre, and start a new
-        round if the player has remaining lives.
+        round if the player has remaining lives. The game stays still in the
+        respawn state for `respawn_delay` seconds of simulation time first.
         """
         self.alien_soldier_ships.empty()
         self.alien_soldier_bullets.empty()
@@ -385,60 +628,150 @@ class AlienInvasion():
 
         if self.stats.remaining_player_ships > 0:
             self.stats.remaining_player_ships -= 1
-            self.scoreboard.prepare_remaining_player_ships()
-            if not self.final_level_achieved:
+            self.events.publish(GameEvent.SHIP_HIT, self.stats.remaining_player_ships)
+            if not self.game_state.final_level_achieved:
                 self._create_alien_soldiers_fleet()
             else:
                 self.alien_general_ship.reset_alien_general_ship()
+            next_state: GameState = self.game_state.fight  # type: ignore
         else:
+            # Game over, the last life is lost.
+            self._save_game()
             self.settings.reset_gameplay_speedup()
             self.menu.return_to_menu()
             pg.mouse.set_visible(True)
-            self.game_active = False
-            self.final_level_achieved = False
-
-        sleep(1.0)
+            next_state = GameState.MENU
 
-    def _update_active_game(self) -> None:
-        """Updates and draws gameplay objects when the game is active."""
-        self.scoreboard.show_scoreboard_and_stats()
+        self.game_state.enter(GameState.RESPAWN, round(self.settings.respawn_delay*self.settings.FPS), next_state)
 
-        self._update_bullets()
-        self.player_ship.update()
-        self.player_ship.draw()
-        self.player_bullets.draw(self.screen)
-
-        if not self.final_level_achieved:
-            self._update_alien_soldiers()
-            self.alien_soldier_ships.draw(self.screen)
-            self.alien_soldier_bullets.draw(self.screen)
-            self._fire_bullet("AlienSoldier")
-        else:
-            self._update_alien_general()
-            self.alien_general_ship.draw()
-            self.alien_general_bullets.draw(self.screen)
-            self._fire_bullet("AlienGeneral")
-
-    def _update_screen(self) -> None:
-        """Updates the game screen."""
-        self.screen.fill(self.settings.background_color)
+    def _update_game(self) -> None:
+        """Advances the simulation by one step without drawing anything."""
         self._update_stars()
-        self.stars.draw(self.screen)
+        self.profiler.mark("stars")
+
+        self.game_state.update()
+        if self.game_state.fighting:
+            self._update_bullets()
+            self.player_ship.update()
+            if not self.game_state.final_level_achieved:
+                self._update_alien_soldiers()
+                self._fire_bullet("AlienSoldier")
+            else:
+                self._update_alien_general()
+                self._fire_bullet("AlienGeneral")
+            self.profiler.mark("aliens")
+
+        self.ticks += 1
 
-        if self.game_complete:
+    def _draw_stars(self, alpha: float) -> list[Rect]:
+        """
+        Draws the stars below the interface: the starfield's layers (they cover the whole screen)
+        or the star sprites in one batched call. Returns the drawn areas of the sprites.
+        """
+        if self.starfield is not None:
+            self.starfield.draw(self.screen, alpha)
+            return []
+        if self.stars.store is not None:
+            self.stars.store.sync_rects()
+        self.batch.add_group(self.stars, RenderBatch.STARS, alpha)
+        return self.batch.flush(RenderBatch.STARS)
+
+    def _draw_interface(self) -> None:
+        """Draws the static interface: messages, the menu or the scoreboard, depending on the game state."""
+        state: GameState = self.game_state.state
+        if state is GameState.COMPLETE:
             self.menu.draw_message("Congratulations", ypos=250)
-        elif self.game_paused:
+        elif state is GameState.PAUSED:
             self.menu.draw_message("Pause", fontsize=128)
-        elif self.game_active:
-            self._update_active_game()
+        elif self.game_state.in_game:
+            self.scoreboard.show_scoreboard_and_stats()
         else:
-            self.player_ship.draw()
             self.menu.draw_menu()
 
+    def _draw_objects(self, alpha: float) -> list[Rect]:
+        """
+        Draws the player's spaceship, bullets and aliens above the interface in one batched call.
+        Returns the drawn areas.
+        """
+        if self.game_state.state in (GameState.COMPLETE, GameState.PAUSED):
+            return []
+
+        self.player_ship.draw(self.batch, alpha)
+        if not self.game_state.in_game:
+            return self.batch.flush()
+
+        self.batch.add_group(self.player_bullets, RenderBatch.PLAYER_BULLETS, alpha)
+        if not self.game_state.final_level_achieved:
+            self.batch.add_group(self.alien_soldier_ships, RenderBatch.ALIENS, alpha)
+            self.batch.add_group(self.alien_soldier_bullets, RenderBatch.ALIEN_BULLETS, alpha)
+            return self.batch.flush()
+
+        self.alien_general_ship.draw(self.batch, alpha)
+        self.batch.add_group(self.alien_general_bullets, RenderBatch.ALIEN_BULLETS, alpha)
+        rects: list[Rect] = self.batch.flush()
+        rects.append(self.alien_general_ship.draw_life_bar(alpha))
+        return rects
+
+    def _draw_profiler_overlay(self) -> list[Rect]:
+        """Draws the profiler's overlay if profiling is enabled. Returns the drawn area."""
+        if self.settings.profiling and self.settings.profiler_overlay:
+            return [self.profiler.draw_overlay(self.screen, self.clock.get_fps())]
+        return []
+
+    def _interface_signature(self) -> tuple:
+        """Returns the values which change the static interface. The dirty renderer repaints it if they change."""
+        return (self.game_state.state,
+                self.menu.menu_is_active, self.menu.settings_is_active, self.menu.help_is_active,
+                self.menu.easy_btn_pressed, self.menu.medium_btn_pressed, self.menu.hard_btn_pressed,
+                self.stats.current_score, self.stats.highest_score, self.stats.current_level,
+                self.stats.remaining_player_ships)
+
+    def _update_screen(self, alpha: float = 1.0) -> None:
+        """
+        Updates the game screen. Moving objects are drawn between their previous and current 
+        positions by `alpha`, the fraction of the next simulation step already elapsed.
+        Stars are below the interface and other objects above it, so sprites are drawn
+        in two batches, one on each side of the interface.
+        """
+        if self.renderer is not None:
+            self.renderer.begin(self._interface_signature(), self._draw_interface)
+            self.renderer.add_under_interface(self._draw_stars(alpha))
+            rects: list[Rect] = self._draw_objects(alpha)
+            rects += self._draw_profiler_overlay()
+            self.batch.end_frame()
+            self.profiler.mark("draw")
+            self.renderer.end(rects)
+            self.profiler.mark("flip")
+            if self.time_to_first_frame is None:
+                self._on_first_frame()
+            return
+
+        if self.starfield is None:
+            self.screen.fill(self.settings.background_color)
+        self._draw_stars(alpha)
+        self._draw_interface()
+        self._draw_objects(alpha)
+        self._draw_profiler_overlay()
+        self.batch.end_frame()
+        self.profiler.mark("draw")
         pg.display.flip()  # Update of the screen.
+        self.profiler.mark("flip")
+        if self.time_to_first_frame is None:
+            self._on_first_frame()
 
-        # print(f"Ship Speed: {self.settings.player_ship_speed:.1f}, Player Bullet Speed: {self.settings.player_bullet_speed:.1f}, Alien Ship Speed: {self.settings.alien_ship_speed:.1f}, Alien Bullet Speed: {self.settings.alien_bullet_speed:.1f}, Points: {self.settings.points_for_alien:.1f}, Stars Speed: {self.settings.star_speed:.1f}")
+    def _mark_startup(self, step: str) -> None:
+        """Stores the milliseconds from the start of the initialisation to the end of the given startup step."""
+        self.profiler.startup_ms[step] = (perf_counter() - self._startup_started)*1000
 
-        # print(f"Ships: {self.settings.player_ships_limit}, Player Bullets: {self.settings.player_allowed_bullets}, Alien Bullets: {self.settings.alien_allowed_bullets}, Drop Speed: {self.settings.alien_drop_shift_speed}, General Bullets: {self.settings.alien_general_allowed_bullets}")
-
-        # print(f"Stars: {len(self.stars)}, Aliens: {len(self.alien_soldier_ships)}, Bullets: {len(self.player_bullets)}, Alien Bullets: {len(self.alien_soldier_bullets)}, General Bullets: {len(self.alien_general_bullets)}")
+    def _on_first_frame(self) -> None:
+        """
+        Starts the music and opens the leaderboard from Settings (except in the headless mode),
+        which are loaded only now, so they don't delay the first frame. Stores the time from the
+        start of the initialisation to the first frame (it's in the profile's summary).
+        """
+        self.time_to_first_frame = perf_counter() - self._startup_started
+        self._mark_startup("first_frame")
+        self.audio.play_music()
+        if self.settings.score_store and not self.settings.headless and self.scores is None:
+            from score_store import ScoreStore
+            self.attach_score_store(ScoreStore(self.settings.score_store, self.settings.leaderboard_size))
@@ -0,0 +1,77 @@
+"""
+This module provides an AssetCache object, a process-wide registry of images.
+Each file from the `assets` directory is decoded and converted only once, and
+every sprite shares the same Surface object. The module-level `assets` instance
+should be used instead of calling `pygame.image.load()` in the sprites.
+"""
+
+import os
+
+import pygame as pg
+from pygame.surface import Surface
+
+
+class AssetCache():
+    """AssetCache object decodes images once and hands out shared surfaces."""
+
+    _ASSETS_DIR: str = "../assets"
+    _IMAGE_EXTENSIONS: tuple[str, ...] = (".png",)
+
+    def __init__(self) -> None:
+        """Initialise AssetCache object."""
+        self._images: dict[str, Surface] = {}
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def get_image(self, path: str) -> Surface:
+        """
+        Returns the converted image from the given path. The image is loaded from
+        the disk only on the first request; each next request returns the same Surface,
+        so the caller must not draw on it.
+        """
+        key: str = os.path.normpath(path)
+        image: Surface | None = self._images.get(key)
+        if image is None:
+            self.misses += 1
+            image = pg.image.load(key).convert_alpha()
+            self._images[key] = image
+        else:
+            self.hits += 1
+        return image
+
+    def add_image(self, path: str, image: Surface) -> None:
+        """Puts an image decoded and converted elsewhere (e.g. by the AssetLoader) into the cache."""
+        self._images[os.path.normpath(path)] = image
+
+    def image_paths(self, directory: str | None = None) -> list[str]:
+        """Returns the paths of all images in the given directory (`assets` by default)."""
+        directory = directory or self._ASSETS_DIR
+        return [os.path.join(root, file) for root, _, files in sorted(os.walk(directory))
+                for file in sorted(files) if file.endswith(self._IMAGE_EXTENSIONS)]
+
+    def preload(self, directory: str | None = None) -> None:
+        """
+        Decodes every image from the given directory (`assets` by default) in advance.
+        The display mode has to be set before, because images are converted to its format.
+        """
+        for path in self.image_paths(directory):
+            self.get_image(path)
+
+    def cached_images(self) -> dict[str, Surface]:
+        """Returns the cached images by their paths, e.g. to pack them into a texture atlas."""
+        return dict(self._images)
+
+    def invalidate(self) -> None:
+        """
+        Drops every cached surface. It must be called after the display mode changes
+        because the converted surfaces keep the pixel format of the previous mode.
+        """
+        self._images.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Returns the number of cached images, cache hits and cache misses."""
+        return {"images": len(self._images), "hits": self.hits, "misses": self.misses}
+
+
+# The process-wide instance shared by all sprites.
+assets: AssetCache = AssetCache()
@@ -0,0 +1,112 @@
+"""
+This module provides an AssetLoader object, the game's startup pipeline, and a LoadingScreen
+object. The loader decodes the images and sound effects on a thread pool as soon as pygame
+is initialised (SDL releases the GIL while it decodes a file), and the system fonts are
+looked up on the pool at the same time. Only the conversion of the images to the display's
+pixel format has to wait for the display mode, it is done on the main thread as each
+decoded image arrives, and the loading screen shows the progress meanwhile.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Callable
+
+import pygame as pg
+from pygame.mixer import Sound
+from pygame.surface import Surface
+from pygame.rect import Rect
+
+from asset_cache import assets
+
+
+class AssetLoader():
+    """AssetLoader object decodes the game's files in parallel and hands them to the caches."""
+
+    def __init__(self, workers: int) -> None:
+        """
+        Initialise AssetLoader object.
+
+        Parameters
+        ----------
+        workers : `int`
+            The number of decoding threads (at least one is used).
+        """
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(max(workers, 1), thread_name_prefix="asset-loader")
+        # Each task's future with the kind of the file ("image", "sound" or "fonts") and its path.
+        self._tasks: dict[Future, tuple[str, str]] = {}
+        # The decoded sound effects by their paths.
+        self.sounds: dict[str, Sound] = {}
+        self.loaded: int = 0
+
+    def start(self, image_paths: list[str], sound_paths: list[str]) -> None:
+        """
+        Submits the decoding of the given files. Sounds can be decoded only if the mixer is
+        initialised, images don't need the display yet because they are converted later.
+        """
+        for path in image_paths:
+            self._tasks[self._executor.submit(pg.image.load, path)] = ("image", path)
+        for path in sound_paths:
+            self._tasks[self._executor.submit(Sound, path)] = ("sound", path)
+        # The first SysFont() call scans the system fonts, which runs an external program on some platforms.
+        self._tasks[self._executor.submit(pg.font.get_fonts)] = ("fonts", "")
+
+    def total(self) -> int:
+        """Returns the number of submitted tasks."""
+        return len(self._tasks)
+
+    def finish(self, on_progress: Callable[[int, int], None] | None = None) -> None:
+        """
+        Waits for the decoding and adds the images converted to the display's format to the
+        asset cache. The display mode has to be set before. `on_progress(loaded, total)` is
+        called on the main thread after each finished task.
+        """
+        try:
+            for future in as_completed(self._tasks):
+                kind, path = self._tasks[future]
+                result = future.result()
+                if kind == "image":
+                    image: Surface = result
+                    assets.add_image(path, image.convert_alpha())
+                elif kind == "sound":
+                    self.sounds[path] = result
+                self.loaded += 1
+                if on_progress is not None:
+                    on_progress(self.loaded, self.total())
+        finally:
+            self._executor.shutdown(cancel_futures=True)
+
+
+class LoadingScreen():
+    """LoadingScreen object draws a progress bar in the middle of the screen."""
+
+    _BAR_SIZE: tuple[int, int] = (400, 24)
+
+    def __init__(self, screen: Surface, settings) -> None:
+        """
+        Initialise LoadingScreen object.
+
+        Parameters
+        ----------
+        screen : `Surface`
+            The display surface.
+        settings : `Settings`
+            Gives the colours of the screen.
+        """
+        self.screen: Surface = screen
+        self.settings = settings
+        self.bar_rect: Rect = Rect((0, 0), self._BAR_SIZE)
+        self.bar_rect.center = screen.get_rect().center
+        # pygame's built-in font, so the label doesn't wait for the system fonts' scan.
+        self._label: Surface = pg.font.Font(None, 36).render("Loading...", True, settings.text_color)
+
+    def draw(self, loaded: int, total: int) -> None:
+        """Draws the progress of `loaded` out of `total` tasks and updates the screen."""
+        # Keeps the window responsive while the game is loading.
+        pg.event.pump()
+        self.screen.fill(self.settings.background_color)
+        self.screen.blit(self._label, self._label.get_rect(midbottom=(self.bar_rect.centerx, self.bar_rect.top - 12)))
+        filled: Rect = self.bar_rect.copy()
+        filled.width = self.bar_rect.width*loaded // max(total, 1)
+        pg.draw.rect(self.screen, self.settings.button_pressed_background_color, filled)
+        pg.draw.rect(self.screen, self.settings.text_color, self.bar_rect, 2)  # 2 means width of the outline.
+        pg.display.flip()
+
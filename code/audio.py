@@ -0,0 +1,157 @@
+"""
+This module provides an AudioManager object responsible for the music and sound effects.
+All effects are decoded once at startup into PCM in the mixer's format and kept in memory,
+so playing one only queues it for the next mixer buffer. The music is streamed by
+`pygame.mixer.music`, which decodes it chunk by chunk as the buffers are filled. Each
+effect category gets a fixed number of reserved mixer channels. If every channel of
+the category is busy, the oldest sound is stopped to make room for the new one (voice
+stealing). The buffer size is set in Settings and `measure_latency()` tells its cost.
+"""
+
+import os
+from statistics import median
+from time import perf_counter, sleep
+
+import pygame as pg
+from pygame.mixer import Channel, Sound
+
+
+class AudioManager():
+    """AudioManager object provides preloaded sound effects played on pooled channels."""
+
+    _SOUNDS_DIR: str = "../sounds"
+    _MUSIC: str = "infected_vibes.mp3"
+    # Effect name: (file name, category). Categories map to `Settings.sound_channels`.
+    _EFFECTS: dict[str, tuple[str, str]] = {
+        "fire": ("fire.wav", "weapons"),
+    }
+    # Posted by the mixer when the latency probe has been played.
+    _PROBE_EVENT: int = pg.event.custom_type()
+
+    def __init__(self, settings) -> None:
+        """
+        Initialise AudioManager object and the mixer. If the audio is disabled in settings,
+        the mixer is never touched.
+        """
+        self.settings = settings
+        self.enabled: bool = settings.audio_enabled
+        self.sounds: dict[str, Sound] = {}
+        self.channels: dict[str, list[Channel]] = {}
+        # The time each channel of a category started its current sound, the oldest one is stolen.
+        self._started: dict[str, list[float]] = {}
+        self.stolen_voices: int = 0
+        self._music_loaded: bool = False
+
+        if self.enabled and not pg.mixer.get_init():
+            try:
+                pg.mixer.init(settings.audio_frequency, -16, 2, settings.audio_buffer_size)
+            except pg.error:
+                # There is no audio device, so the game goes on without sound.
+                self.enabled = False
+
+    def effect_paths(self) -> list[str]:
+        """Returns the paths of the sound effects' files, e.g. to decode them in advance."""
+        return [os.path.join(self._SOUNDS_DIR, file) for file, _ in self._EFFECTS.values()]
+
+    def load(self, decoded: dict[str, Sound] | None = None) -> None:
+        """
+        Loads all sound effects and reserves mixer channels for each category.
+        The effects already decoded (by their paths, see `effect_paths()`) are not loaded again.
+        """
+        if self.enabled and not pg.mixer.get_init():
+            # There is no audio device, so the game goes on without sound.
+            self.enabled = False
+        if not self.enabled:
+            return
+
+        decoded = decoded or {}
+        for name, (file, _) in self._EFFECTS.items():
+            path: str = os.path.join(self._SOUNDS_DIR, file)
+            self.sounds[name] = decoded.get(path) or Sound(path)
+
+        # Reserved channels are never picked up automatically by `Sound.play()`.
+        channel_id: int = 0
+        categories: dict[str, int] = self.settings.sound_channels
+        pg.mixer.set_num_channels(max(pg.mixer.get_num_channels(), sum(categories.values())))
+        pg.mixer.set_reserved(sum(categories.values()))
+        for category, number in categories.items():
+            self.channels[category] = [Channel(channel_id + i) for i in range(number)]
+            self._started[category] = [0.0]*number
+            channel_id += number
+
+    def play_music(self) -> None:
+        """Plays the music in an infinite loop. The music is loaded on the first call, so it doesn't delay the startup."""
+        if not self.enabled:
+            return
+        if not self._music_loaded:
+            pg.mixer.music.load(os.path.join(self._SOUNDS_DIR, self._MUSIC))
+            pg.mixer.music.set_volume(self.settings.music_volume)
+            self._music_loaded = True
+        pg.mixer.music.play(-1)
+
+    def buffer_ms(self) -> float:
+        """Returns the duration of one mixer buffer in milliseconds, the audio lags behind by at least this."""
+        if not self.enabled:
+            return 0.0
+        return self.settings.audio_buffer_size*1000 / pg.mixer.get_init()[0]
+
+    def measure_latency(self, trials: int = 20, timeout_ms: float = 1000.0) -> dict[str, float]:
+        """
+        Measures how long a sound waits for the mixer. A silent probe of one sample is played
+        repeatedly, and the time until the mixer reports its end is the delay before a new
+        effect is mixed. The input-to-sound latency adds the buffer queued in the audio
+        device. It needs the display (for the events) and mustn't run during the game.
+        A probe whose end isn't reported within `timeout_ms` is lost, its delay is infinite.
+
+        Parameters
+        ----------
+        trials : `int`, default=20
+            The number of probes played.
+        timeout_ms : `float`, default=1000.0
+            The longest wait for the end of a probe, e.g. if the device stalls.
+        """
+        if not self.enabled:
+            return {}
+        probe: Sound = Sound(buffer=bytes(4))  # One 16-bit stereo sample of silence.
+        channel: Channel = pg.mixer.find_channel(True)
+        channel.set_endevent(self._PROBE_EVENT)
+        delays: list[float] = []
+        lost: int = 0
+        for _ in range(trials):
+            start: float = perf_counter()
+            channel.play(probe)
+            while not pg.event.get(self._PROBE_EVENT):
+                if (perf_counter() - start)*1000 > timeout_ms:
+                    channel.stop()
+                    pg.event.clear(self._PROBE_EVENT)  # Stopping the channel may post the end event.
+                    lost += 1
+                    delays.append(float("inf"))
+                    break
+                sleep(0.0002)
+            else:
+                delays.append((perf_counter() - start)*1000)
+        channel.set_endevent()
+        return {"buffer_ms": self.buffer_ms(), "mixer_ms": median(delays), "mixer_max_ms": max(delays),
+                "output_ms": median(delays) + self.buffer_ms(), "lost_probes": lost}
+
+    def play(self, name: str) -> None:
+        """
+        Plays the given sound effect on a free channel of its category.
+        If all channels are busy, the longest playing sound is replaced.
+        """
+        if not self.enabled:
+            return
+
+        category: str = self._EFFECTS[name][1]
+        channels: list[Channel] = self.channels[category]
+        started: list[float] = self._started[category]
+        for index, channel in enumerate(channels):
+            if not channel.get_busy():
+                break
+        else:
+            # Channels free up in any order, so the oldest sound is found by its start time.
+            index = started.index(min(started))
+            self.stolen_voices += 1
+
+        started[index] = perf_counter()
+        channels[index].play(self.sounds[name])
@@ -0,0 +1,263 @@
+"""
+Batch simulator for balancing the difficulty. It takes a grid of Settings parameters,
+runs many seeded headless games for each combination with a scripted or random player,
+and spreads the games over a ProcessPoolExecutor. Each finished game is written to
+a JSON Lines file at once, followed by a summary of outcomes and frame cost for each
+combination. The games are independent, so the throughput grows with the number of cores.
+
+Run in the `code` directory, e.g.:
+python batch_simulator.py --param speedup_scale=1.03,1.05,1.08 --param alien_allowed_bullets=1,2,3 \
+    --games 20 --workers 8 --output ../balance.jsonl
+"""
+
+import os
+import json
+import random
+import argparse
+import itertools
+from time import perf_counter
+from typing import Callable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import pygame as pg
+
+from game_state import GameState
+
+CODE_DIR: str = os.path.dirname(os.path.abspath(__file__))
+
+
+class ScriptedPolicy():
+    """
+    ScriptedPolicy object steers the spaceship below the lowest alien (or the general), 
+    dodges the bullets coming close and fires regularly.
+    """
+
+    DODGE_DISTANCE: int = 200
+
+    def __init__(self, fire_every: int = 6) -> None:
+        """Initialise ScriptedPolicy object, the policy is deterministic."""
+        self.fire_every: int = fire_every
+        self._direction: int = 0
+
+    def __call__(self, ai_game, frame: int) -> None:
+        """Posts the input for the given frame."""
+        ship = ai_game.player_ship
+        if ai_game.game_state.final_level_achieved:
+            target_x: int = ai_game.alien_general_ship.rect.centerx
+        elif ai_game.alien_soldier_ships:
+            # The lowest aliens are the most dangerous, the nearest of them is chosen.
+            target_x = min(ai_game.alien_soldier_ships, key=lambda alien: (
+                -alien.rect.bottom, abs(alien.rect.centerx - ship.rect.centerx))).rect.centerx
+        else:
+            target_x = ship.rect.centerx
+        # Stay still within a few pixels of the target.
+        direction: int = 0 if abs(target_x - ship.rect.centerx) < 10 else (1 if target_x > ship.rect.centerx else -1)
+        # Dodging an incoming bullet has priority.
+        danger_zone = ship.rect.inflate(ship.rect.width, self.DODGE_DISTANCE).move(0, -self.DODGE_DISTANCE // 2)
+        for bullet in itertools.chain(ai_game.alien_soldier_bullets, ai_game.alien_general_bullets):
+            if danger_zone.colliderect(bullet.rect):
+                direction = 1 if bullet.rect.centerx < ship.rect.centerx else -1
+                break
+        if direction != self._direction:
+            _press(pg.K_RIGHT, direction == 1)
+            _press(pg.K_LEFT, direction == -1)
+            self._direction = direction
+        if frame % self.fire_every == 0:
+            pg.event.post(pg.event.Event(pg.KEYDOWN, key=pg.K_SPACE))
+
+
+class RandomPolicy():
+    """RandomPolicy object changes the movement at random moments and fires at random."""
+
+    def __init__(self, seed: int, fire_probability: float = 0.1, turn_probability: float = 0.02) -> None:
+        """Initialise RandomPolicy object with its own generator, so the game's one isn't affected."""
+        self.rng: random.Random = random.Random(seed)
+        self.fire_probability: float = fire_probability
+        self.turn_probability: float = turn_probability
+
+    def __call__(self, ai_game, frame: int) -> None:
+        """Posts the input for the given frame."""
+        if self.rng.random() < self.turn_probability:
+            direction: int = self.rng.choice((-1, 0, 1))
+            _press(pg.K_RIGHT, direction == 1)
+            _press(pg.K_LEFT, direction == -1)
+        if self.rng.random() < self.fire_probability:
+            pg.event.post(pg.event.Event(pg.KEYDOWN, key=pg.K_SPACE))
+
+
+# A policy posts the input for each frame, `policy(ai_game, frame)`.
+Policy = Callable[[object, int], None]
+# Each policy's factory gets the game's seed, only the random policy uses it.
+POLICIES: dict[str, Callable[[int], Policy]] = {
+    "scripted": lambda seed: ScriptedPolicy(),
+    "random": RandomPolicy,
+}
+
+
+def _press(key: int, pressed: bool) -> None:
+    """Posts the key press or release."""
+    pg.event.post(pg.event.Event(pg.KEYDOWN if pressed else pg.KEYUP, key=key))
+
+
+def _init_worker() -> None:
+    """Prepares a worker process: the game loads its assets relative to the `code` directory."""
+    os.chdir(CODE_DIR)
+
+
+def simulate(job: dict) -> dict:
+    """
+    Plays one headless game and returns its outcome and frame cost.
+
+    Parameters
+    ----------
+    job : `dict`
+        "config" (Settings attributes to override), "difficulty" (1-3), "seed",
+        "policy" (a key of POLICIES) and "max_frames".
+    """
+    # Imported here, so that only the workers initialise pygame's display.
+    from alien_invasion import AlienInvasion
+    from settings import Settings
+
+    settings = Settings()
+    settings.headless = True
+    settings.profiling = True
+    settings.profiler_overlay = False
+    settings.profile_output = ""
+    settings.seed = job["seed"]
+    settings.switch_difficulty(job["difficulty"])
+    for name, value in job["config"].items():
+        setattr(settings, name, value)
+
+    ai_game = AlienInvasion(settings)
+    policy: Policy = POLICIES[job["policy"]](job["seed"])
+    ai_game.start_game()
+
+    start: float = perf_counter()
+    frames: int = 0
+    while frames < job["max_frames"] and ai_game.game_state.in_game:
+        ai_game.run_headless(1, lambda game, _: policy(game, frames))
+        frames += 1
+    elapsed: float = perf_counter() - start
+
+    outcome: str = "timeout"
+    if ai_game.game_state.state is GameState.COMPLETE:
+        outcome = "won"
+    elif ai_game.game_state.state is GameState.MENU:
+        outcome = "lost"
+    summary: dict = ai_game.profiler.summary()
+    return {
+        "type": "game",
+        "config": job["config"],
+        "seed": job["seed"],
+        "outcome": outcome,
+        "level": ai_game.stats.current_level,
+        "score": ai_game.stats.current_score,
+        "ticks": ai_game.ticks,
+        "frames_per_second": frames / max(elapsed, 1e-9),
+        "p50_ms": summary["p50_ms"],
+        "p99_ms": summary["p99_ms"],
+    }
+
+
+class ConfigStats():
+    """ConfigStats object aggregates the games of one parameters' combination."""
+
+    def __init__(self, config: dict) -> None:
+        """Initialise ConfigStats object."""
+        self.config: dict = config
+        self.games: int = 0
+        self.outcomes: dict[str, int] = {"won": 0, "lost": 0, "timeout": 0}
+        self.total_level: int = 0
+        self.total_score: int = 0
+        self.total_ticks: int = 0
+        self.total_fps: float = 0.0
+        self.worst_p99_ms: float = 0.0
+
+    def add(self, result: dict) -> None:
+        """Adds the result of one game."""
+        self.games += 1
+        self.outcomes[result["outcome"]] += 1
+        self.total_level += result["level"]
+        self.total_score += result["score"]
+        self.total_ticks += result["ticks"]
+        self.total_fps += result["frames_per_second"]
+        self.worst_p99_ms = max(self.worst_p99_ms, result["p99_ms"])
+
+    def summary(self) -> dict:
+        """Returns the win rate, averages and the worst p99 frame time."""
+        games: int = max(self.games, 1)
+        return {
+            "type": "summary",
+            "config": self.config,
+            "games": self.games,
+            "outcomes": self.outcomes,
+            "win_rate": self.outcomes["won"] / games,
+            "mean_level": self.total_level / games,
+            "mean_score": self.total_score / games,
+            "mean_ticks": self.total_ticks / games,
+            "mean_frames_per_second": self.total_fps / games,
+            "worst_p99_ms": self.worst_p99_ms,
+        }
+
+
+def parameter_grid(params: list[str]) -> list[dict]:
+    """Returns all combinations of parameters given as "name=value1,value2,..."."""
+    names: list[str] = []
+    values: list[list] = []
+    for param in params:
+        name, _, options = param.partition("=")
+        names.append(name)
+        values.append([json.loads(option) for option in options.split(",")])
+    return [dict(zip(names, combination)) for combination in itertools.product(*values)]
+
+
+def run_batch(configs: list[dict], games: int, output: str, workers: int | None = None,
+              difficulty: int = 2, policy: str = "scripted", max_frames: int = 40_000, seed: int = 0) -> list[dict]:
+    """
+    Runs `games` seeded games for each configuration in the process pool, writes each
+    result to the `output` file as soon as it's ready and returns the configurations' summaries.
+    """
+    jobs: list[dict] = [{"config": config, "difficulty": difficulty, "seed": seed + game,
+                         "policy": policy, "max_frames": max_frames}
+                        for config in configs for game in range(games)]
+    stats: dict[str, ConfigStats] = {json.dumps(config, sort_keys=True): ConfigStats(config) for config in configs}
+
+    start: float = perf_counter()
+    with open(output, "w", encoding="utf-8") as file, \
+            ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        futures = [executor.submit(simulate, job) for job in jobs]
+        for future in as_completed(futures):
+            result: dict = future.result()
+            stats[json.dumps(result["config"], sort_keys=True)].add(result)
+            file.write(json.dumps(result) + "\n")
+            file.flush()
+
+        summaries: list[dict] = [config_stats.summary() for config_stats in stats.values()]
+        for summary in summaries:
+            file.write(json.dumps(summary) + "\n")
+    elapsed: float = perf_counter() - start
+    print(f"Played {len(jobs)} games in {elapsed:.1f} s ({len(jobs) / elapsed:.2f} games/s).")
+    return summaries
+
+
+def parse_args() -> argparse.Namespace:
+    """Parses the command line options."""
+    parser = argparse.ArgumentParser(description="Alien Invasion batch simulator")
+    parser.add_argument("--param", action="append", default=[], metavar="NAME=V1,V2",
+                        help="Settings attribute and its values (JSON), can be repeated")
+    parser.add_argument("--games", type=int, default=10, help="games per combination")
+    parser.add_argument("--difficulty", type=int, default=2, choices=(1, 2, 3), help="base difficulty mode")
+    parser.add_argument("--policy", default="scripted", choices=tuple(POLICIES), help="the player's policy")
+    parser.add_argument("--max-frames", type=int, default=40_000, help="frames after which a game times out")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (all cores by default)")
+    parser.add_argument("--output", default="../balance.jsonl", help="JSON Lines results file")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args: argparse.Namespace = parse_args()
+    for line in run_batch(parameter_grid(args.param), args.games, args.output, args.workers,
+                          args.difficulty, args.policy, args.max_frames, args.seed):
+        print(f"{line['config']}: win rate {line['win_rate']:.0%}, mean level {line['mean_level']:.1f}, "
+              f"mean score {line['mean_score']:.0f}, worst p99 {line['worst_p99_ms']:.2f} ms")
@@ -1,69 +1,88 @@
 """
 This module provides PlayerBullet, AlienSoldierBullet and AlienGeneralBullet objects. 
 These objects are the most common in the game. Each of them inherits from Bullet, 
-the abstract base class. The Bullet inherits from Sprite.
+the abstract base class. The Bullet inherits from CompactSprite, which keeps the bullets' state in slots.
 """
 
-from random import choice
 from abc import ABCMeta, abstractmethod
 
-import pygame as pg
-from pygame.sprite import Sprite
 from pygame.surface import Surface
 from pygame.rect import Rect
 
+from asset_cache import assets
+from compact_sprite import CompactSprite
 
-class Bullet(Sprite, metaclass=ABCMeta):
+
+class Bullet(CompactSprite, metaclass=ABCMeta):
     """The Bullet class provide an abstract base class for the other objects."""
 
+    # The direction is a constant of each bullet class, the rest of the state is kept in slots.
+    __slots__ = ("image", "rect", "speed", "y")
+    direction: int
+    collision_type: str = "bullet"  # Chooses the collision test in Settings.
+
     @abstractmethod
-    def __init__(self, ai_game, img, direction, speed) -> None:
+    def __init__(self, ai_game, img, speed) -> None:
         """Initialise Bullet base object."""
         super().__init__()
-        self.image: Surface = pg.image.load(img).convert_alpha()
+        self.image: Surface = assets.get_image(img)
         self.rect: Rect = self.image.get_rect()
-        self.direction: int = direction
         # The bullet's speed is constant on each next gameplay level, so one can pass it in the `__init__()` method.
+        # A pooled bullet gets the current speed in the `reset()` method.
         self.speed: float = speed
         # Float type for the vertical position due to more accurate tracking.
         self.y: float
 
+    @abstractmethod
+    def reset(self, ai_game) -> None:
+        """Sets the bullet's speed and initial position. It's called again when the pool reuses the bullet."""
+
     def update(self, *args, **kwargs) -> None:  # Override the Sprite.update()
         """Updates the bullet's y-position by the speed defined in settings."""
         self.y += self.direction*self.speed
         self.rect.y = int(self.y)
 
+    def last_shift(self) -> tuple[float, float]:
+        """Returns the bullet's shift in the last simulation step."""
+        return 0.0, self.direction*self.speed
+
 
 class PlayerBullet(Bullet):
     """PlayerBullet provides a bullet which the player can fire."""
 
+    __slots__ = ()
     _IMG: str = "../assets/bullets/player_bullet.png"
-    _DIRECTION: int = -1  # The bullet moves to the top of the screen.
-    _SOUND: str = "../sounds/fire.wav"
+    direction: int = -1  # The bullet moves to the top of the screen.
 
     def __init__(self, ai_game) -> None:
         """Initialise PlayerBullet object."""
-        super().__init__(ai_game, self._IMG, self._DIRECTION, ai_game.settings.player_bullet_speed)
+        super().__init__(ai_game, self._IMG, ai_game.settings.player_bullet_speed)
+        self.reset(ai_game)
+
+    def reset(self, ai_game) -> None:
+        """Places the bullet on the top of the player's spaceship."""
+        self.speed = ai_game.settings.player_bullet_speed
         self.rect.midtop = ai_game.player_ship.rect.midtop
         self.y = float(self.rect.y)
-        self.fire_sound = pg.mixer.Sound(self._SOUND)
-
-    def play_sound(self) -> None:
-        """Plays the sound if the player fires a bullet."""
-        self.fire_sound.play()
 
 
 class AlienSoldierBullet(Bullet):
     """AlienSoldierBullet provides a bullet which the alien can fire."""
 
+    __slots__ = ()
     _IMG: str = "../assets/bullets/alien_bullet.png"
-    _DIRECTION: int = 1  # The bullet moves to the bottom of the screen.
+    direction: int = 1  # The bullet moves to the bottom of the screen.
 
     def __init__(self, ai_game) -> None:
         """Initialise AlienSoldierBullet object."""
-        super().__init__(ai_game, self._IMG, self._DIRECTION, ai_game.settings.alien_bullet_speed)
+        super().__init__(ai_game, self._IMG, ai_game.settings.alien_bullet_speed)
+        self.reset(ai_game)
+
+    def reset(self, ai_game) -> None:
+        """Places the bullet under a random alien ship."""
+        self.speed = ai_game.settings.alien_bullet_speed
         # The bullet initial position is associated with a random alien ship.
-        random_alien = choice(list(ai_game.alien_soldier_ships))
+        random_alien = ai_game.rng.choice(list(ai_game.alien_soldier_ships))
         self.rect.center = random_alien.rect.midbottom
         self.y = float(self.rect.y)
 
@@ -71,11 +90,17 @@ class AlienSoldierBullet(Bullet):
 class AlienGeneralBullet(Bullet):
     """AlienGeneralBullet provides a bullet which the alien's general can fire."""
 
+    __slots__ = ()
     _IMG: str = "../assets/bullets/general_bullet.png"
-    _DIRECTION: int = 1
+    direction: int = 1
 
     def __init__(self, ai_game) -> None:
         """Initialise AlienGeneralBullet object."""
-        super().__init__(ai_game, self._IMG, self._DIRECTION, ai_game.settings.alien_bullet_speed)
+        super().__init__(ai_game, self._IMG, ai_game.settings.alien_bullet_speed)
+        self.reset(ai_game)
+
+    def reset(self, ai_game) -> None:
+        """Places the bullet under the aliens' generalship."""
+        self.speed = ai_game.settings.alien_bullet_speed
         self.rect.center = ai_game.alien_general_ship.rect.midbottom
         self.y = float(self.rect.y)
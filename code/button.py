@@ -7,6 +7,8 @@ import pygame as pg
 from pygame.surface import Surface
 from pygame.rect import Rect
 
+from text_renderer import text_renderer
+
 
 class Button():
     """Button object provides communication with the player."""
@@ -37,7 +39,7 @@ class Button():
         self.pressed_color = self.settings.button_pressed_background_color
 
         fontsize: int = kwargs.get("fontsize", 48)
-        self.font = pg.font.SysFont("freesansbold", fontsize)
+        self.font = text_renderer.get_font(fontsize)
 
         self.rect: Rect = pg.Rect(0, 0, self.width, self.height)
         self.rect.center = self.screen_rect.center
@@ -0,0 +1,147 @@
+"""
+This module provides a MaskCache object, which builds one `pygame.mask.Mask` per image
+once, and a Collider object, the game's collision tests. Each test checks the rects first
+(optionally with the SpatialHash broadphase) and compares the cached masks only for the
+overlapping pairs, so the transparent corners of the images don't register hits. The
+pixel-perfect test is switched on for each entity type (ship, alien, bullet) in Settings;
+the other types collide by their whole rects.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pygame as pg
+from pygame.mask import Mask
+from pygame.sprite import Sprite
+from pygame.surface import Surface
+
+if TYPE_CHECKING:  # The spatial hash is imported only if it's enabled.
+    from spatial_hash import SpatialHash
+
+
+class MaskCache():
+    """MaskCache object holds the mask of each image, looked up by the image object."""
+
+    def __init__(self, images: dict[str, Surface]) -> None:
+        """
+        Build the masks of the given images.
+
+        Parameters
+        ----------
+        images : `dict[str, Surface]`
+            The images by their paths, e.g. `assets.cached_images()`.
+        """
+        self._masks: dict[int, Mask] = {id(image): pg.mask.from_surface(image) for image in images.values()}
+        # Kept alive, so the ids of the images created later can't be reused.
+        self._images: list[Surface] = list(images.values())
+        self._filled: dict[tuple[int, int], Mask] = {}
+
+    def mask(self, image: Surface) -> Mask:
+        """Returns the image's mask. An image which wasn't given at the start gets its mask now."""
+        mask: Mask | None = self._masks.get(id(image))
+        if mask is None:
+            mask = pg.mask.from_surface(image)
+            self._masks[id(image)] = mask
+            self._images.append(image)
+        return mask
+
+    def filled(self, size: tuple[int, int]) -> Mask:
+        """Returns a fully set mask of the given size, the shape of a rect."""
+        mask: Mask | None = self._filled.get(size)
+        if mask is None:
+            mask = Mask(size, fill=True)
+            self._filled[size] = mask
+        return mask
+
+
+class Collider():
+    """Collider object tests overlaps of sprites: rects first, the cached masks of pixel-perfect types then."""
+
+    def __init__(self, settings, masks: MaskCache, spatial_hash: SpatialHash | None = None) -> None:
+        """
+        Initialise Collider object.
+
+        Parameters
+        ----------
+        settings : `Settings`
+            Tells which entity types collide pixel-perfectly.
+        masks : `MaskCache`
+            The masks of the sprites' images.
+        spatial_hash : `SpatialHash`, optional
+            The broadphase of `groupcollide()`, whose own `groupcollide()` is used; without it,
+            each sprite is tested against the whole group.
+        """
+        self.masks: MaskCache = masks
+        self.spatial_hash: SpatialHash | None = spatial_hash
+        # Entity types (the sprites' `collision_type`) tested by their masks.
+        self.mask_types: set[str] = {collision_type for collision_type, enabled in (
+            ("ship", settings.ship_mask_collisions), ("alien", settings.alien_mask_collisions),
+            ("bullet", settings.bullet_mask_collisions)) if enabled}
+        # The number of mask tests performed since the start (for benchmarks).
+        self.mask_tests: int = 0
+
+    def collide(self, sprite_a: Sprite, sprite_b: Sprite) -> bool:
+        """Returns True if the sprites overlap, pixel-perfectly if any of them is of a pixel-perfect type."""
+        return sprite_a.rect.colliderect(sprite_b.rect) and self._masks_overlap(sprite_a, sprite_b)  # type: ignore
+
+    def spritecollideany(self, sprite: Sprite, group: pg.sprite.Group) -> Sprite | None:
+        """Works as `pygame.sprite.spritecollideany()`."""
+        if not group:
+            return None
+        for hit in self._collide_list(sprite, group.sprites()):
+            return hit
+        return None
+
+    def spritecollide(self, sprite: Sprite, group: pg.sprite.Group, dokill: bool) -> list[Sprite]:
+        """Works as `pygame.sprite.spritecollide()`."""
+        hits: list[Sprite] = self._collide_list(sprite, group.sprites())
+        if dokill:
+            for hit in hits:
+                hit.kill()
+        return hits
+
+    def groupcollide(self, group_a: pg.sprite.Group, group_b: pg.sprite.Group, dokill_a: bool,
+                     dokill_b: bool) -> dict[Sprite, list[Sprite]]:
+        """
+        Works as `pygame.sprite.groupcollide()`. With the spatial hash, its `groupcollide()`
+        finds the rect hits; otherwise, each sprite of `group_a` is tested against `group_b`'s rects.
+        """
+        if not group_a or not group_b:
+            return {}
+        if self.spatial_hash is not None:
+            return self.spatial_hash.groupcollide(group_a, group_b, dokill_a, dokill_b, self._masks_overlap)
+        collisions: dict[Sprite, list[Sprite]] = {}
+        sprites_b: list[Sprite] = group_b.sprites()
+        rects_b: list = [sprite.rect for sprite in sprites_b]
+        for sprite in group_a.sprites():
+            # A sprite killed by a previous hit is still in the list, so check if it's in the group.
+            hits: list[Sprite] = [sprites_b[index] for index in sprite.rect.collidelistall(rects_b)  # type: ignore
+                                  if group_b.has_internal(sprites_b[index])
+                                  and self._masks_overlap(sprite, sprites_b[index])]
+            if hits:
+                collisions[sprite] = hits
+                if dokill_b:
+                    for hit in hits:
+                        hit.kill()
+                if dokill_a:
+                    sprite.kill()
+        return collisions
+
+    def _collide_list(self, sprite: Sprite, sprites: list[Sprite]) -> list[Sprite]:
+        """Returns the sprites colliding with the given one. The rects are tested in one `collidelistall()` call."""
+        indices: list[int] = sprite.rect.collidelistall([member.rect for member in sprites])  # type: ignore
+        return [sprites[index] for index in indices if self._masks_overlap(sprite, sprites[index])]
+
+    def _masks_overlap(self, sprite_a: Sprite, sprite_b: Sprite) -> bool:
+        """Returns True if the masks of the sprites with overlapping rects overlap (rects for the other types)."""
+        a_masked: bool = getattr(sprite_a, "collision_type", None) in self.mask_types
+        b_masked: bool = getattr(sprite_b, "collision_type", None) in self.mask_types
+        if not (a_masked or b_masked):
+            return True
+        self.mask_tests += 1
+        rect_a = sprite_a.rect
+        rect_b = sprite_b.rect
+        mask_a: Mask = self.masks.mask(sprite_a.image) if a_masked else self.masks.filled(rect_a.size)  # type: ignore
+        mask_b: Mask = self.masks.mask(sprite_b.image) if b_masked else self.masks.filled(rect_b.size)  # type: ignore
+        return mask_a.overlap(mask_b, (rect_b.x - rect_a.x, rect_b.y - rect_a.y)) is not None  # type: ignore
@@ -0,0 +1,69 @@
+"""
+This module provides a CompactSprite class, a lighter base for the game entities.
+`pygame.sprite.Sprite` gives every instance its own set of groups, although the game's
+sprites belong to one group at most. CompactSprite keeps the groups in a tuple instead,
+so a sprite outside any group holds no extra object. Subclasses declare `__slots__`
+for their state. pygame's Sprite declares no `__slots__`, so the entities still have
+a `__dict__`, but it stays empty: what is saved is the set of groups and the attributes'
+dict entries, not the dict itself.
+"""
+
+from pygame.sprite import Sprite
+
+
+class CompactSprite(Sprite):
+    """CompactSprite object works as `pygame.sprite.Sprite` with a tuple of groups."""
+
+    __slots__ = ("_groups",)
+
+    def __init__(self, *groups) -> None:
+        """Initialise CompactSprite object and add it to the given groups."""
+        # Sprite.__init__() isn't called, it would create the set of groups.
+        self._groups: tuple = ()
+        if groups:
+            self.add(*groups)
+
+    def add(self, *groups) -> None:
+        """Adds the sprite to the groups it isn't already a member of."""
+        for group in groups:
+            if hasattr(group, "_spritegroup"):
+                if group not in self._groups:
+                    group.add_internal(self)
+                    self.add_internal(group)
+            else:
+                self.add(*group)
+
+    def remove(self, *groups) -> None:
+        """Removes the sprite from the given groups it's a member of."""
+        for group in groups:
+            if hasattr(group, "_spritegroup"):
+                if group in self._groups:
+                    group.remove_internal(self)
+                    self.remove_internal(group)
+            else:
+                self.remove(*group)
+
+    def add_internal(self, group) -> None:
+        """For adding this sprite to a group internally."""
+        self._groups += (group,)
+
+    def remove_internal(self, group) -> None:
+        """For removing this sprite from a group internally."""
+        self._groups = tuple(member for member in self._groups if member is not group)
+
+    def kill(self) -> None:
+        """Removes the sprite from all groups."""
+        for group in self._groups:
+            group.remove_internal(self)
+        self._groups = ()
+
+    def groups(self) -> list:
+        """Returns the list of groups which contain this sprite."""
+        return list(self._groups)
+
+    def alive(self) -> bool:
+        """Returns True if the sprite belongs to any group."""
+        return bool(self._groups)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} Sprite(in {len(self._groups)} groups)>"
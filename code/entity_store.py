@@ -0,0 +1,106 @@
+"""
+This module provides an EntityStore object, an optional NumPy backend for the sprites'
+kinematics. The store keeps positions and velocities of one group in arrays (structure
+of arrays) and moves the whole group in one vectorized step. Rects are synced back only
+when pygame needs them. The module is imported only if the backend is enabled in Settings,
+and if NumPy is not installed, the game uses the usual per-sprite updates.
+"""
+
+from typing import Callable
+
+from pygame.sprite import Sprite
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional.
+    np = None
+
+
+def vectorization_available() -> bool:
+    """Returns True if NumPy is installed and the vectorized backend can be used."""
+    return np is not None
+
+
+class EntityStore():
+    """EntityStore object keeps positions and velocities of a sprites' group in NumPy arrays."""
+
+    def __init__(self, velocity: Callable[[Sprite], tuple[float, float]], capacity: int = 64) -> None:
+        """
+        Initialise EntityStore object.
+
+        Parameters
+        ----------
+        velocity : `Callable[[Sprite], tuple[float, float]]`
+            Returns the base velocity of a sprite when it joins the store. The velocity
+            is multiplied by the scale given to the `step()` method, so the values shared
+            by the whole group (e.g. aliens' direction, stars' speed) stay in settings.
+        capacity : `int`, default=64
+            Initial size of the arrays. The arrays grow if there are more sprites.
+        """
+        self.velocity = velocity
+        self.size: int = 0
+        self.sprites: list[Sprite] = []
+        self.positions = np.zeros((capacity, 2), dtype=np.float64)
+        self.velocities = np.zeros((capacity, 2), dtype=np.float64)
+        self.dimensions = np.zeros((capacity, 2), dtype=np.int64)
+        # The position of each sprite in the arrays.
+        self._indices: dict[Sprite, int] = {}
+
+    def add(self, sprite: Sprite) -> None:
+        """Adds the sprite to the store. The float position is taken from the sprite's `x` and `y` if present."""
+        if self.size == len(self.positions):
+            self._grow()
+
+        index: int = self.size
+        rect = sprite.rect
+        self.positions[index] = getattr(sprite, "x", rect.x), getattr(sprite, "y", rect.y)  # type: ignore
+        self.velocities[index] = self.velocity(sprite)
+        self.dimensions[index] = rect.size  # type: ignore
+        self.sprites.append(sprite)
+        self._indices[sprite] = index
+        self.size += 1
+
+    def remove(self, sprite: Sprite) -> None:
+        """Removes the sprite from the store by moving the last sprite into its place."""
+        index: int = self._indices.pop(sprite)
+        last: int = self.size - 1
+        last_sprite: Sprite = self.sprites.pop()
+        if index != last:
+            self.positions[index] = self.positions[last]
+            self.velocities[index] = self.velocities[last]
+            self.dimensions[index] = self.dimensions[last]
+            self.sprites[index] = last_sprite
+            self._indices[last_sprite] = index
+        self.size = last
+
+    def step(self, scale_x: float = 1.0, scale_y: float = 1.0) -> None:
+        """Moves all sprites by their velocities multiplied by the given scale."""
+        n: int = self.size
+        self.positions[:n, 0] += self.velocities[:n, 0]*scale_x
+        self.positions[:n, 1] += self.velocities[:n, 1]*scale_y
+
+    def sync_rects(self) -> None:
+        """Writes the current positions back to the sprites' rects."""
+        for sprite, topleft in zip(self.sprites, self.positions[:self.size].astype(np.int64).tolist()):
+            sprite.rect.topleft = topleft  # type: ignore
+
+    def outside(self, top: float | None = None, bottom: float | None = None) -> list[Sprite]:
+        """
+        Returns sprites which are entirely above `top` (the rect's bottom <= top)
+        or below `bottom` (the rect's top >= bottom).
+        """
+        n: int = self.size
+        tops = self.positions[:n, 1].astype(np.int64)
+        mask = np.zeros(n, dtype=bool)
+        if top is not None:
+            mask |= tops + self.dimensions[:n, 1] <= top
+        if bottom is not None:
+            mask |= tops >= bottom
+        return [self.sprites[index] for index in np.flatnonzero(mask).tolist()]
+
+    def _grow(self) -> None:
+        """Doubles the size of the arrays."""
+        self.positions = np.concatenate((self.positions, np.zeros_like(self.positions)))
+        self.velocities = np.concatenate((self.velocities, np.zeros_like(self.velocities)))
+        self.dimensions = np.concatenate((self.dimensions, np.zeros_like(self.dimensions)))
+
@@ -0,0 +1,298 @@
+"""
+This module provides an AlienInvasionEnv object, a reinforcement-learning environment
+with the `reset()`/`step(action)` interface of Gym(nasium) around a headless game, and
+a VectorEnv object running several environments in parallel processes.
+
+Observations are NumPy arrays, either a compact feature vector (the spaceship's position,
+the aliens' occupancy grid and the bullets' positions) or a downscaled view of the screen.
+The screen is read through `pygame.surfarray.pixels3d()`, which references the surface's
+pixels without copying them, and only the downscaled pixels are copied into the observation.
+
+Run in the `code` directory, the game loads its assets relative to it, e.g.:
+env = AlienInvasionEnv(observation="pixels", frame_skip=4)
+observation, info = env.reset(seed=0)
+observation, reward, terminated, truncated, info = env.step(AlienInvasionEnv.FIRE)
+"""
+
+import os
+import multiprocessing
+from multiprocessing.connection import Connection
+
+import pygame as pg
+
+from game_state import GameState
+from settings import Settings
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, but the environment needs it.
+    np = None
+
+CODE_DIR: str = os.path.dirname(os.path.abspath(__file__))
+
+
+class AlienInvasionEnv():
+    """AlienInvasionEnv object plays one headless game, an episode lasts until the game ends."""
+
+    # Discrete actions: the spaceship's direction and whether to fire.
+    NOOP, LEFT, RIGHT, FIRE, LEFT_FIRE, RIGHT_FIRE = range(6)
+    ACTIONS: tuple[tuple[int, bool], ...] = ((0, False), (-1, False), (1, False), (0, True), (-1, True), (1, True))
+
+    # Layout of the feature vector.
+    GRID_ROWS: int = 12
+    GRID_COLUMNS: int = 16
+    MAX_BULLETS: int = 10  # Of each side, the nearest to the spaceship first.
+
+    def __init__(self, observation: str = "features", frame_skip: int = 4, pixel_scale: int = 8,
+                 life_penalty: float = 100.0, max_steps: int | None = None,
+                 settings: Settings | None = None) -> None:
+        """
+        Initialise AlienInvasionEnv object and its game.
+
+        Parameters
+        ----------
+        observation : `str`, default="features"
+            "features" for the feature vector, "pixels" for the downscaled screen.
+        frame_skip : `int`, default=4
+            The number of simulation steps for which each action is repeated.
+        pixel_scale : `int`, default=8
+            Every `pixel_scale`-th pixel of every `pixel_scale`-th row is observed.
+        life_penalty : `float`, default=100.0
+            Subtracted from the reward for each life lost.
+        max_steps : `int`, optional
+            The number of steps after which the episode is truncated.
+        settings : `Settings`, optional
+            The game's settings, the game is always headless and silent.
+        """
+        if np is None:
+            raise ImportError("AlienInvasionEnv needs NumPy for its observations.")
+        if observation not in ("features", "pixels"):
+            raise ValueError(f"Unknown observation type: {observation}.")
+        # Imported here, so that only the process playing the game initialises pygame's display.
+        from alien_invasion import AlienInvasion
+
+        self.settings: Settings = settings or Settings()
+        self.settings.headless = True
+        self.settings.profiling = False
+        self.settings.record_replay = ""
+        self.game = AlienInvasion(self.settings)
+        self.observation_type: str = observation
+        self.frame_skip: int = max(frame_skip, 1)
+        self.pixel_scale: int = max(pixel_scale, 1)
+        self.life_penalty: float = life_penalty
+        self.max_steps: int | None = max_steps
+        self.steps: int = 0
+
+        # The observation is written into the same buffer each step and copied only on return.
+        width, height = self.game.screen_rect.size
+        self.observation_shape: tuple[int, ...]
+        if observation == "pixels":
+            self.observation_shape = (-(-height // self.pixel_scale), -(-width // self.pixel_scale), 3)
+            self._buffer = np.zeros(self.observation_shape, dtype=np.uint8)
+        else:
+            self.observation_shape = (1 + self.GRID_ROWS*self.GRID_COLUMNS + 4 + 4*self.MAX_BULLETS,)
+            self._buffer = np.zeros(self.observation_shape, dtype=np.float32)
+        self._last_score: int = 0
+        self._last_lives: int = 0
+        self._last_general_life: int = 0
+
+    def reset(self, seed: int | None = None) -> tuple:
+        """Starts a new game, reseeded if `seed` is given. Returns the first observation and the info."""
+        self.game.restart(seed)
+        if self.game.starfield is not None:
+            # Scrolled from the start too, so a seed reproduces the pixel observations as well.
+            self.game.starfield.offsets = [0.0]*len(self.game.starfield.offsets)
+        self.steps = 0
+        self._last_score = self.game.stats.current_score
+        self._last_lives = self.game.stats.remaining_player_ships
+        self._last_general_life = self._general_life()
+        return self._observe(), self._info()
+
+    def step(self, action: int) -> tuple:
+        """
+        Repeats the action for `frame_skip` simulation steps (firing only in the first one).
+
+        Returns
+        -------
+        `tuple`
+            The observation, the reward, whether the game has ended (terminated),
+            whether `max_steps` was reached (truncated) and the info.
+        """
+        direction, fire = self.ACTIONS[action]
+        ship = self.game.player_ship
+        ship.moving_left = direction == -1
+        ship.moving_right = direction == 1
+        if fire:
+            self.game._fire_bullet("Player")
+        for _ in range(self.frame_skip):
+            self.game.run_headless(1)
+            # The game is over at the loss of the last life, the respawn delay before the menu isn't played.
+            if self.game.game_state.game_over or not self.game.game_state.in_game:
+                break
+        self.steps += 1
+
+        # The score rewards the soldiers, the damage of the general's life points rewards the final fight.
+        stats = self.game.stats
+        general_life: int = self._general_life()
+        reward: float = stats.current_score - self._last_score + max(self._last_general_life - general_life, 0)
+        reward -= self.life_penalty*max(self._last_lives - stats.remaining_player_ships, 0)
+        state: GameState = self.game.game_state.state
+        lost: bool = self.game.game_state.game_over or state is GameState.MENU
+        terminated: bool = lost or state is GameState.COMPLETE
+        if lost:
+            reward -= self.life_penalty  # The last life is lost too.
+        self._last_score = stats.current_score
+        self._last_lives = stats.remaining_player_ships
+        self._last_general_life = general_life
+        truncated: bool = not terminated and self.max_steps is not None and self.steps >= self.max_steps
+        return self._observe(), reward, terminated, truncated, self._info()
+
+    def close(self) -> None:
+        """Shuts pygame down."""
+        pg.quit()
+
+    def _general_life(self) -> int:
+        """Returns the alien general's life points, 0 outside the final fight (also after the general's death)."""
+        if self.game.game_state.final_level_achieved:
+            return max(self.game.alien_general_ship.life_points, 0)
+        return 0
+
+    def _info(self) -> dict:
+        """Returns the game's statistics."""
+        stats = self.game.stats
+        return {"score": stats.current_score, "level": stats.current_level,
+                "lives": stats.remaining_player_ships, "ticks": self.game.ticks,
+                "state": self.game.game_state.state.name}
+
+    def _observe(self):
+        """Returns a copy of the current observation."""
+        if self.observation_type == "pixels":
+            self._observe_pixels()
+        else:
+            self._observe_features()
+        return self._buffer.copy()
+
+    def _observe_pixels(self) -> None:
+        """Renders the frame and copies every `pixel_scale`-th pixel into the buffer, (height, width, RGB)."""
+        self.game._update_screen()
+        # The view locks the screen, it's released before anything else is drawn.
+        view = pg.surfarray.pixels3d(self.game.screen)
+        np.copyto(self._buffer, view[::self.pixel_scale, ::self.pixel_scale].transpose(1, 0, 2))
+        del view
+
+    def _observe_features(self) -> None:
+        """
+        Fills the feature vector, all values normalised to the screen size:
+        the spaceship's x, the aliens' occupancy grid, the general (present, x, y, life)
+        and (x, y) of the nearest alien and player bullets (-1 for missing bullets).
+        """
+        game = self.game
+        width, height = game.screen_rect.size
+        features = self._buffer
+        features.fill(0.0)
+        features[0] = game.player_ship.rect.centerx / width
+
+        cells: int = self.GRID_ROWS*self.GRID_COLUMNS
+        if game.alien_soldier_ships:
+            centers = np.array([alien.rect.center for alien in game.alien_soldier_ships], dtype=np.int32)
+            columns = np.clip(centers[:, 0]*self.GRID_COLUMNS // width, 0, self.GRID_COLUMNS - 1)
+            rows = np.clip(centers[:, 1]*self.GRID_ROWS // height, 0, self.GRID_ROWS - 1)
+            features[1 + rows*self.GRID_COLUMNS + columns] = 1.0
+
+        general: int = 1 + cells
+        if game.game_state.final_level_achieved:
+            rect = game.alien_general_ship.rect
+            features[general:general + 4] = (1.0, rect.centerx / width, rect.centery / height,
+                                             game.alien_general_ship.life_points / self.settings.alien_general_life_points)
+
+        bullets: int = general + 4
+        alien_bullets: list = [*game.alien_soldier_bullets, *game.alien_general_bullets]
+        self._fill_bullets(bullets, alien_bullets, lambda rect: -rect.bottom)
+        self._fill_bullets(bullets + 2*self.MAX_BULLETS, game.player_bullets.sprites(), lambda rect: rect.top)
+
+    def _fill_bullets(self, start: int, bullets: list, order) -> None:
+        """Writes (x, y) of up to MAX_BULLETS bullets sorted by `order(rect)` from `start`."""
+        width, height = self.game.screen_rect.size
+        slots = self._buffer[start:start + 2*self.MAX_BULLETS].reshape(self.MAX_BULLETS, 2)
+        slots.fill(-1.0)
+        nearest: list = sorted(bullets, key=lambda bullet: order(bullet.rect))[:self.MAX_BULLETS]
+        if nearest:
+            slots[:len(nearest)] = [(bullet.rect.centerx / width, bullet.rect.centery / height) for bullet in nearest]
+
+
+def _worker(connection: Connection, env_kwargs: dict) -> None:
+    """Runs one environment in a worker process and executes the commands sent through the pipe."""
+    os.chdir(CODE_DIR)
+    env = AlienInvasionEnv(**env_kwargs)
+    while True:
+        command, argument = connection.recv()
+        if command == "step":
+            observation, reward, terminated, truncated, info = env.step(argument)
+            if terminated or truncated:
+                # The finished episode's last observation is kept in the info, as Gymnasium does.
+                info["final_observation"] = observation
+                observation, _ = env.reset()
+            connection.send((observation, reward, terminated, truncated, info))
+        elif command == "reset":
+            connection.send(env.reset(argument))
+        elif command == "close":
+            env.close()
+            connection.close()
+            return
+
+
+class VectorEnv():
+    """
+    VectorEnv object steps several environments in worker processes at once. An environment
+    whose episode has ended is reset automatically, so `step()` can be called indefinitely.
+    """
+
+    def __init__(self, num_envs: int, **env_kwargs) -> None:
+        """
+        Initialise VectorEnv object and start a worker process for each environment.
+
+        Parameters
+        ----------
+        num_envs : `int`
+            The number of environments (processes).
+        **env_kwargs
+            The arguments of each AlienInvasionEnv.
+        """
+        if np is None:
+            raise ImportError("VectorEnv needs NumPy for its observations.")
+        self.num_envs: int = num_envs
+        self._connections: list[Connection] = []
+        self._processes: list = []
+        for _ in range(num_envs):
+            parent, child = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=_worker, args=(child, env_kwargs), daemon=True)
+            process.start()
+            child.close()
+            self._connections.append(parent)
+            self._processes.append(process)
+
+    def reset(self, seed: int | None = None) -> tuple:
+        """Resets all environments, seeded with `seed`, `seed + 1`, ... if it's given. Returns the stacked observations and the infos."""
+        for index, connection in enumerate(self._connections):
+            connection.send(("reset", None if seed is None else seed + index))
+        observations, infos = zip(*(connection.recv() for connection in self._connections))
+        return np.stack(observations), list(infos)
+
+    def step(self, actions) -> tuple:
+        """Steps each environment with its action. Returns the stacked observations, rewards and flags, and the infos."""
+        for connection, action in zip(self._connections, actions):
+            connection.send(("step", int(action)))
+        observations, rewards, terminated, truncated, infos = zip(
+            *(connection.recv() for connection in self._connections))
+        return (np.stack(observations), np.array(rewards, dtype=np.float32),
+                np.array(terminated), np.array(truncated), list(infos))
+
+    def close(self) -> None:
+        """Stops the worker processes."""
+        for connection in self._connections:
+            connection.send(("close", None))
+            connection.close()
+        for process in self._processes:
+            process.join()
+        self._connections = []
+        self._processes = []
@@ -0,0 +1,38 @@
+"""
+This module provides an EventBus object, which delivers the gameplay events (an alien
+killed, the fleet cleared, the player's ship hit, ...) to the subscribed handlers.
+The events are published at the moment they happen, so the reactions to them (a new
+level, the scoreboard's update) don't have to be checked every frame.
+"""
+
+from enum import Enum, auto
+from typing import Callable
+
+
+class GameEvent(Enum):
+    """Gameplay events, the arguments passed to the handlers are given in the comments."""
+
+    GAME_STARTED = auto()  # No arguments.
+    ALIEN_KILLED = auto()  # The number of aliens killed in one step.
+    FLEET_CLEARED = auto()  # No arguments.
+    LEVEL_UP = auto()  # The new level.
+    SHIP_HIT = auto()  # The remaining player's ships.
+    GENERAL_DEFEATED = auto()  # No arguments.
+    SCORES_LOADED = auto()  # No arguments.
+
+
+class EventBus():
+    """EventBus object calls the handlers subscribed to an event synchronously, in the order of subscription."""
+
+    def __init__(self) -> None:
+        """Initialise EventBus object."""
+        self._handlers: dict[GameEvent, list[Callable[..., None]]] = {event: [] for event in GameEvent}
+
+    def subscribe(self, event: GameEvent, handler: Callable[..., None]) -> None:
+        """Calls the handler with the event's arguments whenever the event is published."""
+        self._handlers[event].append(handler)
+
+    def publish(self, event: GameEvent, *args) -> None:
+        """Calls the event's handlers with the given arguments."""
+        for handler in self._handlers[event]:
+            handler(*args)
@@ -0,0 +1,191 @@
+"""
+This module provides an AlienFleet object, the sprite group of alien soldiers moved as
+one block. The soldiers move in lockstep, so the fleet stores one offset of the formation
+and a bitmap of the occupied cells of its grid instead of a position per alien. Moving,
+dropping and finding the fleet's edges don't depend on the number of aliens, the aliens'
+rects are derived from the offset only when the sprites are read (drawing, bullets fired
+from them), and bullets hit the aliens found by a lookup of the cells under them.
+"""
+
+from typing import Callable
+
+import pygame as pg
+from pygame.sprite import Sprite
+from pygame.rect import Rect
+
+
+class AlienFleet(pg.sprite.Group):
+    """AlienFleet object keeps the aliens in a grid which moves by a single offset."""
+
+    def __init__(self) -> None:
+        """Initialise AlienFleet object, the aliens are created by `create()`."""
+        super().__init__()
+        # The top-left corner of the grid's first cell; x is a float for more accurate tracking.
+        self.x: float = 0.0
+        self.y: int = 0
+        self.speed: float = 0.0
+        self.columns: int = 0
+        self.cell_width: int = 0
+        self.cell_height: int = 0
+        self.alien_width: int = 0
+        self.alien_height: int = 0
+        # One bit per column in each row's mask, set if the cell holds a living alien.
+        self.occupancy: list[int] = []
+        self._grid: list[Sprite | None] = []
+        self._cells: dict[Sprite, int] = {}
+        # The first and the last occupied column and row, None if they must be found again.
+        self._extents: tuple[int, int, int, int] | None = None
+        self._rects_synced: bool = True
+
+    def create(self, alien_factory: Callable[[], Sprite], origin: tuple[float, int], rows: int, columns: int,
+               spacing: int, speed: float) -> None:
+        """
+        Replaces the fleet with a full grid of new aliens.
+
+        Parameters
+        ----------
+        alien_factory : `Callable[[], Sprite]`
+            Returns a new alien, all aliens have the same size.
+        origin : `tuple[float, int]`
+            The top-left corner of the first alien.
+        rows, columns : `int`
+            The size of the grid.
+        spacing : `int`
+            The distance between the top-left corners of neighbouring aliens.
+        speed : `float`
+            The fleet's horizontal speed, its direction is given to `move()`.
+        """
+        self.empty()
+        self.x, self.y = origin
+        self.speed = speed
+        self.columns = columns
+        self.cell_width = self.cell_height = spacing
+        self.occupancy = [(1 << columns) - 1]*rows
+        self._grid = []
+        for index in range(rows*columns):
+            alien: Sprite = alien_factory()
+            self._grid.append(alien)
+            self._cells[alien] = index
+            self.add(alien)
+        if self._grid:
+            self.alien_width, self.alien_height = self._grid[0].rect.size  # type: ignore
+        self._extents = None
+        self._rects_synced = False
+
+    def remove_internal(self, sprite: Sprite) -> None:  # Override the Group.remove_internal()
+        """Removes the alien from the group and clears its cell."""
+        super().remove_internal(sprite)
+        index: int | None = self._cells.pop(sprite, None)
+        if index is not None:
+            self._grid[index] = None
+            self.occupancy[index // self.columns] &= ~(1 << (index % self.columns))
+            self._extents = None
+
+    def empty(self) -> None:  # Override the Group.empty()
+        """Removes all aliens without deriving their positions first."""
+        for sprite in list(self.spritedict):
+            self.remove_internal(sprite)
+            sprite.remove_internal(self)
+
+    def sprites(self) -> list[Sprite]:  # Override the Group.sprites()
+        """Returns the aliens with their rects placed at the current offset. Iterating the group uses it too."""
+        self.sync_rects()
+        return super().sprites()
+
+    # Group's __len__() and __bool__() call sprites(), which would derive the positions.
+    def __len__(self) -> int:  # Override the Group.__len__()
+        return len(self.spritedict)
+
+    def __bool__(self) -> bool:  # Override the Group.__bool__()
+        return bool(self.spritedict)
+
+    def copy(self) -> pg.sprite.Group:  # Override the Group.copy()
+        """Returns a plain Group with the same aliens, so the copy doesn't affect the grid."""
+        return pg.sprite.Group(self.sprites())
+
+    def sync_rects(self) -> None:
+        """Writes the aliens' positions derived from the fleet's offset to their rects, if it moved since."""
+        if self._rects_synced:
+            return
+        left: int = int(self.x)
+        columns: int = self.columns
+        for alien, index in self._cells.items():
+            alien.rect.topleft = (left + (index % columns)*self.cell_width,  # type: ignore
+                                  self.y + (index // columns)*self.cell_height)
+        self._rects_synced = True
+
+    def move(self, direction: float) -> None:
+        """Moves the whole fleet horizontally by its speed in the given direction."""
+        self.x += direction*self.speed
+        self._rects_synced = False
+
+    def drop(self, dy: int) -> None:
+        """Moves the whole fleet down by `dy` pixels."""
+        self.y += dy
+        self._rects_synced = False
+
+    def bounds(self) -> tuple[int, int, int, int]:
+        """Returns the left, top, right and bottom edges of the rect containing all aliens. The fleet mustn't be empty."""
+        if self._extents is None:
+            occupied_columns: int = 0
+            occupied_rows: list[int] = []
+            for row, mask in enumerate(self.occupancy):
+                if mask:
+                    occupied_columns |= mask
+                    occupied_rows.append(row)
+            self._extents = ((occupied_columns & -occupied_columns).bit_length() - 1,
+                             occupied_rows[0], occupied_columns.bit_length() - 1, occupied_rows[-1])
+        first_column, first_row, last_column, last_row = self._extents
+        left: int = int(self.x)
+        return (left + first_column*self.cell_width, self.y + first_row*self.cell_height,
+                left + last_column*self.cell_width + self.alien_width,
+                self.y + last_row*self.cell_height + self.alien_height)
+
+    def aliens_at(self, rect: Rect) -> list[Sprite]:
+        """Returns the aliens whose rects overlap the given rect, only the cells under it are looked up."""
+        left: int = int(self.x)
+        # An alien in column c covers [left + c*cell_width, left + c*cell_width + alien_width).
+        first_column: int = max((rect.left - left - self.alien_width) // self.cell_width + 1, 0)
+        last_column: int = min((rect.right - 1 - left) // self.cell_width, self.columns - 1)
+        first_row: int = max((rect.top - self.y - self.alien_height) // self.cell_height + 1, 0)
+        last_row: int = min((rect.bottom - 1 - self.y) // self.cell_height, len(self.occupancy) - 1)
+        hits: list[Sprite] = []
+        for row in range(first_row, last_row + 1):
+            mask: int = self.occupancy[row]
+            for column in range(first_column, last_column + 1):
+                if mask >> column & 1:
+                    hits.append(self._grid[row*self.columns + column])  # type: ignore
+        return hits
+
+    def _hits(self, sprite: Sprite, collide: Callable[[Sprite, Sprite], bool] | None) -> list[Sprite]:
+        """Returns the aliens overlapping the sprite's rect, narrowed by the `collide(sprite, alien)` test if given."""
+        hits: list[Sprite] = self.aliens_at(sprite.rect)  # type: ignore
+        if hits and collide is not None:
+            # The exact test needs the aliens' rects.
+            self.sync_rects()
+            hits = [alien for alien in hits if collide(sprite, alien)]
+        return hits
+
+    def collide_any(self, sprite: Sprite, collide: Callable[[Sprite, Sprite], bool] | None = None) -> bool:
+        """Returns True if any alien overlaps the sprite (by the rects, or by the `collide` test if given)."""
+        return bool(self) and bool(self._hits(sprite, collide))
+
+    def collide_bullets(self, bullets: pg.sprite.Group, dokill_bullets: bool = True, dokill_aliens: bool = True,
+                        collide: Callable[[Sprite, Sprite], bool] | None = None) -> dict[Sprite, list[Sprite]]:
+        """
+        Works as `pygame.sprite.groupcollide(bullets, fleet, ...)` with the aliens found by the cell lookup.
+        The rect candidates are narrowed by the `collide(bullet, alien)` test if it's given.
+        """
+        collisions: dict[Sprite, list[Sprite]] = {}
+        if not self:
+            return collisions
+        for bullet in bullets.sprites():
+            hits: list[Sprite] = self._hits(bullet, collide)
+            if hits:
+                collisions[bullet] = hits
+                if dokill_aliens:
+                    for alien in hits:
+                        alien.kill()
+                if dokill_bullets:
+                    bullet.kill()
+        return collisions
@@ -0,0 +1,53 @@
+"""
+This module provides a FixedStepScheduler object, which separates the simulation
+from rendering. The simulation always advances in fixed steps, while rendering
+runs as fast as it can and draws positions interpolated between the last two steps.
+"""
+
+
+class FixedStepScheduler():
+    """FixedStepScheduler object decides how many simulation steps to run in each rendered frame."""
+
+    def __init__(self, tick_rate: int, max_catch_up_steps: int) -> None:
+        """
+        Initialise FixedStepScheduler object.
+
+        Parameters
+        ----------
+        tick_rate : `int`
+            The number of simulation steps per second.
+        max_catch_up_steps : `int`
+            The maximum number of simulation steps run in one frame. If the game falls
+            further behind, the remaining time is dropped and the gameplay slows down
+            instead of freezing the renderer.
+        """
+        self.step_ms: float = 1000 / tick_rate
+        self.max_catch_up_steps: int = max_catch_up_steps
+        self.accumulator: float = 0.0
+        self.dropped_steps: int = 0
+
+    def advance(self, frame_ms: float) -> int:
+        """Adds the duration of the last frame and returns the number of simulation steps to run."""
+        self.accumulator += frame_ms
+        steps: int = int(self.accumulator // self.step_ms)
+        if steps > self.max_catch_up_steps:
+            self.dropped_steps += steps - self.max_catch_up_steps
+            steps = self.max_catch_up_steps
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= steps*self.step_ms
+        return steps
+
+    @property
+    def alpha(self) -> float:
+        """The fraction of the next simulation step already elapsed, used for interpolation."""
+        return self.accumulator / self.step_ms
+
+
+def interpolate(rect, shift: tuple[float, float], alpha: float) -> tuple[int, int]:
+    """
+    Returns the top-left corner of the rect interpolated between the previous and the current
+    simulation step. The previous position is the current one minus the last step's shift.
+    """
+    back: float = 1.0 - alpha
+    return int(rect.x - shift[0]*back), int(rect.y - shift[1]*back)
@@ -0,0 +1,88 @@
+"""
+This module provides the game states and a GameStateMachine object, which switches
+between them. Timed transitions (e.g. the respawn pause after the spaceship is hit)
+are counted in simulation steps, not in wall-clock time, so the main loop keeps
+pumping events and rendering, and headless runs pass them without waiting.
+"""
+
+from enum import Enum, auto
+
+
+class GameState(Enum):
+    """Primary states of the game."""
+
+    MENU = auto()
+    SOLDIERS_FIGHT = auto()  # The usual levels with the alien soldiers fleet.
+    GENERAL_FIGHT = auto()  # The final level with the alien general.
+    PAUSED = auto()
+    RESPAWN = auto()  # A short break after the spaceship has been hit.
+    COMPLETE = auto()  # The alien general has been defeated.
+
+
+class GameStateMachine():
+    """GameStateMachine object tracks the current game state and performs timed transitions."""
+
+    _FIGHTS: tuple[GameState, ...] = (GameState.SOLDIERS_FIGHT, GameState.GENERAL_FIGHT)
+
+    def __init__(self) -> None:
+        """Initialise GameStateMachine object."""
+        self.state: GameState = GameState.MENU
+        # The fight in progress, the game returns to it after a pause or a respawn.
+        self.fight: GameState | None = None
+        self._remaining_steps: int = 0
+        self._next_state: GameState | None = None
+
+    def enter(self, state: GameState, steps: int = 0, next_state: GameState | None = None) -> None:
+        """
+        Switches to the given state.
+
+        Parameters
+        ----------
+        state : `GameState`
+            The new state.
+        steps : `int`, default=0
+            If positive, the machine switches to `next_state` after this number of simulation steps.
+        next_state : `GameState`, optional
+            The state entered when the timer runs out. The current fight is resumed by default.
+        """
+        self.state = state
+        if state in self._FIGHTS:
+            self.fight = state
+        elif state in (GameState.MENU, GameState.COMPLETE):
+            self.fight = None
+        self._remaining_steps = steps
+        self._next_state = next_state
+
+    def update(self) -> None:
+        """Advances the timer of a timed state by one simulation step."""
+        if self._remaining_steps > 0:
+            self._remaining_steps -= 1
+            if self._remaining_steps == 0:
+                self.enter(self._next_state or self.fight or GameState.MENU)
+
+    def toggle_pause(self) -> None:
+        """Pauses the current fight or resumes the paused one."""
+        if self.state in self._FIGHTS:
+            self.enter(GameState.PAUSED)
+        elif self.state is GameState.PAUSED:
+            self.enter(self.fight)  # type: ignore
+
+    @property
+    def in_game(self) -> bool:
+        """True from the start of the game until it returns to the menu or is complete."""
+        return self.state not in (GameState.MENU, GameState.COMPLETE)
+
+    @property
+    def game_over(self) -> bool:
+        """True in the respawn delay after the last life is lost, before the return to the menu."""
+        return self.state is GameState.RESPAWN and self._next_state is GameState.MENU
+
+    @property
+    def fighting(self) -> bool:
+        """True if the simulation of bullets and aliens is running."""
+        return self.state in self._FIGHTS
+
+    @property
+    def final_level_achieved(self) -> bool:
+        """True if the fight in progress is the final one with the alien general."""
+        return self.fight is GameState.GENERAL_FIGHT
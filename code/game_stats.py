@@ -19,3 +19,11 @@ class GameStats():
         self.current_score = 0
         self.current_level = 1
         self.remaining_player_ships = self.settings.player_ships_limit
+
+    def load_highest_score(self, scores) -> None:
+        """
+        Sets the best score to the best one of the current difficulty mode saved in the given
+        ScoreStore (if it isn't None), unless this game's score is higher.
+        """
+        if scores is not None:
+            self.highest_score = max(scores.best_score(self.settings.difficulty), self.current_score)
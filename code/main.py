@@ -1,9 +1,95 @@
 """
-Main module with the instance of the game.
+Main module with the instance of the game. The game's modules are imported only after
+the command line has been parsed, so `--help` doesn't wait for pygame, and the startup
+report measures their imports too.
 """
 
-from alien_invasion import AlienInvasion
+import argparse
+from time import perf_counter
+
+from startup import ImportTimer, startup_report
+
+
+def parse_args() -> argparse.Namespace:
+    """Parses the command line options."""
+    parser = argparse.ArgumentParser(description="Alien Invasion Game")
+    parser.add_argument("--headless", action="store_true",
+                        help="run the simulation without a window and audio as fast as possible")
+    parser.add_argument("--frames", type=int, default=10_000,
+                        help="number of simulation steps in the headless mode")
+    parser.add_argument("--profile", action="store_true",
+                        help="measure the frame time and dump it to profile.csv/json on exit")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="seed of the game's random number generator")
+    parser.add_argument("--record", metavar="PATH", default="",
+                        help="record the player's input to a replay file")
+    parser.add_argument("--replay", metavar="PATH", default="",
+                        help="re-run a recorded session headlessly at maximum speed")
+    parser.add_argument("--audio-buffer", type=int, choices=(256, 512, 1024, 2048, 4096), default=None,
+                        help="samples per mixer buffer, smaller buffers lower the audio latency")
+    parser.add_argument("--startup-report", action="store_true",
+                        help="print the import times and the startup steps after the first frame and exit")
+    return parser.parse_args()
+
+
+def replay(args: argparse.Namespace, settings) -> None:
+    """Re-runs the recorded session with the recorded seed and screen size and prints its timing."""
+    from alien_invasion import AlienInvasion
+    from replay import ReplayPlayer
+
+    player: ReplayPlayer = ReplayPlayer(args.replay)
+    settings.headless = True
+    settings.seed = player.seed
+    settings.screen_width, settings.screen_height = player.screen_size
+
+    ai: AlienInvasion = AlienInvasion(settings)
+    start: float = perf_counter()
+    ai.run_headless(player.length, player.post_events)
+    elapsed: float = perf_counter() - start
+    print(f"Replayed {player.length} frames ({len(player.events)} events) in {elapsed:.2f} s "
+          f"({player.length / max(elapsed, 1e-9):.0f} frames/s), final score {ai.stats.current_score:,}.")
+    if args.profile:
+        summary: dict = ai.profiler.summary()
+        print(f"Frame time p50: {summary['p50_ms']:.2f} ms, p99: {summary['p99_ms']:.2f} ms.")
+
+
+def main() -> None:
+    """Runs the game, the headless simulation, a replay or the startup report given by the command line."""
+    args: argparse.Namespace = parse_args()
+    timer: ImportTimer | None = None
+    if args.startup_report:
+        timer = ImportTimer()
+        timer.install()
+    from alien_invasion import AlienInvasion
+    from settings import Settings
+    if timer is not None:
+        timer.uninstall()
+
+    settings: Settings = Settings()
+    settings.headless = args.headless
+    settings.profiling = args.profile
+    settings.seed = args.seed
+    settings.record_replay = args.record
+    if args.audio_buffer is not None:
+        settings.audio_buffer_size = args.audio_buffer
+
+    if args.replay:
+        replay(args, settings)
+        return
+    ai: AlienInvasion = AlienInvasion(settings)
+    if timer is not None:
+        # One rendered frame ends the startup.
+        ai.run_headless(1, render=True)
+        print(startup_report(timer, ai.profiler.startup_ms))
+    elif args.headless:
+        ai.start_game()
+        start: float = perf_counter()
+        ai.run_headless(args.frames)
+        elapsed: float = perf_counter() - start
+        print(f"Simulated {args.frames} frames in {elapsed:.2f} s ({args.frames / elapsed:.0f} frames/s).")
+    else:
+        ai.run_game()
+
 
 if __name__ == "__main__":
-    ai: AlienInvasion = AlienInvasion()
-    ai.run_game()
+    main()
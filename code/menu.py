@@ -2,13 +2,11 @@
 This module provides a Menu object, which provides an interactive GUI.
 """
 
-import textwrap
-
-import pygame as pg
 from pygame.surface import Surface
 from pygame.rect import Rect
 
 from button import Button
+from text_renderer import text_renderer
 
 
 class Menu():
@@ -105,16 +103,15 @@ class Menu():
 
         text: str = self.messages_to_draw.get(message_key, "There is no such key.")
         max_width: int = kwargs.get("max_width", 60)
-        text_lines: list[str] = textwrap.wrap(text, max_width)
         vertical_offset: int = kwargs.get("vertical_offset", 42)
 
         text_color = kwargs.get("color", self.settings.text_color)
         background = self.settings.background_color
         fontsize: int = kwargs.get("fontsize", 42)
-        font = pg.font.SysFont("freesansbold", fontsize)
+        # The lines are wrapped and rendered only once, then taken from the cache.
+        text_lines: list[Surface] = text_renderer.render_lines(text, fontsize, text_color, background, max_width)
 
-        for line_number, text_line in enumerate(text_lines):
-            line_img: Surface = font.render(text_line, True, text_color, background)
+        for line_number, line_img in enumerate(text_lines):
             line_rect: Rect = line_img.get_rect()
             line_rect.center = self.screen_rect.center
             if "ypos" in kwargs:
@@ -0,0 +1,134 @@
+"""
+This module provides a FrameProfiler object, which measures where the frame time goes.
+The game loop marks the end of each phase (events, stars, bullets, collisions, aliens,
+drawing and flipping), and the time since the previous mark is added to that phase.
+Frame times are kept in a rolling histogram, which gives p50/p99 cheaply. The profiler
+can draw an overlay with these values and dump the collected data to CSV and JSON files.
+"""
+
+from collections import deque
+from time import perf_counter_ns
+
+import pygame as pg
+from pygame.surface import Surface
+from pygame.rect import Rect
+
+from text_renderer import text_renderer
+
+
+class FrameProfiler():
+    """FrameProfiler object times each phase of the game loop with low overhead."""
+
+    PHASES: tuple[str, ...] = ("events", "stars", "bullets", "collisions", "aliens", "draw", "flip")
+    _BIN_MS: float = 0.05  # Width of one histogram bin.
+    _BINS: int = 2000  # Frames longer than 100 ms land in the last bin.
+    _OVERLAY_REFRESH_FRAMES: int = 30  # The overlay text is rendered again every 30 frames.
+
+    def __init__(self, enabled: bool, window: int = 1000, history: int = 100_000) -> None:
+        """
+        Initialise FrameProfiler object.
+
+        Parameters
+        ----------
+        enabled : `bool`
+            If False, all methods return immediately.
+        window : `int`, default=1000
+            The number of last frames in the rolling histogram.
+        history : `int`, default=100_000
+            The number of last frames kept for the CSV dump.
+        """
+        self.enabled: bool = enabled
+        self.frames: int = 0
+        self._frame_start: int = 0
+        self._last_mark: int = 0
+        self._phase_ns: dict[str, int] = dict.fromkeys(self.PHASES, 0)
+        self.total_phase_ns: dict[str, int] = dict.fromkeys(self.PHASES, 0)
+
+        self._window: deque[int] = deque(maxlen=window)
+        self.histogram: list[int] = [0]*self._BINS
+        self.history: deque[tuple] = deque(maxlen=history)
+        self.entities: int = 0
+        # Durations of the startup steps in milliseconds, e.g. the time to the first frame.
+        self.startup_ms: dict[str, float] = {}
+
+        self._font = None
+        self._overlay_img: Surface | None = None
+
+    def begin_frame(self) -> None:
+        """Starts measuring a new frame."""
+        if not self.enabled:
+            return
+        self._frame_start = self._last_mark = perf_counter_ns()
+
+    def mark(self, phase: str) -> None:
+        """Adds the time elapsed since the previous mark to the given phase."""
+        if not self.enabled:
+            return
+        now: int = perf_counter_ns()
+        self._phase_ns[phase] += now - self._last_mark
+        self._last_mark = now
+
+    def end_frame(self, entities: int) -> None:
+        """Finishes the frame and adds it to the histogram and the history."""
+        if not self.enabled:
+            return
+        frame_ns: int = perf_counter_ns() - self._frame_start
+        bin_index: int = min(int(frame_ns / 1e6 / self._BIN_MS), self._BINS - 1)
+        if len(self._window) == self._window.maxlen:
+            self.histogram[self._window[0]] -= 1
+        self._window.append(bin_index)
+        self.histogram[bin_index] += 1
+
+        self.history.append((self.frames, frame_ns, entities, *self._phase_ns.values()))
+        for phase, phase_ns in self._phase_ns.items():
+            self.total_phase_ns[phase] += phase_ns
+            self._phase_ns[phase] = 0
+        self.entities = entities
+        self.frames += 1
+
+    def percentile(self, fraction: float) -> float:
+        """Returns the frame time in milliseconds below which the given fraction of recent frames is."""
+        threshold: float = fraction*len(self._window)
+        count: int = 0
+        for bin_index, frames in enumerate(self.histogram):
+            count += frames
+            if count >= threshold and count:
+                return (bin_index + 1)*self._BIN_MS
+        return 0.0
+
+    def summary(self) -> dict:
+        """Returns the frame time percentiles and the average time of each phase in milliseconds."""
+        frames: int = max(self.frames, 1)
+        return {
+            "frames": self.frames,
+            "p50_ms": self.percentile(0.5),
+            "p99_ms": self.percentile(0.99),
+            "phases_ms": {phase: total / frames / 1e6 for phase, total in self.total_phase_ns.items()},
+            "startup_ms": self.startup_ms,
+            "histogram_bin_ms": self._BIN_MS,
+            "histogram": self.histogram,
+        }
+
+    def draw_overlay(self, screen: Surface, fps: float) -> Rect:
+        """Draws FPS, p50/p99 frame time and the number of entities in the bottom-left corner."""
+        if self._overlay_img is None or self.frames % self._OVERLAY_REFRESH_FRAMES == 0:
+            if self._font is None:
+                self._font = text_renderer.get_font(24)
+            text: str = f"FPS: {fps:.0f}  p50: {self.percentile(0.5):.2f} ms  " \
+                f"p99: {self.percentile(0.99):.2f} ms  Entities: {self.entities}"
+            self._overlay_img = self._font.render(text, True, pg.Color("#f0f0f0"), pg.Color("#000000"))
+        return screen.blit(self._overlay_img, self._overlay_img.get_rect(bottomleft=screen.get_rect().bottomleft))
+
+    def dump(self, path: str) -> None:
+        """Writes the per-frame history to `<path>.csv` and the summary to `<path>.json`."""
+        if not self.enabled:
+            return
+        # Needed only on exit, so they don't slow down the startup.
+        import csv
+        import json
+        with open(f"{path}.csv", "w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(("frame", "frame_ns", "entities", *(f"{phase}_ns" for phase in self.PHASES)))
+            writer.writerows(self.history)
+        with open(f"{path}.json", "w", encoding="utf-8") as file:
+            json.dump(self.summary(), file, indent=4)
@@ -0,0 +1,139 @@
+"""
+This module provides a TextureAtlas object, which packs the sprites' images into
+one surface, and a RenderBatch object, which collects the frame's draw list and
+submits it in a single `Surface.blits()` call. Each entry belongs to a layer, and
+layers are drawn in ascending order, so the order of submission doesn't matter.
+"""
+
+import pygame as pg
+from pygame.surface import Surface
+from pygame.rect import Rect
+
+from game_loop import interpolate
+
+
+class TextureAtlas():
+    """TextureAtlas object holds all images in one surface and knows the area of each of them."""
+
+    _MAX_WIDTH: int = 1024
+    _PADDING: int = 1  # Keeps neighbouring images apart.
+
+    def __init__(self, images: dict[str, Surface]) -> None:
+        """
+        Packs the images into shelves (rows), the tallest images first.
+
+        Parameters
+        ----------
+        images : `dict[str, Surface]`
+            The images by their paths, e.g. `assets.cached_images()`. Sprites must keep
+            drawing these very Surface objects, because areas are looked up by the object.
+        """
+        self.images: dict[str, Surface] = images
+        self._areas: dict[int, Rect] = {}
+        placement: list[tuple[Surface, Rect]] = []
+        x: int = 0
+        y: int = 0
+        shelf_height: int = 0
+        width: int = 0
+        for image in sorted(images.values(), key=lambda image: image.get_height(), reverse=True):
+            image_width, image_height = image.get_size()
+            if x and x + image_width > self._MAX_WIDTH:
+                x = 0
+                y += shelf_height + self._PADDING
+                shelf_height = 0
+            placement.append((image, Rect(x, y, image_width, image_height)))
+            x += image_width + self._PADDING
+            shelf_height = max(shelf_height, image_height)
+            width = max(width, x)
+
+        surface: Surface = Surface((max(width, 1), max(y + shelf_height, 1)), pg.SRCALPHA)
+        surface.fill((0, 0, 0, 0))
+        for image, area in placement:
+            # Adding to the transparent surface copies the pixels exactly, alpha included.
+            surface.blit(image, area, special_flags=pg.BLEND_RGBA_ADD)
+            self._areas[id(image)] = area
+        self.surface: Surface = surface.convert_alpha()
+
+    def area(self, image: Surface) -> Rect | None:
+        """Returns the image's area in the atlas or None if the image isn't packed."""
+        return self._areas.get(id(image))
+
+
+class RenderBatch():
+    """RenderBatch object collects the images to draw and blits them with a single call."""
+
+    # Layers in the drawing order.
+    STARS: int = 0
+    PLAYER_SHIP: int = 1
+    PLAYER_BULLETS: int = 2
+    ALIENS: int = 3
+    ALIEN_BULLETS: int = 4
+    _LAYERS: int = 5
+
+    def __init__(self, screen: Surface, atlas: TextureAtlas) -> None:
+        """Initialise RenderBatch object."""
+        self.screen: Surface = screen
+        self.atlas: TextureAtlas = atlas
+        self._layers: list[list[tuple]] = [[] for _ in range(self._LAYERS)]
+
+        # Statistics of the submitted images and blit calls.
+        self._frame_images: int = 0
+        self._frame_calls: int = 0
+        self.saved_blits: int = 0  # In the last frame.
+        self.total_saved_blits: int = 0
+        self.frames: int = 0
+
+    def add(self, image: Surface, position: tuple[int, int], layer: int) -> None:
+        """Adds the image drawn at the position to the given layer."""
+        area: Rect | None = self.atlas.area(image)
+        if area is None:
+            self._layers[layer].append((image, position))
+        else:
+            self._layers[layer].append((self.atlas.surface, position, area))
+
+    def add_group(self, group: pg.sprite.Group, layer: int, alpha: float = 1.0) -> None:
+        """
+        Adds the group's sprites to the given layer at positions interpolated between
+        the last two simulation steps by `alpha` (1.0 means the current positions).
+        """
+        atlas_surface: Surface = self.atlas.surface
+        area = self.atlas.area
+        entries: list[tuple] = self._layers[layer]
+        for sprite in group:
+            position: tuple[int, int] = interpolate(sprite.rect, sprite.last_shift(), alpha)  # type: ignore
+            sprite_area: Rect | None = area(sprite.image)  # type: ignore
+            if sprite_area is None:
+                entries.append((sprite.image, position))  # type: ignore
+            else:
+                entries.append((atlas_surface, position, sprite_area))
+
+    def flush(self, top_layer: int | None = None) -> list[Rect]:
+        """
+        Draws the queued images of all layers up to `top_layer` (all layers if None)
+        with one `Surface.blits()` call and returns the drawn areas.
+        """
+        last: int = self._LAYERS - 1 if top_layer is None else top_layer
+        entries: list[tuple] = []
+        for layer in range(last + 1):
+            entries += self._layers[layer]
+            self._layers[layer].clear()
+        if not entries:
+            return []
+        self._frame_images += len(entries)
+        self._frame_calls += 1
+        return self.screen.blits(entries)  # type: ignore
+
+    def end_frame(self) -> None:
+        """Finishes the frame's statistics."""
+        self.saved_blits = self._frame_images - self._frame_calls
+        self.total_saved_blits += self.saved_blits
+        self.frames += 1
+        self._frame_images = self._frame_calls = 0
+
+    def stats(self) -> dict[str, float]:
+        """Returns the number of blit calls saved in the last frame and on average per frame."""
+        return {
+            "frames": self.frames,
+            "saved_blits": self.saved_blits,
+            "saved_blits_per_frame": self.total_saved_blits / max(self.frames, 1),
+        }
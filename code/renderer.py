@@ -0,0 +1,107 @@
+"""
+This module provides a DirtyRenderer object, which redraws only the changed regions
+of the screen. The background with the menu or the scoreboard forms a static layer,
+which is painted only when it changes. In other frames, the renderer restores the areas
+covered by moving objects in the previous frame and pushes only these areas and the
+new objects' areas to the display with `pygame.display.update(rects)`.
+"""
+
+from typing import Callable, Hashable
+
+import pygame as pg
+from pygame.surface import Surface
+from pygame.rect import Rect
+
+
+class DirtyRenderer():
+    """DirtyRenderer object tracks the changed regions of the screen and updates only them."""
+
+    _SENTINEL_COLOR = pg.Color("#ff00ff")  # Never used by the interface.
+
+    def __init__(self, screen: Surface, background_color) -> None:
+        """Initialise DirtyRenderer object."""
+        self.screen: Surface = screen
+        self.screen_rect: Rect = screen.get_rect()
+        self.background_color = background_color
+        # The background with the static interface (menu, messages, scoreboard).
+        self.static_layer: Surface = screen.copy()
+        # Only the interface's pixels, the rest is transparent (colour key). It's painted over the stars.
+        self.interface_layer: Surface = screen.copy()
+        self.interface_layer.set_colorkey(self._SENTINEL_COLOR)
+        # Bounding rects of the interface's parts, to find stars which need to be covered.
+        self.interface_rects: list[Rect] = []
+        self._signature: Hashable = None
+        self._full_update: bool = True
+        self._previous_rects: list[Rect] = []
+        self._current_rects: list[Rect] = []
+
+        # Statistics of the pixels pushed to the display.
+        self.pixels_pushed: int = 0  # In the last frame.
+        self.total_pixels_pushed: int = 0
+        self.frames: int = 0
+        self.full_updates: int = 0
+
+    def begin(self, signature: Hashable, draw_static: Callable[[], None]) -> None:
+        """
+        Starts the frame. If the signature of the static interface has changed, the whole
+        static layer is painted again with `draw_static()`; otherwise, only the areas
+        covered by moving objects in the previous frame are restored.
+        """
+        if signature != self._signature:
+            self._signature = signature
+            # Texts are rendered with the background colour, so the interface is drawn on the sentinel
+            # colour first to find its areas. The colour is mapped to the screen's pixel format first,
+            # because a 16-bit display stores it less precisely.
+            self.screen.fill(self._SENTINEL_COLOR)
+            draw_static()
+            color = self.screen.unmap_rgb(self.screen.map_rgb(self._SENTINEL_COLOR))
+            interface = pg.mask.from_threshold(self.screen, color, (1, 1, 1, 255))
+            interface.invert()
+            self.interface_rects = interface.get_bounding_rects()
+
+            self.screen.fill(self.background_color)
+            draw_static()
+            self.static_layer.blit(self.screen, (0, 0))
+            self.interface_layer.blit(self.screen, (0, 0))
+            interface.to_surface(self.interface_layer, setcolor=None, unsetcolor=self._SENTINEL_COLOR)
+            self._full_update = True
+        else:
+            for rect in self._previous_rects:
+                self.screen.blit(self.static_layer, rect, rect)
+        self._current_rects = []
+
+    def add_under_interface(self, rects: list[Rect]) -> None:
+        """Marks areas drawn below the interface (stars) and paints the interface over them again."""
+        for rect in rects:
+            if rect.collidelist(self.interface_rects) != -1:
+                self.screen.blit(self.interface_layer, rect, rect)
+        self._current_rects.extend(rects)
+
+    def end(self, rects: list[Rect]) -> None:
+        """Marks areas drawn above the interface and pushes all changed areas to the display."""
+        self._current_rects.extend(rects)
+        if self._full_update:
+            pg.display.flip()
+            self.pixels_pushed = self.screen_rect.width*self.screen_rect.height
+            self.full_updates += 1
+            self._full_update = False
+        else:
+            # The previous areas have to be updated too, objects have left them.
+            dirty_rects: list[Rect] = [rect.clip(self.screen_rect) for rect in self._previous_rects + self._current_rects]
+            pg.display.update(dirty_rects)
+            self.pixels_pushed = sum(rect.width*rect.height for rect in dirty_rects)
+
+        self._previous_rects = self._current_rects
+        self.total_pixels_pushed += self.pixels_pushed
+        self.frames += 1
+
+    def stats(self) -> dict[str, float]:
+        """Returns the average number of pixels pushed per frame and its fraction of the whole screen."""
+        screen_pixels: int = self.screen_rect.width*self.screen_rect.height
+        average: float = self.total_pixels_pushed / max(self.frames, 1)
+        return {
+            "frames": self.frames,
+            "full_updates": self.full_updates,
+            "pixels_per_frame": average,
+            "screen_fraction": average / screen_pixels,
+        }
@@ -0,0 +1,97 @@
+"""
+This module provides a ReplayRecorder object, which logs the player's input with the
+simulation tick at which it was handled, and a ReplayPlayer object, which feeds the
+logged input back to a headless game. With the same seed and screen size, the game
+goes through exactly the same states, so a recorded session can be re-run at maximum
+speed, e.g. to reproduce a frame-time spike or to compare builds on the same workload.
+
+The replay file is little-endian binary: a header (magic, version, seed, screen width
+and height) followed by 13-byte records (tick, event code, two integer arguments).
+"""
+
+import struct
+from typing import BinaryIO
+
+import pygame as pg
+
+_MAGIC: bytes = b"AIRP"
+_VERSION: int = 1
+_HEADER = struct.Struct("<4sHQHH")
+_RECORD = struct.Struct("<IBii")
+
+# Event codes and the events' attributes stored in the two arguments.
+_KEYDOWN, _KEYUP, _MOUSEBUTTONDOWN, _END = 1, 2, 3, 255
+_EVENT_CODES: dict[int, int] = {pg.KEYDOWN: _KEYDOWN, pg.KEYUP: _KEYUP, pg.MOUSEBUTTONDOWN: _MOUSEBUTTONDOWN}
+
+
+class ReplayRecorder():
+    """ReplayRecorder object writes the handled input events to a replay file."""
+
+    def __init__(self, path: str, seed: int, screen_size: tuple[int, int]) -> None:
+        """
+        Initialise ReplayRecorder object and write the replay's header.
+
+        Parameters
+        ----------
+        path : `str`
+            The replay file, it's overwritten.
+        seed : `int`
+            The seed of the game's random number generator.
+        screen_size : `tuple[int, int]`
+            The game's screen size, the gameplay depends on it.
+        """
+        self._file: BinaryIO | None = open(path, "wb")
+        self._file.write(_HEADER.pack(_MAGIC, _VERSION, seed, *screen_size))
+        self.records: int = 0
+
+    def record(self, tick: int, event: pg.event.Event) -> None:
+        """Writes the event handled before the simulation step `tick`. Other than input events are skipped."""
+        code: int | None = _EVENT_CODES.get(event.type)
+        if code is None or self._file is None:
+            return
+        if code == _MOUSEBUTTONDOWN:
+            self._file.write(_RECORD.pack(tick, code, *event.pos))
+        else:
+            self._file.write(_RECORD.pack(tick, code, event.key, 0))
+        self.records += 1
+
+    def close(self, tick: int) -> None:
+        """Writes the end of the session at the given tick and closes the file."""
+        if self._file is None:
+            return
+        self._file.write(_RECORD.pack(tick, _END, 0, 0))
+        self._file.close()
+        self._file = None
+
+
+class ReplayPlayer():
+    """ReplayPlayer object posts the recorded events to the event queue at the recorded ticks."""
+
+    # Keys which would quit the replaying process, the recording simply ends there.
+    _IGNORED_KEYS: tuple[int, ...] = (pg.K_q,)
+
+    def __init__(self, path: str) -> None:
+        """Initialise ReplayPlayer object and read the whole replay file."""
+        with open(path, "rb") as file:
+            data: bytes = file.read()
+        magic, version, self.seed, width, height = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"{path} is not a replay file of version {_VERSION}.")
+        self.screen_size: tuple[int, int] = (width, height)
+
+        self.events: list[tuple[int, int, int, int]] = list(_RECORD.iter_unpack(data[_HEADER.size:]))
+        # A session interrupted without closing the recorder ends with its last event.
+        self.length: int = self.events[-1][0] + 1 if self.events else 0
+        if self.events and self.events[-1][1] == _END:
+            self.length = self.events.pop()[0]
+        self._next: int = 0
+
+    def post_events(self, ai_game, frame: int) -> None:
+        """Posts the events recorded for the game's current tick. It's meant as `run_headless()`'s callback."""
+        while self._next < len(self.events) and self.events[self._next][0] <= ai_game.ticks:
+            _, code, first, second = self.events[self._next]
+            self._next += 1
+            if code == _MOUSEBUTTONDOWN:
+                pg.event.post(pg.event.Event(pg.MOUSEBUTTONDOWN, pos=(first, second), button=1))
+            elif first not in self._IGNORED_KEYS:
+                pg.event.post(pg.event.Event(pg.KEYDOWN if code == _KEYDOWN else pg.KEYUP, key=first))
@@ -0,0 +1,151 @@
+"""
+This module provides a ScoreStore object, the persistent leaderboard. Each finished run
+(difficulty mode, score, level reached and duration) is a row of an SQLite database.
+The frame thread never touches the disk: a background writer thread opens the database
+and reads the leaderboard right after the start, so the game doesn't wait for it, and
+the runs recorded by the game are handed to it in batches, each committed in one
+transaction. An interrupted write leaves the database as it was before the batch.
+"""
+
+import queue
+import sqlite3
+import threading
+
+
+class ScoreStore():
+    """ScoreStore object keeps the top scores and the statistics of the runs of each difficulty mode."""
+
+    _SCHEMA: str = ("CREATE TABLE IF NOT EXISTS runs (id INTEGER PRIMARY KEY, difficulty INTEGER NOT NULL, "
+                    "score INTEGER NOT NULL, level INTEGER NOT NULL, duration REAL NOT NULL)")
+
+    def __init__(self, path: str, top_n: int = 10) -> None:
+        """
+        Initialise ScoreStore object and start loading the leaderboard in the background.
+
+        Parameters
+        ----------
+        path : `str`
+            The database file, it's created if it doesn't exist.
+        top_n : `int`, default=10
+            The number of best runs of each difficulty mode kept in memory.
+        """
+        self.path: str = path
+        self.top_n: int = top_n
+        # Set when the leaderboard has been read (or the database couldn't be opened).
+        self.loaded: threading.Event = threading.Event()
+        # The database error which stopped the writer, the game goes on without saving then.
+        self.error: sqlite3.Error | None = None
+        # The best runs (score, level, duration) and the statistics of each difficulty mode.
+        self._top: dict[int, list[tuple[int, int, float]]] = {}
+        self._summary: dict[int, dict[str, float]] = {}
+        self._lock: threading.Lock = threading.Lock()
+        # Runs recorded since the last commit as rows of the `runs` table.
+        self._pending: list[tuple[int, int, int, float]] = []
+        self._batches: queue.Queue = queue.Queue()
+        self._writer: threading.Thread = threading.Thread(target=self._run_writer, name="score-store", daemon=True)
+        self._writer.start()
+
+    def record_run(self, difficulty: int, score: int, level: int, duration: float) -> None:
+        """
+        Adds a finished run to the leaderboard in memory. It's written to the disk by the next
+        `commit()`.
+
+        Parameters
+        ----------
+        difficulty : `int`
+            The difficulty mode (1 easy, 2 medium, 3 hard).
+        score : `int`
+            The final score.
+        level : `int`
+            The level reached.
+        duration : `float`
+            The run's length in seconds of simulation time.
+        """
+        row: tuple[int, int, int, float] = (difficulty, score, level, duration)
+        self._pending.append(row)
+        with self._lock:
+            self._add_rows([row])
+
+    def commit(self) -> None:
+        """Hands the runs recorded since the last commit to the writer, which saves them in one transaction."""
+        if self._pending:
+            self._batches.put(self._pending)
+            self._pending = []
+
+    def close(self) -> None:
+        """Commits the recorded runs and waits until the writer has saved them and closed the database."""
+        self.commit()
+        self._batches.put(None)
+        self._writer.join()
+
+    def top_scores(self, difficulty: int) -> list[tuple[int, int, float]]:
+        """Returns the best runs of the difficulty mode as (score, level, duration), the best first."""
+        with self._lock:
+            return list(self._top.get(difficulty, []))
+
+    def best_score(self, difficulty: int) -> int:
+        """Returns the best score of the difficulty mode, 0 if there is no run yet."""
+        with self._lock:
+            top: list[tuple[int, int, float]] = self._top.get(difficulty, [])
+            return top[0][0] if top else 0
+
+    def summary(self, difficulty: int) -> dict[str, float]:
+        """Returns the number of runs, the highest level reached and the total time played in the difficulty mode."""
+        with self._lock:
+            return dict(self._summary.get(difficulty, {"runs": 0, "highest_level": 0, "played_s": 0.0}))
+
+    def _add_rows(self, rows: list[tuple[int, int, int, float]]) -> None:
+        """Merges the runs into the leaderboard in memory, the lock must be held."""
+        for difficulty, score, level, duration in rows:
+            top: list[tuple[int, int, float]] = self._top.setdefault(difficulty, [])
+            top.append((score, level, duration))
+            top.sort(key=lambda run: -run[0])
+            del top[self.top_n:]
+            summary: dict[str, float] = self._summary.setdefault(
+                difficulty, {"runs": 0, "highest_level": 0, "played_s": 0.0})
+            summary["runs"] += 1
+            summary["highest_level"] = max(summary["highest_level"], level)
+            summary["played_s"] += duration
+
+    def _load(self, connection: sqlite3.Connection) -> None:
+        """Reads the best runs and the statistics of each difficulty mode (on the writer thread)."""
+        rows: list[tuple[int, int, int, float]] = connection.execute(
+            "SELECT difficulty, score, level, duration FROM (SELECT *, ROW_NUMBER() OVER "
+            "(PARTITION BY difficulty ORDER BY score DESC) AS rank FROM runs) WHERE rank <= ?",
+            (self.top_n,)).fetchall()
+        summaries: list[tuple[int, int, int, float]] = connection.execute(
+            "SELECT difficulty, COUNT(*), MAX(level), SUM(duration) FROM runs GROUP BY difficulty").fetchall()
+        with self._lock:
+            # Runs recorded before the loading has finished are already in memory, so they're merged.
+            recorded: dict[int, dict[str, float]] = self._summary
+            self._summary = {}
+            self._add_rows(rows)
+            for difficulty, runs, highest_level, played_s in summaries:
+                summary: dict[str, float] = recorded.get(difficulty, {"runs": 0, "highest_level": 0, "played_s": 0.0})
+                self._summary[difficulty] = {"runs": runs + summary["runs"],
+                                             "highest_level": max(highest_level, summary["highest_level"]),
+                                             "played_s": played_s + summary["played_s"]}
+            for difficulty, summary in recorded.items():
+                self._summary.setdefault(difficulty, summary)
+
+    def _run_writer(self) -> None:
+        """Opens the database, loads the leaderboard and saves each batch of runs in one transaction."""
+        connection: sqlite3.Connection | None = None
+        try:
+            connection = sqlite3.connect(self.path)
+            # The write-ahead log makes each commit a single append, and a crash can't damage the saved runs.
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(self._SCHEMA)
+            connection.commit()
+            self._load(connection)
+            self.loaded.set()
+            while (batch := self._batches.get()) is not None:
+                with connection:  # Commits the batch, or rolls it back if it fails.
+                    connection.executemany(
+                        "INSERT INTO runs (difficulty, score, level, duration) VALUES (?, ?, ?, ?)", batch)
+        except sqlite3.Error as error:
+            self.error = error
+        finally:
+            self.loaded.set()
+            if connection is not None:
+                connection.close()
@@ -9,6 +9,8 @@ from pygame.surface import Surface
 from pygame.rect import Rect
 
 from spaceship import Spaceship
+from event_bus import GameEvent
+from text_renderer import text_renderer, NumberLabel
 
 
 class Scoreboard():
@@ -21,46 +23,68 @@ class Scoreboard():
         self.screen_rect: Rect = ai_game.screen_rect
         self.settings = ai_game.settings
         self.stats = ai_game.stats
-        self.text_font = pg.font.SysFont("freesansbold", 48)
+        self.text_font = text_renderer.get_font(48)
+        # Numbers are updated digit by digit from a glyph atlas instead of rendering the whole text.
+        color = self.settings.text_color
+        background = self.settings.background_color
+        self.current_score_label: NumberLabel = NumberLabel(self.text_font, "Score: ", color, background)
+        self.highest_score_label: NumberLabel = NumberLabel(self.text_font, "Best Score: ", color, background)
+        self.current_level_label: NumberLabel = NumberLabel(self.text_font, "Level: ", color, background)
 
         self.prepare_current_score()
         self.prepare_highest_score()
         self.prepare_current_level()
         self.prepare_remaining_player_ships()
 
+        # The labels are updated only when the statistics change.
+        events = ai_game.events
+        events.subscribe(GameEvent.GAME_STARTED, self.prepare_game)
+        events.subscribe(GameEvent.ALIEN_KILLED, self._on_alien_killed)
+        events.subscribe(GameEvent.LEVEL_UP, lambda level: self.prepare_current_level())
+        events.subscribe(GameEvent.SHIP_HIT, lambda remaining: self.prepare_remaining_player_ships())
+        events.subscribe(GameEvent.SCORES_LOADED, self.prepare_saved_highest_score)
+
+    def prepare_game(self) -> None:
+        """Prepares the score, level and remaining lives of a new game."""
+        self.prepare_current_score()
+        self.prepare_saved_highest_score()
+        self.prepare_current_level()
+        self.prepare_remaining_player_ships()
+
+    def _on_alien_killed(self, killed: int) -> None:
+        """Updates the current score and the best score after a kill."""
+        self.prepare_current_score()
+        self.check_the_highest_score()
+
     def prepare_current_score(self) -> None:
         """Transforms a current score into an image placed in the top-right corner."""
-        # Comma is important, it separates the score if it's higher than 1000.
-        text: str = f"Score: {self.stats.current_score:,}"
-        color = self.settings.text_color
-        background = self.settings.background_color
-
-        self.current_score_img: Surface = self.text_font.render(text, True, color, background)
+        # The label separates the score with commas if it's higher than 1000.
+        self.current_score_label.set_value(self.stats.current_score)
+        self.current_score_img: Surface = self.current_score_label.image
         self.current_score_rect: Rect = self.current_score_img.get_rect()
         self.current_score_rect.right = self.screen_rect.right - 20
         self.current_score_rect.top = 20
 
     def prepare_highest_score(self) -> None:
         """Transforms the best score into an image placed in the top-centre edge."""
-        text: str = f"Best Score: {self.stats.highest_score:,}"
-        color = self.settings.text_color
-        background = self.settings.background_color
-
-        self.highest_score_img: Surface = self.text_font.render(text, True, color, background)
+        self.highest_score_label.set_value(self.stats.highest_score)
+        self.highest_score_img: Surface = self.highest_score_label.image
         self.highest_score_rect: Rect = self.highest_score_img.get_rect()
         self.highest_score_rect.centerx = self.screen_rect.centerx
         self.highest_score_rect.top = self.current_score_rect.top
 
+    def prepare_saved_highest_score(self) -> None:
+        """Shows the best saved score of the current difficulty mode (if the leaderboard is enabled)."""
+        self.stats.load_highest_score(self.ai_game.scores)
+        self.prepare_highest_score()
+
     def prepare_current_level(self) -> None:
         """ 
         Transforms a current gameplay level into an image placed in the top-right 
         corner under the current score. 
         """
-        text: str = f"Level: {self.stats.current_level}"
-        color = self.settings.text_color
-        background = self.settings.background_color
-
-        self.current_level_img: Surface = self.text_font.render(text, True, color, background)
+        self.current_level_label.set_value(self.stats.current_level)
+        self.current_level_img: Surface = self.current_level_label.image
         self.current_level_rect: Rect = self.current_level_img.get_rect()
         self.current_level_rect.right = self.current_score_rect.right
         self.current_level_rect.top = self.current_score_rect.bottom + 10
@@ -19,6 +19,43 @@ class Settings():
 
         self.FPS: int = 144
         self._DT: int = 1000 // self.FPS
+        # The simulation always runs with FPS steps per second. Rendering is limited separately
+        # (0 means no limit) and can drop frames, the simulation catches up to the given number of steps.
+        self.render_fps_limit: int = 144
+        self.max_catch_up_steps: int = 5
+        # Moves bullets, aliens and stars in vectorized NumPy steps (if NumPy is installed).
+        self.vectorized_kinematics: bool = False
+        # Uniform-grid broadphase for collisions between groups, the cell size is in pixels.
+        # It pays off with many bullets (see benchmarks/bench_collisions.py).
+        self.spatial_hash_collisions: bool = False
+        self.spatial_hash_cell_size: int = 100
+        # Pixel-perfect collisions for each entity type: the masks cached per image are compared
+        # only if the rects overlap. The other types collide by their whole rects.
+        self.ship_mask_collisions: bool = True
+        self.alien_mask_collisions: bool = True
+        self.bullet_mask_collisions: bool = False
+        # Redraws only the changed regions of the screen instead of the whole screen in each frame.
+        self.dirty_rect_rendering: bool = False
+        # Frame-time profiler, its data is written to `<profile_output>.csv/.json` on exit (if not empty).
+        self.profiling: bool = False
+        self.profiler_overlay: bool = True
+        self.profile_output: str = "../profile"
+        # Headless mode runs the simulation without a window and audio (benchmarks, balance tests).
+        self.headless: bool = False
+        # Threads decoding the images, sounds and fonts at startup, and the progress bar shown
+        # meanwhile (never in the headless mode).
+        self.asset_loader_threads: int = 4
+        self.loading_screen: bool = True
+        # Seconds of simulation time the game stays still after the spaceship has been hit.
+        self.respawn_delay: float = 1.0
+        # The seed of the game's random number generator (None means a random seed), and the file
+        # where the player's input is recorded for a replay (empty disables recording).
+        self.seed: int | None = None
+        self.record_replay: str = ""
+        # The database of the finished runs (empty disables it, it's never used in the headless mode),
+        # and the number of best runs of each difficulty mode kept in the leaderboard.
+        self.score_store: str = "../scores.sqlite3"
+        self.leaderboard_size: int = 10
 
         self.player_ships_limit: int = 2
         self.player_ship_speed: float = 0.75*self._DT
@@ -45,14 +82,29 @@ class Settings():
         self.stars_per_row: int = 10
         self.stars_rows: int = 10
         self.star_speed: float = 0.25*self._DT
+        # Stars are pre-rendered into wrap-around layers scrolled at different speeds (parallax).
+        # The dirty-rect renderer keeps the star sprites, because scrolling layers change the whole screen.
+        self.prerendered_starfield: bool = True
+        self.starfield_layers: int = 3
 
-        # Settings related to the gameplay.
+        # Settings related to the gameplay, the difficulty mode is 1 (easy), 2 (medium) or 3 (hard).
+        self.difficulty: int = 2
         self.space_between_aliens: int = 50
         self.additional_alien_in_row: int = 1
         self.speedup_scale: float = 1.05
         self.score_scale: float = 1.05
         self.final_level: int = 15
 
+        # Settings related to the audio.
+        self.audio_enabled: bool = True
+        self.music_volume: float = 0.2
+        # The mixer's sample rate and the samples per buffer (a power of two). The buffer sets the latency
+        # between firing and hearing the shot (512 samples are ~12 ms at 44.1 kHz), too small buffers underrun.
+        self.audio_frequency: int = 44100
+        self.audio_buffer_size: int = 512
+        # The number of mixer channels reserved for each sound effect category.
+        self.sound_channels: dict[str, int] = {"weapons": 4}
+
     def reset_alien_moving_direction(self) -> None:
         """Set the alien_moving_direction to 1 (right)."""
         self.alien_moving_direction = 1
@@ -78,6 +130,7 @@ class Settings():
 
     def switch_difficulty(self, mode: int) -> None:
         """Choose game difficulty mode. The default game mode is medium."""
+        self.difficulty = mode
         if mode == 1:  # Easy
             self.player_ships_limit = 3
             self.player_allowed_bullets = 5
@@ -111,6 +164,7 @@ class Settings():
 
     def reset_difficulty(self) -> None:
         """Resets the game difficulty mode to medium."""
+        self.difficulty = 2
         self.player_ships_limit = 2
         self.player_allowed_bullets = 4
         self.player_bullet_points = 2
@@ -2,24 +2,29 @@
 This module provides a Spaceship object, which the player controls.
 """
 
-import pygame as pg
-from pygame.sprite import Sprite
 from pygame.surface import Surface
 from pygame.rect import Rect
 
+from asset_cache import assets
+from compact_sprite import CompactSprite
+from game_loop import interpolate
+from render_batch import RenderBatch
 
-class Spaceship(Sprite):
+
+class Spaceship(CompactSprite):
     """Spaceship object controlled by the player."""
 
     _RESIZED_SHIP: str = "../assets/player_ships/SF02_resized.png"  # Used as remaining lives indicator.
     _NORMAL_SHIP: str = "../assets/player_ships/SF02.png"
+    # The game's settings and screen rect are referenced by each ship, so two games in one process don't mix them.
+    __slots__ = ("settings", "screen_rect", "moving_right", "moving_left", "image", "rect", "x", "shift_x")
+    collision_type: str = "ship"  # Chooses the collision test in Settings.
 
     def __init__(self, ai_game, resized: bool = False) -> None:
         """Initialise Spaceship object."""
         super().__init__()
-        self.screen: Surface = ai_game.screen
-        self.screen_rect: Rect = ai_game.screen_rect
         self.settings = ai_game.settings
+        self.screen_rect: Rect = ai_game.screen_rect
 
         self.moving_right: bool = False
         self.moving_left: bool = False
@@ -28,27 +33,39 @@ class Spaceship(Sprite):
         if resized:
             ship_path = self._RESIZED_SHIP
 
-        self.image: Surface = pg.image.load(ship_path).convert_alpha()
+        self.image: Surface = assets.get_image(ship_path)
         self.rect: Rect = self.image.get_rect()
         self.rect.midbottom = self.screen_rect.midbottom
         self.rect.y -= 20
         # Float type for the horizontal position due to more accurate tracking.
         self.x: float = float(self.rect.x)
+        # The horizontal shift in the last simulation step, used for the interpolation.
+        self.shift_x: float = 0.0
 
     def update(self, *args, **kwargs) -> None:  # Override the Sprite.update()
         """Updates the spaceship x-position by its speed defined in settings."""
+        previous_x: float = self.x
         if self.moving_right and self.rect.right < self.screen_rect.right:
             self.x += self.settings.player_ship_speed
         if self.moving_left and self.rect.left > 0:  # Usage of elif means priority for moving right.
             self.x -= self.settings.player_ship_speed
         self.rect.x = int(self.x)
+        self.shift_x = self.x - previous_x
+
+    def last_shift(self) -> tuple[float, float]:
+        """Returns the spaceship's shift in the last simulation step."""
+        return self.shift_x, 0.0
 
     def set_center(self) -> None:
         """Places the spaceship in the centre of the screen."""
         self.rect.midbottom = self.screen_rect.midbottom
         self.rect.y -= 20
         self.x = float(self.rect.x)
+        self.shift_x = 0.0
 
-    def draw(self) -> None:
-        """Displays the spaceship in its current position on the screen."""
-        self.screen.blit(self.image, self.rect)
+    def draw(self, batch: RenderBatch, alpha: float = 1.0) -> None:
+        """
+        Adds the spaceship to the render batch. The position is interpolated between
+        the last two simulation steps by `alpha` (1.0 means the current position).
+        """
+        batch.add(self.image, interpolate(self.rect, self.last_shift(), alpha), RenderBatch.PLAYER_SHIP)
@@ -0,0 +1,87 @@
+"""
+This module provides a SpatialHash object, a uniform-grid broadphase for the collision
+detection. Sprites of one group are put into square cells by their top-left corners, so
+each sprite of the other group is tested only against sprites from the neighbouring cells
+instead of the whole group.
+"""
+
+from typing import Callable
+
+from pygame.sprite import Sprite
+from pygame.rect import Rect
+
+
+class SpatialHash():
+    """SpatialHash object indexes sprites' rects in a uniform grid."""
+
+    def __init__(self, cell_size: int) -> None:
+        """Initialise SpatialHash object with square cells of the given size in pixels."""
+        self.cell_size: int = cell_size
+        self.cells: dict[tuple[int, int], list[Sprite]] = {}
+        # The largest indexed sprite, it tells how far to the left and up the query has to look.
+        self._max_width: int = 0
+        self._max_height: int = 0
+        # The number of exact rect tests performed since the start (for benchmarks).
+        self.tests: int = 0
+
+    def rebuild(self, sprites) -> None:
+        """Clears the grid and inserts each of the given sprites into the cell of its top-left corner."""
+        self.cells.clear()
+        cells: dict[tuple[int, int], list[Sprite]] = self.cells
+        size: int = self.cell_size
+        max_width: int = 0
+        max_height: int = 0
+        for sprite in sprites:
+            rect: Rect = sprite.rect
+            key: tuple[int, int] = (rect.x // size, rect.y // size)
+            cell: list[Sprite] | None = cells.get(key)
+            if cell is None:
+                cells[key] = [sprite]
+            else:
+                cell.append(sprite)
+            max_width = max(max_width, rect.width)
+            max_height = max(max_height, rect.height)
+        self._max_width = max_width
+        self._max_height = max_height
+
+    def query(self, rect: Rect) -> list[Sprite]:
+        """
+        Returns sprites which may overlap the given rect (candidates, not exact hits). A sprite
+        overlapping the rect has its top-left corner at most the largest sprite's size to the left 
+        and up from the rect, so only these cells are visited.
+        """
+        size: int = self.cell_size
+        cells: dict[tuple[int, int], list[Sprite]] = self.cells
+        candidates: list[Sprite] = []
+        for cell_x in range((rect.left - self._max_width) // size, (rect.right - 1) // size + 1):
+            for cell_y in range((rect.top - self._max_height) // size, (rect.bottom - 1) // size + 1):
+                cell: list[Sprite] | None = cells.get((cell_x, cell_y))
+                if cell:
+                    candidates.extend(cell)
+        return candidates
+
+    def groupcollide(self, group_a, group_b, dokill_a: bool, dokill_b: bool,
+                     collide: Callable[[Sprite, Sprite], bool] | None = None) -> dict[Sprite, list[Sprite]]:
+        """
+        Works as `pygame.sprite.groupcollide()`. The grid is rebuilt from `group_b`,
+        so it should be the larger group (e.g. the aliens' fleet). The rect hits are
+        narrowed by the `collide(sprite_a, sprite_b)` test if it's given.
+        """
+        self.rebuild(group_b)
+        collisions: dict[Sprite, list[Sprite]] = {}
+        for sprite in group_a.sprites():
+            rect: Rect = sprite.rect
+            candidates: list[Sprite] = self.query(rect)
+            self.tests += len(candidates)
+            # A sprite killed by a previous hit stays in the grid, so check if it's still in the group.
+            hits: list[Sprite] = [candidate for candidate in candidates
+                                  if rect.colliderect(candidate.rect) and group_b.has_internal(candidate)
+                                  and (collide is None or collide(sprite, candidate))]  # type: ignore
+            if hits:
+                collisions[sprite] = hits
+                if dokill_b:
+                    for hit in hits:
+                        hit.kill()
+                if dokill_a:
+                    sprite.kill()
+        return collisions
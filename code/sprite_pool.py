@@ -0,0 +1,116 @@
+"""
+This module provides SpritePool, StoredGroup and PooledGroup objects. SpritePool keeps
+released sprites (bullets and stars) for reuse, so the game doesn't allocate a new Sprite
+each time one is fired or respawned. StoredGroup is a sprite group which keeps the optional
+EntityStore up to date, and PooledGroup also gives each removed sprite back to its pool.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pygame as pg
+from pygame.sprite import Sprite
+
+if TYPE_CHECKING:  # The NumPy backend is imported only if it's enabled.
+    from entity_store import EntityStore
+
+
+class SpritePool():
+    """SpritePool object provides reusable sprites of the given class."""
+
+    def __init__(self, sprite_class, capacity: int) -> None:
+        """
+        Initialise SpritePool object.
+
+        Parameters
+        ----------
+        sprite_class : `type`
+            The class of pooled sprites. It has to provide the `reset(ai_game)` method,
+            which prepares a released sprite for the next use.
+        capacity : `int`
+            The maximum number of released sprites kept in the pool.
+        """
+        self.sprite_class = sprite_class
+        self.capacity: int = capacity
+        self._free: list[Sprite] = []
+
+        # Statistics of the pool usage.
+        self.allocations: int = 0
+        self.reuses: int = 0
+        self.discarded: int = 0
+        self.in_use: int = 0
+        self.high_water_mark: int = 0
+
+    def acquire(self, ai_game) -> Sprite:
+        """Returns a released sprite prepared for use or allocates a new one if the pool is empty."""
+        if self._free:
+            sprite: Sprite = self._free.pop()
+            sprite.reset(ai_game)  # type: ignore
+            self.reuses += 1
+        else:
+            sprite = self.sprite_class(ai_game)
+            self.allocations += 1
+
+        self.in_use += 1
+        self.high_water_mark = max(self.high_water_mark, self.in_use)
+        return sprite
+
+    def release(self, sprite: Sprite) -> None:
+        """Gives the sprite back to the pool. The sprite is dropped if the pool is full."""
+        self.in_use -= 1
+        if len(self._free) < self.capacity:
+            self._free.append(sprite)
+        else:
+            self.discarded += 1
+
+    def stats(self) -> dict[str, int]:
+        """Returns the pool statistics."""
+        return {
+            "capacity": self.capacity,
+            "free": len(self._free),
+            "in_use": self.in_use,
+            "high_water_mark": self.high_water_mark,
+            "allocations": self.allocations,
+            "reuses": self.reuses,
+            "discarded": self.discarded,
+        }
+
+
+class StoredGroup(pg.sprite.Group):
+    """StoredGroup object adds and removes its sprites also in the given EntityStore."""
+
+    def __init__(self, *sprites, store: EntityStore | None = None) -> None:
+        """Initialise StoredGroup object. Without a store it behaves like a usual Group."""
+        self.store: EntityStore | None = store
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite: Sprite, layer=None) -> None:  # Override the Group.add_internal()
+        """Adds the sprite to the group and the store."""
+        super().add_internal(sprite, layer)
+        if self.store is not None:
+            self.store.add(sprite)
+
+    def remove_internal(self, sprite: Sprite) -> None:  # Override the Group.remove_internal()
+        """Removes the sprite from the store and the group."""
+        if self.store is not None:
+            self.store.remove(sprite)
+        super().remove_internal(sprite)
+
+    def copy(self) -> pg.sprite.Group:  # Override the Group.copy()
+        """Returns a plain Group with the same sprites, so the copy doesn't affect the store (or a pool)."""
+        return pg.sprite.Group(self.sprites())
+
+
+class PooledGroup(StoredGroup):
+    """PooledGroup object releases every removed sprite back to its pool."""
+
+    def __init__(self, pool: SpritePool, *sprites, store: EntityStore | None = None) -> None:
+        """Initialise PooledGroup object. The optional store keeps the sprites' kinematics in arrays."""
+        self.pool: SpritePool = pool
+        super().__init__(*sprites, store=store)
+
+    def remove_internal(self, sprite: Sprite) -> None:  # Override the Group.remove_internal()
+        """Removes the sprite from the group and releases it to the pool."""
+        super().remove_internal(sprite)
+        self.pool.release(sprite)
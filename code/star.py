@@ -2,15 +2,14 @@
 This module provides a Star object. Stars perform a function of the moving background.
 """
 
-from random import choice, randint
-
-import pygame as pg
-from pygame.sprite import Sprite
 from pygame.surface import Surface
 from pygame.rect import Rect
 
+from asset_cache import assets
+from compact_sprite import CompactSprite
+
 
-class Star(Sprite):
+class Star(CompactSprite):
     """Star object representing a individual random star in the space."""
 
     _STARS_NAMES: tuple[str, ...] = ("star1.png", "star2.png", "star3.png", "star4.png",
@@ -18,21 +17,34 @@ class Star(Sprite):
                                       "star9.png", "star10.png", "star11.png", "star12.png",
                                       "star13.png", "star14.png", "star15.png", "star16.png",
                                       "star17.png", "star18.png")
+    # The settings are referenced by each star, so two games in one process don't mix them.
+    __slots__ = ("settings", "image", "rect", "y")
 
     def __init__(self, ai_game) -> None:
         """Initialize a random star in a random position (but confined in the y direction)."""
         super().__init__()
         self.settings = ai_game.settings
+        self.image: Surface
+        self.rect: Rect = Rect(0, 0, 0, 0)
+        self.y: float
+        self.reset(ai_game)
+
+    def reset(self, ai_game) -> None:
+        """Picks a new random star image and position. It's called again when the pool reuses the star."""
         # Load the random star.
-        star_path: str = f"../assets/stars/{choice(self._STARS_NAMES)}"
-        self.image: Surface = pg.image.load(star_path).convert_alpha()
-        self.rect: Rect = self.image.get_rect()
+        star_path: str = f"../assets/stars/{ai_game.rng.choice(self._STARS_NAMES)}"
+        self.image = assets.get_image(star_path)
+        self.rect.size = self.image.get_size()
         # Initially the star is placed randomly but in the first row of the screen.
-        self.rect.x = randint(0, self.settings.screen_width)
-        self.rect.y = randint(0, self.settings.screen_height // self.settings.stars_rows)
-        self.y: float = float(self.rect.y)
+        self.rect.x = ai_game.rng.randint(0, self.settings.screen_width)
+        self.rect.y = ai_game.rng.randint(0, self.settings.screen_height // self.settings.stars_rows)
+        self.y = float(self.rect.y)
 
     def update(self, *args, **kwargs) -> None:
         """Updates the star y-position by its speed defined in settings."""
         self.y += self.settings.star_speed
         self.rect.y = int(self.y)
+
+    def last_shift(self) -> tuple[float, float]:
+        """Returns the star's shift in the last simulation step."""
+        return 0.0, self.settings.star_speed
@@ -0,0 +1,88 @@
+"""
+This module provides a Starfield object, a pre-rendered parallax background. Stars are
+painted once into a few wrap-around layers, two screens tall. Each simulation step only
+moves the layers' offsets, with the slower layers holding the smaller stars, and each
+frame blits two slices per layer. The frame time doesn't depend on the number of stars.
+"""
+
+import os
+
+import pygame as pg
+from pygame.surface import Surface
+from pygame.rect import Rect
+
+from asset_cache import assets
+
+
+class Starfield():
+    """Starfield object scrolls pre-rendered layers of stars at different speeds."""
+
+    _STARS_DIR: str = "../assets/stars"
+    _HEIGHT_IN_SCREENS: int = 2  # Makes the repetition of the pattern less visible.
+
+    def __init__(self, ai_game) -> None:
+        """Initialise Starfield object and paint its layers."""
+        self.settings = ai_game.settings
+        self.rng = ai_game.rng
+        self.screen_rect: Rect = ai_game.screen_rect
+        self.width: int = self.screen_rect.width
+        self.height: int = self.screen_rect.height*self._HEIGHT_IN_SCREENS
+
+        layers_number: int = max(self.settings.starfield_layers, 1)
+        # Layers from the farthest (slowest) to the nearest, the average speed is the stars' speed.
+        self.speed_factors: list[float] = [1.0]
+        if layers_number > 1:
+            self.speed_factors = [0.5 + layer / (layers_number - 1) for layer in range(layers_number)]
+        self.offsets: list[float] = [0.0]*layers_number
+
+        stars_number: int = self.settings.stars_per_row*self.settings.stars_rows*self._HEIGHT_IN_SCREENS
+        images: list[Surface] = self._star_images()
+        self.layers: list[Surface] = []
+        for layer in range(layers_number):
+            # The smaller stars are in the farther layers.
+            first: int = layer*len(images) // layers_number
+            last: int = max((layer + 1)*len(images) // layers_number, first + 1)
+            self.layers.append(self._paint_layer(images[first:last], stars_number // layers_number, layer == 0))
+
+    def _star_images(self) -> list[Surface]:
+        """Returns the stars' images sorted by their size."""
+        images: list[Surface] = [assets.get_image(os.path.join(self._STARS_DIR, file))
+                                 for file in sorted(os.listdir(self._STARS_DIR)) if file.endswith(".png")]
+        return sorted(images, key=lambda image: image.get_width()*image.get_height())
+
+    def _paint_layer(self, images: list[Surface], stars_number: int, opaque: bool) -> Surface:
+        """
+        Paints the stars on the background colour. The farthest layer is opaque and replaces
+        filling the screen; the other layers are transparent where the background is (colour key).
+        """
+        layer: Surface = Surface((self.width, self.height)).convert()
+        layer.fill(self.settings.background_color)
+        for _ in range(stars_number):
+            image: Surface = self.rng.choice(images)
+            x: int = self.rng.randint(0, self.width - image.get_width())
+            y: int = self.rng.randint(0, self.height - image.get_height())
+            layer.blit(image, (x, y))
+        if not opaque:
+            # Run-length encoding makes blitting the mostly empty layer cheap.
+            layer.set_colorkey(self.settings.background_color, pg.RLEACCEL)
+        return layer
+
+    def update(self) -> None:
+        """Scrolls the layers by the stars' speed scaled by each layer's factor."""
+        for layer, factor in enumerate(self.speed_factors):
+            self.offsets[layer] = (self.offsets[layer] + self.settings.star_speed*factor) % self.height
+
+    def draw(self, screen: Surface, alpha: float = 1.0) -> None:
+        """
+        Draws the layers, each as two slices joined at the wrap-around point. The offsets
+        are interpolated between the last two simulation steps by `alpha`.
+        """
+        back: float = (1.0 - alpha)*self.settings.star_speed
+        screen_height: int = self.screen_rect.height
+        for layer, factor, offset in zip(self.layers, self.speed_factors, self.offsets):
+            # The screen's row `y` shows the layer's row `(y - offset) mod height`.
+            top: int = -int(offset - back*factor) % self.height
+            first_height: int = min(screen_height, self.height - top)
+            screen.blit(layer, (0, 0), (0, top, self.width, first_height))
+            if first_height < screen_height:
+                screen.blit(layer, (0, first_height), (0, 0, self.width, screen_height - first_height))
@@ -0,0 +1,81 @@
+"""
+This module provides an ImportTimer object, which measures the import time of each module
+the way `python -X importtime` does, and the `startup_report()` function, which formats it
+together with the game's startup steps. The timer hooks `builtins.__import__`, so it must
+be installed before the game's modules (and pygame) are imported.
+"""
+
+import sys
+import builtins
+from time import perf_counter_ns
+
+
+class ImportTimer():
+    """ImportTimer object records the self and cumulative import time of each new module."""
+
+    def __init__(self) -> None:
+        """Initialise ImportTimer object, it starts measuring after `install()`."""
+        # (module, nesting depth, self time, cumulative time) in the order the imports finished, times in us.
+        self.entries: list[tuple[str, int, int, int]] = []
+        # The time spent in the nested imports of each import in progress, in ns.
+        self._nested_ns: list[int] = []
+        self._original_import = builtins.__import__
+
+    def install(self) -> None:
+        """Starts measuring the imports."""
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._import
+
+    def uninstall(self) -> None:
+        """Stops measuring the imports."""
+        builtins.__import__ = self._original_import
+
+    def total_ms(self) -> float:
+        """Returns the time of all measured top-level imports in milliseconds."""
+        return sum(cumulative for _, depth, _, cumulative in self.entries if depth == 0) / 1000
+
+    def _import(self, name: str, globals=None, locals=None, fromlist=(), level: int = 0):
+        """Imports the module with the original `__import__()` and records its time if it's new."""
+        module: str = name
+        if level:
+            # A relative import, `from . import x` gives an empty name.
+            package: str = (globals or {}).get("__package__") or ""
+            package = package.rsplit(".", level - 1)[0]
+            module = f"{package}.{name}" if name else package
+        if module in sys.modules:
+            # Already imported modules cost only a lookup.
+            return self._original_import(name, globals, locals, fromlist, level)
+        self._nested_ns.append(0)
+        start: int = perf_counter_ns()
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            elapsed: int = perf_counter_ns() - start
+            nested: int = self._nested_ns.pop()
+            if self._nested_ns:
+                self._nested_ns[-1] += elapsed
+            self.entries.append((module, len(self._nested_ns), (elapsed - nested) // 1000, elapsed // 1000))
+
+
+def startup_report(timer: ImportTimer, steps_ms: dict[str, float], limit: int = 15) -> str:
+    """
+    Returns the startup report: the slowest imports (by their cumulative time) and the
+    startup steps.
+
+    Parameters
+    ----------
+    timer : `ImportTimer`
+        The timer installed before the game's imports.
+    steps_ms : `dict[str, float]`
+        Milliseconds from the start of the game's initialisation to the end of each step,
+        e.g. `FrameProfiler.startup_ms`.
+    limit : `int`, default=15
+        The number of imports listed.
+    """
+    lines: list[str] = [f"Imports: {timer.total_ms():.1f} ms", "import time: self [us] | cumulative | imported package"]
+    for name, depth, self_us, cumulative_us in sorted(timer.entries, key=lambda entry: -entry[3])[:limit]:
+        lines.append(f"import time: {self_us:>9} | {cumulative_us:>10} | {'  '*depth}{name}")
+    lines.append("Startup steps (ms after the start of the initialisation):")
+    for step, ms in steps_ms.items():
+        lines.append(f"  {step:<14} {ms:>8.1f}")
+    return "\n".join(lines)
@@ -0,0 +1,144 @@
+"""
+This module provides a TextRenderer object, a process-wide cache of fonts and rendered
+texts, and a NumberLabel object for values which change often (score, level).
+Fonts are created once per (name, size), and multiline messages are wrapped and
+rendered once per (message, font, colours, width). A NumberLabel renders its digits
+from a glyph atlas and blits only the digits which have changed since the last value.
+The module-level `text_renderer` instance should be used instead of `pygame.font.SysFont()`.
+"""
+
+import textwrap
+
+import pygame as pg
+from pygame.surface import Surface
+from pygame.rect import Rect
+
+
+class TextRenderer():
+    """TextRenderer object caches fonts and pre-rendered messages."""
+
+    _DEFAULT_FONT: str = "freesansbold"
+
+    def __init__(self) -> None:
+        """Initialise TextRenderer object."""
+        self._fonts: dict[tuple[str, int], pg.font.Font] = {}
+        self._messages: dict[tuple, list[Surface]] = {}
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def get_font(self, size: int, name: str | None = None) -> pg.font.Font:
+        """Returns the system font with the given name (freesansbold by default) and size."""
+        key: tuple[str, int] = (name or self._DEFAULT_FONT, size)
+        font: pg.font.Font | None = self._fonts.get(key)
+        if font is None:
+            font = pg.font.SysFont(*key)
+            self._fonts[key] = font
+        return font
+
+    def render_lines(self, text: str, size: int, color, background=None,
+                     max_width: int | None = None, name: str | None = None) -> list[Surface]:
+        """
+        Returns the text wrapped to `max_width` characters (not wrapped if None) and rendered
+        line by line. The surfaces are cached and shared, so the caller must not draw on them.
+        """
+        key: tuple = (text, name or self._DEFAULT_FONT, size, tuple(color),
+                      None if background is None else tuple(background), max_width)
+        lines: list[Surface] | None = self._messages.get(key)
+        if lines is None:
+            self.misses += 1
+            font: pg.font.Font = self.get_font(size, name)
+            text_lines: list[str] = textwrap.wrap(text, max_width) if max_width else [text]
+            lines = [font.render(text_line, True, color, background) for text_line in text_lines]
+            self._messages[key] = lines
+        else:
+            self.hits += 1
+        return lines
+
+    def invalidate(self) -> None:
+        """Drops every cached font and message, e.g. after the font module has been reinitialised."""
+        self._fonts.clear()
+        self._messages.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Returns the number of cached fonts and messages, cache hits and cache misses."""
+        return {"fonts": len(self._fonts), "messages": len(self._messages),
+                "hits": self.hits, "misses": self.misses}
+
+
+class NumberLabel():
+    """
+    NumberLabel object is an image of a prefix followed by a number, e.g. "Score: 1,250".
+    Digits are taken from a glyph atlas, so updating the value blits only the changed digits.
+    """
+
+    _GLYPHS: str = "0123456789,"
+
+    def __init__(self, font: pg.font.Font, prefix: str, color, background) -> None:
+        """
+        Initialise NumberLabel object.
+
+        Parameters
+        ----------
+        font : `pygame.font.Font`
+        prefix : `str`
+            The text drawn before the number.
+        color : `pygame.Color`
+        background : `pygame.Color`
+            Glyphs are opaque, so a changed digit simply covers the previous one.
+        """
+        self.background = background
+        self.prefix_img: Surface = font.render(prefix, True, color, background)
+
+        # Every digit occupies a cell of the same width, so digits don't move when they change.
+        glyphs: list[Surface] = [font.render(glyph, True, color, background) for glyph in self._GLYPHS]
+        digit_width: int = max(glyph.get_width() for glyph in glyphs[:-1])
+        self._widths: dict[str, int] = {glyph: digit_width for glyph in self._GLYPHS[:-1]}
+        self._widths[","] = glyphs[-1].get_width()
+        self.height: int = max(self.prefix_img.get_height(), *(glyph.get_height() for glyph in glyphs))
+
+        self.atlas: Surface = Surface((digit_width*10 + self._widths[","], self.height))
+        self.atlas.fill(background)
+        self._atlas_rects: dict[str, Rect] = {}
+        x: int = 0
+        for char, glyph in zip(self._GLYPHS, glyphs):
+            self.atlas.blit(glyph, (x + (self._widths[char] - glyph.get_width()) // 2, 0))
+            self._atlas_rects[char] = Rect(x, 0, self._widths[char], self.height)
+            x += self._widths[char]
+
+        self.image: Surface = self.prefix_img
+        self._text: str | None = None
+        self._offsets: list[int] = []
+        self.glyphs_blitted: int = 0
+
+    def set_value(self, value: int) -> None:
+        """Updates the image to the given value (formatted with thousands separators)."""
+        text: str = f"{value:,}"
+        if text == self._text:
+            return
+        if self._text is None or len(text) != len(self._text):
+            self._create_image(text)
+        else:
+            # The layout is the same, only the changed digits are blitted.
+            for index, (old, new) in enumerate(zip(self._text, text)):
+                if old != new:
+                    self.image.blit(self.atlas, (self._offsets[index], 0), self._atlas_rects[new])
+                    self.glyphs_blitted += 1
+        self._text = text
+
+    def _create_image(self, text: str) -> None:
+        """Creates the image for a number of a new length with the prefix and all digits."""
+        prefix_width: int = self.prefix_img.get_width()
+        self.image = Surface((prefix_width + sum(self._widths[char] for char in text), self.height))
+        self.image.fill(self.background)
+        self.image.blit(self.prefix_img, (0, 0))
+        self._offsets = []
+        x: int = prefix_width
+        for char in text:
+            self._offsets.append(x)
+            self.image.blit(self.atlas, (x, 0), self._atlas_rects[char])
+            self.glyphs_blitted += 1
+            x += self._widths[char]
+
+
+# The process-wide instance shared by the menu, buttons, the scoreboard and the profiler.
+text_renderer: TextRenderer = TextRenderer()